@@ -10,7 +10,7 @@ def resource_path(relative_path):
 sys.path.append(resource_path("game_code"))
 
 from game_code.game import Game
-from game_code.background import WIDTH, HEIGHT
+from game_code import display_metrics
 
 def carregar_icone():
     icon_path = resource_path(os.path.join("game_assets", "icone.ico"))
@@ -61,6 +61,7 @@ def main():
         if icon:
             pygame.display.set_icon(icon)
         pygame.display.set_caption("Generic Clicker Game")
+        WIDTH, HEIGHT = display_metrics.resolve_display_size()
         screen = pygame.display.set_mode((WIDTH, HEIGHT))
         
         loading_done = False
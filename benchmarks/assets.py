@@ -0,0 +1,45 @@
+# Custo de contratar 10 trabalhadores de uma vez (purchase_quantity = 10):
+# carregar e redimensionar trabalhador.png a cada um, como antes, contra o
+# cache de assets compartilhado.
+import os, sys, time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from game_code import assets
+from game_code.trabalhador import Trabalhador
+
+ICONE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                     "game_assets", "trabalhador.png")
+
+def carregar_como_antes():
+    icone = pygame.image.load(ICONE).convert_alpha()
+    tamanho = (int(icone.get_width() * 0.05), int(icone.get_height() * 0.05))
+    return pygame.transform.smoothscale(icone, tamanho)
+
+def medir(funcao, repeticoes):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) * 1000 / repeticoes
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+
+    antes = medir(lambda: [carregar_como_antes() for _ in range(10)], repeticoes)
+    assets.clear_cache()
+    primeira = medir(lambda: [Trabalhador(screen, 1280, 720) for _ in range(10)], 1)
+    depois = medir(lambda: [Trabalhador(screen, 1280, 720) for _ in range(10)], repeticoes)
+
+    print(f"10 ícones carregados do disco (como antes): {antes:8.3f} ms")
+    print(f"10 trabalhadores, cache vazio:              {primeira:8.3f} ms")
+    print(f"10 trabalhadores, cache quente:             {depois:8.3f} ms")
+    print(f"Cache de assets: {assets.get_cache_stats()}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Tempo de quadro com ~10k popups de pontos vivos: uma lista de objetos
+# com remove() e um blit por popup (como antes) contra o ParticleSystem
+# (arrays NumPy, passo vetorizado e um Surface.blits), sem limite e com a
+# agregação por fonte e o limite de popups vivos usados no jogo.
+import os, sys, time, random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from game_code import fonts
+from game_code.click_effect import ParticleSystem, FADE_STEP, LIFETIME_ALPHA
+
+TEXTOS = ["+1", "+25", "+25 (Auto)", "+310! (Trabalhador)", "Upgrade Obtido!"]
+
+class PopupAntigo:
+    def __init__(self, x, y, text):
+        self.x = x
+        self.y = y
+        self.text = text
+        self.alpha = LIFETIME_ALPHA
+        self.finished = False
+        self.font = fonts.get_font(None, 32)
+
+    def update(self):
+        self.y -= 1
+        self.alpha -= FADE_STEP
+        if self.alpha <= 0:
+            self.finished = True
+
+    def draw(self, screen):
+        text_surface = self.font.render(self.text, True, (255, 100, 100))
+        text_surface.set_alpha(self.alpha)
+        return screen.blit(text_surface, text_surface.get_rect(center=(self.x, self.y)))
+
+def popups(por_quadro, quadros, largura, altura):
+    random.seed(21)
+    return [[(random.randrange(largura), random.randrange(altura), random.choice(TEXTOS))
+             for _ in range(por_quadro)] for _ in range(quadros)]
+
+def medir_lista(screen, roteiro):
+    efeitos = []
+    vivos = 0
+    inicio = time.perf_counter()
+    for novos in roteiro:
+        for x, y, texto in novos:
+            efeitos.append(PopupAntigo(x, y, texto))
+        for efeito in efeitos[:]:
+            efeito.update()
+            if efeito.finished:
+                efeitos.remove(efeito)
+        for efeito in efeitos:
+            efeito.draw(screen)
+        vivos = max(vivos, len(efeitos))
+    return (time.perf_counter() - inicio) * 1000 / len(roteiro), vivos
+
+def medir_particulas(screen, roteiro, agregar=False):
+    if agregar:
+        particulas = ParticleSystem()
+    else:
+        particulas = ParticleSystem(max_live=None)
+    vivos = 0
+    inicio = time.perf_counter()
+    for novos in roteiro:
+        for x, y, texto in novos:
+            if agregar and texto.startswith("+"):
+                # Cada texto do roteiro faz o papel de uma fonte de renda
+                valor = texto[1:].split(" ")[0].rstrip("!")
+                particulas.spawn_income(texto, x, y, int(valor), texto[1 + len(valor):])
+            else:
+                particulas.spawn(x, y, texto)
+        particulas.update()
+        particulas.draw(screen)
+        vivos = max(vivos, len(particulas))
+    return (time.perf_counter() - inicio) * 1000 / len(roteiro), vivos
+
+def main():
+    vivos_alvo = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    # Cada popup vive LIFETIME_ALPHA / FADE_STEP quadros; entrando esse
+    # tanto por quadro, o número de vivos se estabiliza em ~vivos_alvo
+    por_quadro = vivos_alvo * FADE_STEP // LIFETIME_ALPHA
+    roteiro = popups(por_quadro, 120, 1280, 720)
+
+    antes, vivos_antes = medir_lista(screen, roteiro)
+    depois, vivos_depois = medir_particulas(screen, roteiro)
+    agregado, vivos_agregado = medir_particulas(screen, roteiro, agregar=True)
+
+    print(f"Lista de ClickEffect (como antes): {antes:8.2f} ms/quadro ({vivos_antes} vivos)")
+    print(f"ParticleSystem:                    {depois:8.2f} ms/quadro ({vivos_depois} vivos)")
+    print(f"Agregado por fonte, com limite:    {agregado:8.2f} ms/quadro ({vivos_agregado} vivos)")
+    print(f"Ganho: {antes / depois:.1f}x")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Formatação de inteiros na escala de 10^300: o f-string com separadores
+# usado antes em StatisticsMenu/UpgradeMenu, o motor de number_format sem
+# memo (notação científica e K/M/B/T) e com o memo aquecido.
+import os, sys, time, random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_code import number_format
+
+def medir(funcao, valores, repeticoes):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        for valor in valores:
+            funcao(valor)
+    return (time.perf_counter() - inicio) * 1e6 / (repeticoes * len(valores))
+
+def sem_memo(valor):
+    number_format.clear_memo()
+    return number_format.format_number(valor)
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    random.seed(300)
+    valores = [random.randrange(10 ** 299, 10 ** 301) for _ in range(100)]
+
+    antigo = medir(lambda valor: f"{valor:,}".replace(",", "."), valores, repeticoes)
+    cientifico = medir(number_format.scientific, valores, repeticoes)
+    abreviado = medir(number_format.short, valores, repeticoes)
+    motor = medir(sem_memo, valores, repeticoes)
+    number_format.clear_memo()
+    memo = medir(number_format.format_number, valores, repeticoes)
+
+    print(f"Separadores (f-string, como antes): {antigo:8.2f} us/número")
+    print(f"Notação científica:                 {cientifico:8.2f} us/número")
+    print(f"K/M/B/T:                            {abreviado:8.2f} us/número")
+    print(f"format_number sem memo:             {motor:8.2f} us/número")
+    print(f"format_number com memo:             {memo:8.2f} us/número")
+    print(f"Exemplo: {number_format.format_number(valores[0])} "
+          f"(antes: {len(f'{valores[0]:,}')} caracteres)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# Compara a inicialização antiga (pygame.init/quit ao importar background.py,
+# depois pygame.init de novo no app.py) com a leitura preguiçosa do tamanho
+# da tela feita por display_metrics, sem contar o import do pygame. Também
+# mede o carregamento das fontes do jogo: SysFont direto (busca nas fontes
+# do sistema a cada execução) contra o registro de fontes com o cache de
+# caminhos em disco, na primeira execução e nas seguintes. Cada medição
+# roda em um processo novo.
+import os, subprocess, sys, statistics, tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ANTIGO = """
+import time
+import pygame
+t = time.perf_counter()
+pygame.init()
+info = pygame.display.Info()
+WIDTH, HEIGHT = info.current_w, info.current_h
+pygame.quit()
+pygame.init()
+pygame.mixer.init()
+print(time.perf_counter() - t)
+"""
+
+NOVO = """
+import time
+import pygame
+t = time.perf_counter()
+from game_code import display_metrics
+pygame.init()
+pygame.mixer.init()
+WIDTH, HEIGHT = display_metrics.resolve_display_size()
+print(time.perf_counter() - t)
+"""
+
+FONTES = [
+    (None, 32, False), ("None", 28, True), ("Segoe UI Emoji", 20, False), ("segoeuiemoji", 28, False),
+    ("seguiemj", 32, False), ("Segoe UI Emoji", 80, False), ("Consolas", 24, False), (None, 64, False),
+]
+
+FONTES_SYSFONT = f"""
+import time
+import pygame
+pygame.font.init()
+t = time.perf_counter()
+for nome, tamanho, negrito in {FONTES!r}:
+    pygame.font.SysFont(nome, tamanho, negrito)
+print(time.perf_counter() - t)
+"""
+
+FONTES_REGISTRO = f"""
+import time
+import pygame
+from game_code import fonts
+pygame.font.init()
+t = time.perf_counter()
+for nome, tamanho, negrito in {FONTES!r}:
+    fonts.get_font(nome, tamanho, negrito)
+fonts.finish_startup()
+print(time.perf_counter() - t)
+"""
+
+def medir(codigo, repeticoes, env_extra=None, antes=None):
+    tempos = []
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1", **(env_extra or {}))
+    for _ in range(repeticoes):
+        if antes:
+            antes()
+        saida = subprocess.run([sys.executable, "-c", codigo], cwd=ROOT, env=env,
+                               capture_output=True, text=True, check=True)
+        tempos.append(float(saida.stdout.strip().splitlines()[-1]) * 1000)
+    return statistics.median(tempos)
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    antigo = medir(ANTIGO, repeticoes)
+    novo = medir(NOVO, repeticoes)
+    print(f"Inicialização antiga (init/quit duplo): {antigo:.1f} ms")
+    print(f"Inicialização com display_metrics:      {novo:.1f} ms")
+    print(f"Economia: {antigo - novo:.1f} ms ({(1 - novo / antigo) * 100:.0f}%)")
+
+    with tempfile.TemporaryDirectory() as appdata:
+        env_fontes = {"APPDATA": appdata}
+        cache = os.path.join(appdata, "genericclickergame", "font_cache.json")
+
+        def apagar_cache():
+            if os.path.exists(cache):
+                os.remove(cache)
+
+        sysfont = medir(FONTES_SYSFONT, repeticoes, env_fontes)
+        frio = medir(FONTES_REGISTRO, repeticoes, env_fontes, apagar_cache)
+        quente = medir(FONTES_REGISTRO, repeticoes, env_fontes)
+    print(f"Fontes com SysFont direto:              {sysfont:.1f} ms")
+    print(f"Fontes pelo registro, sem cache:        {frio:.1f} ms")
+    print(f"Fontes pelo registro, cache em disco:   {quente:.1f} ms")
+
+if __name__ == "__main__":
+    main()
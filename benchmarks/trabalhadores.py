@@ -0,0 +1,52 @@
+# Tempo de quadro dos trabalhadores com cada vez mais trabalhadores,
+# separado em simulação (WorkerSwarm.update: movimento, produção, popups)
+# e desenho (ícones, barras e popups "+N"). Os popups têm limite de vivos
+# e só os primeiros MAX_DRAWN_WORKERS ícones são desenhados, então o
+# desenho para de crescer; a simulação é vetorizada.
+import os, sys, time, random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from game_code.upgrades import UpgradeMenu
+from game_code.trabalhador import Trabalhador, popup_layer
+
+def medir(screen, quantidade, quadros):
+    random.seed(23)
+    menu = UpgradeMenu(screen, 1280, 720)
+    menu.trabalhador_limit_enabled = False
+    agora = pygame.time.get_ticks()
+    for i in range(quantidade):
+        trabalhador = Trabalhador(screen, 1280, 720)
+        # Gerações espalhadas ao longo do segundo, como no jogo
+        trabalhador.last_geracao_time = agora - random.randrange(1000)
+        trabalhador.lifetime = 10 ** 9
+        menu.trabalhadores.append(trabalhador)
+    popup_layer.clear()
+
+    simulacao = desenho = 0.0
+    for quadro in range(quadros):
+        agora += 16
+        inicio = time.perf_counter()
+        menu.update_trabalhadores(agora, 0)
+        meio = time.perf_counter()
+        menu.draw_trabalhadores()
+        simulacao += meio - inicio
+        desenho += time.perf_counter() - meio
+        screen.fill((0, 0, 0))
+    return simulacao * 1000 / quadros, desenho * 1000 / quadros, len(popup_layer)
+
+def main():
+    quadros = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    for quantidade in (10, 100, 1000, 10000, 50000):
+        simulacao, desenho, vivos = medir(screen, quantidade, quadros)
+        print(f"{quantidade:6d} trabalhadores: simulação {simulacao:6.2f} ms, "
+              f"desenho {desenho:6.2f} ms por quadro ({vivos} popups vivos)")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
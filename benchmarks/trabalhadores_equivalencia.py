@@ -0,0 +1,143 @@
+# Confere que o WorkerSwarm dá o mesmo resultado do loop antigo, um objeto
+# Trabalhador por trabalhador com update() e remove() da lista: pontos e
+# trabalhadores removidos a cada quadro, popups criados e, no fim, posição,
+# velocidade e pontos gerados de cada um que sobrou. Também mede o tempo
+# de simulação dos dois.
+import os, sys, time, math, random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from game_code.trabalhador import Trabalhador, WorkerSwarm, popup_layer
+
+class TrabalhadorAntigo:
+    # Trabalhador.update de antes do WorkerSwarm; o popup só é contado
+    def __init__(self, trabalhador, width, height):
+        self.window_width = width
+        self.window_height = height
+        self.icon = trabalhador.icon
+        self.pos = list(trabalhador.pos)
+        self.speed = list(trabalhador.speed)
+        self.creation_time = trabalhador.creation_time
+        self.lifetime = trabalhador.lifetime
+        self.last_geracao_time = trabalhador.last_geracao_time
+        self.intervalo_geracao = trabalhador.intervalo_geracao
+        self.pontos_gerados = trabalhador.pontos_gerados
+        self.pontos_total = trabalhador.pontos_total
+        self.pontos_por_segundo = trabalhador.pontos_por_segundo
+        self.active = True
+        self.popups = 0
+
+    def update(self, current_time):
+        if not self.active:
+            return None
+
+        if current_time - self.creation_time >= self.lifetime:
+            self.active = False
+            pontos_restantes = self.pontos_total - self.pontos_gerados
+            if pontos_restantes > 0:
+                self.pontos_gerados = self.pontos_total
+                return pontos_restantes
+            return 0
+
+        self.pos[0] += self.speed[0]
+        self.pos[1] += self.speed[1]
+        if self.pos[0] <= 0 or self.pos[0] >= self.window_width - self.icon.get_width():
+            self.speed[0] = -self.speed[0]
+        if self.pos[1] <= 0 or self.pos[1] >= self.window_height - self.icon.get_height():
+            self.speed[1] = -self.speed[1]
+
+        pontos_gerados_now = 0
+        if current_time - self.last_geracao_time >= self.intervalo_geracao:
+            segundos_passados = (current_time - self.last_geracao_time) // 1000
+            if segundos_passados > 0:
+                pontos_a_gerar = min(self.pontos_por_segundo * segundos_passados,
+                                     self.pontos_total - self.pontos_gerados)
+                if pontos_a_gerar > 0:
+                    pontos_gerados_now = math.ceil(pontos_a_gerar)
+                    self.pontos_gerados += pontos_gerados_now
+                    self.last_geracao_time = current_time
+                    self.popups += 1
+        return pontos_gerados_now
+
+def criar(screen, quantidade, agora):
+    random.seed(25)
+    trabalhadores = []
+    for _ in range(quantidade):
+        trabalhador = Trabalhador(screen, 1280, 720)
+        trabalhador.creation_time = agora - random.randrange(5000)
+        trabalhador.last_geracao_time = agora - random.randrange(1000)
+        trabalhador.lifetime = random.randrange(5000, 40000)
+        trabalhadores.append(trabalhador)
+    return trabalhadores
+
+def rodar_antigo(trabalhadores, agora, quadros):
+    todos = [TrabalhadorAntigo(t, 1280, 720) for t in trabalhadores]
+    lista = todos[:]
+    passos = []
+    inicio = time.perf_counter()
+    for _ in range(quadros):
+        agora += 16
+        pontos = removidos = 0
+        for trabalhador in lista[:]:
+            pontos += trabalhador.update(agora) or 0
+            if not trabalhador.active:
+                lista.remove(trabalhador)
+                removidos += 1
+        passos.append((pontos, removidos))
+    tempo = (time.perf_counter() - inicio) * 1000 / quadros
+    popups = sum(t.popups for t in todos)
+    finais = [(t.pos[0], t.pos[1], t.speed[0], t.speed[1], t.pontos_gerados) for t in lista]
+    return passos, finais, popups, tempo
+
+def rodar_swarm(screen, trabalhadores, agora, quadros):
+    swarm = WorkerSwarm(screen, 1280, 720)
+    for trabalhador in trabalhadores:
+        swarm.append(trabalhador)
+    passos = []
+    inicio = time.perf_counter()
+    for _ in range(quadros):
+        agora += 16
+        passos.append(swarm.update(agora))
+    tempo = (time.perf_counter() - inicio) * 1000 / quadros
+    n = swarm.count
+    finais = list(zip(swarm.x[:n].tolist(), swarm.y[:n].tolist(), swarm.vx[:n].tolist(),
+                      swarm.vy[:n].tolist(), swarm.pontos_gerados[:n].tolist()))
+    return passos, finais, tempo
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    quadros = int(sys.argv[2]) if len(sys.argv) > 2 else 1500
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    agora = pygame.time.get_ticks()
+    trabalhadores = criar(screen, quantidade, agora)
+
+    passos_antigo, finais_antigo, popups_antigo, tempo_antigo = rodar_antigo(trabalhadores, agora, quadros)
+    # Sem limite de vivos, popup_layer.spawned conta todos os popups pedidos
+    popup_layer.clear()
+    popup_layer.max_live = None
+    spawned = popup_layer.spawned
+    passos_swarm, finais_swarm, tempo_swarm = rodar_swarm(screen, trabalhadores, agora, quadros)
+    popups_swarm = popup_layer.spawned - spawned
+
+    diferentes = [q for q, (a, b) in enumerate(zip(passos_antigo, passos_swarm)) if a != b]
+    print(f"{quantidade} trabalhadores, {quadros} quadros")
+    print(f"Pontos:      antigo {sum(p for p, _ in passos_antigo)}, "
+          f"swarm {sum(p for p, _ in passos_swarm)}")
+    print(f"Removidos:   antigo {sum(r for _, r in passos_antigo)}, "
+          f"swarm {sum(r for _, r in passos_swarm)}")
+    print(f"Popups:      antigo {popups_antigo}, swarm {popups_swarm}")
+    print(f"Quadros com pontos/removidos diferentes: {len(diferentes)}")
+    print(f"Sobraram:    antigo {len(finais_antigo)}, swarm {len(finais_swarm)}, "
+          f"estado final igual: {finais_antigo == finais_swarm}")
+    print(f"Simulação:   antigo {tempo_antigo:.2f} ms, swarm {tempo_swarm:.2f} ms por quadro")
+    pygame.quit()
+    ok = not diferentes and finais_antigo == finais_swarm and popups_antigo == popups_swarm
+    print("Resultado: igual" if ok else "Resultado: DIFERENTE")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
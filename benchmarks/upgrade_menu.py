@@ -0,0 +1,42 @@
+# Tempo de quadro com o menu de upgrades aberto, redesenhando o painel a
+# cada quadro (retained=False, como antes) e reaproveitando o painel em
+# cache (retained=True).
+import os, sys, time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from game_code.upgrades import UpgradeMenu
+
+def medir(menu, quadros):
+    menu.screen.fill((0, 0, 0))
+    menu.draw(0)
+    inicio = time.perf_counter()
+    for _ in range(quadros):
+        menu.draw(0)
+    return (time.perf_counter() - inicio) * 1000 / quadros
+
+def main():
+    quadros = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    menu = UpgradeMenu(screen, 1280, 720)
+    menu.purchased = {"auto_click": 3, "double": 12, "mega": 1}
+    menu.purchase_quantity = 10
+    menu.visible = True
+    menu.animation = 1.0
+
+    menu.retained = False
+    antes = medir(menu, quadros)
+    menu.retained = True
+    depois = medir(menu, quadros)
+
+    print(f"Menu aberto, painel refeito a cada quadro: {antes:.3f} ms/quadro")
+    print(f"Menu aberto, painel em cache:              {depois:.3f} ms/quadro")
+    print(f"Ganho: {antes / depois:.1f}x")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import os, pygame
+
+class AssetCache:
+    # Sprites carregados do disco uma vez por processo, já convertidos para
+    # o formato da tela. Quem recebe a superfície divide ela com o resto do
+    # jogo, então não deve desenhar nela (usar .copy() para isso)
+    def __init__(self):
+        self.entries = {}
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, factory):
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = factory()
+        self.entries[key] = surface
+        self.memory += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+        self.memory = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.entries),
+            "memory": self.memory,
+        }
+
+asset_cache = AssetCache()
+
+def _load(path, size, scale, smooth, alpha):
+    image = pygame.image.load(path)
+    image = image.convert_alpha() if alpha else image.convert()
+    if scale is not None:
+        size = (int(image.get_width() * scale), int(image.get_height() * scale))
+    if size is None or tuple(size) == image.get_size():
+        return image
+    transform = pygame.transform.smoothscale if smooth else pygame.transform.scale
+    return transform(image, size)
+
+def load_image(path, size=None, scale=None, smooth=True, alpha=True):
+    # Chave: (arquivo, tamanho pedido). size é (largura, altura); scale
+    # multiplica o tamanho original. Só a superfície final fica em memória,
+    # não o arquivo decodificado. Erros de leitura sobem como no
+    # pygame.image.load, para o fallback de cada tela
+    path = os.path.abspath(path)
+    size = (int(size[0]), int(size[1])) if size is not None else None
+    key = (path, size, scale, smooth, alpha)
+    return asset_cache.get(key, lambda: _load(path, size, scale, smooth, alpha))
+
+def get_surface(key, factory):
+    # Sprites gerados em código (ícones de fallback, etc.) com a mesma
+    # regra de compartilhamento dos arquivos
+    return asset_cache.get(key, factory)
+
+def get_cache_stats():
+    return asset_cache.stats()
+
+def clear_cache():
+    asset_cache.clear()
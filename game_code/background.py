@@ -1,9 +1,13 @@
-import pygame, math, time
+import pygame, math, time, numpy as np
+from game_code import display_metrics
 
-pygame.init()
-info = pygame.display.Info()
-WIDTH, HEIGHT = info.current_w, info.current_h
-pygame.quit()
+def __getattr__(name):
+    # WIDTH e HEIGHT são resolvidos só quando alguém os pede
+    if name == "WIDTH":
+        return display_metrics.get_width()
+    if name == "HEIGHT":
+        return display_metrics.get_height()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 mod = None
 
@@ -14,7 +18,8 @@ def set_mod(mod_instance):
 
 def _apply_mod_settings():
     global TILE_SIZE, BASE_COLORS, FREQ, ENABLE_ANIMATION, BACKGROUND_STYLE
-    global adjust_brightness, draw_background_override
+    global adjust_brightness, draw_background_override, MOD_FRAME_CYCLE_FRAMES
+    global _background_version
     
     if mod and hasattr(mod, 'CustomBackground'):
         custom_bg = mod.CustomBackground()
@@ -23,6 +28,7 @@ def _apply_mod_settings():
         FREQ = custom_bg.freq
         ENABLE_ANIMATION = custom_bg.enable_animation
         BACKGROUND_STYLE = custom_bg.background_style
+        MOD_FRAME_CYCLE_FRAMES = getattr(custom_bg, 'frame_cycle_frames', None)
     else:
         TILE_SIZE = 60
         BASE_COLORS = [
@@ -36,9 +42,21 @@ def _apply_mod_settings():
         FREQ = 0.5
         ENABLE_ANIMATION = True
         BACKGROUND_STYLE = 'quadriculado'
+        MOD_FRAME_CYCLE_FRAMES = None
     
     adjust_brightness = getattr(mod, 'adjust_brightness', None) if mod else None
     draw_background_override = getattr(mod, 'draw_background_override', None) if mod else None
+    clear_grid_cache()
+    clear_frame_cycle()
+    _background_version += 1
+
+_background_version = 0
+
+def get_background_version():
+    return _background_version
+
+def is_background_static():
+    return draw_background_override is None and not (ENABLE_ANIMATION and FREQ)
 
 TILE_SIZE = 60
 BASE_COLORS = [
@@ -55,24 +73,50 @@ BACKGROUND_STYLE = 'quadriculado'
 adjust_brightness = None
 draw_background_override = None
 
+def _grid_indices(grid_width, grid_height):
+    xs = np.arange(grid_width)[:, None]
+    ys = np.arange(grid_height)[None, :]
+    if BACKGROUND_STYLE == 'horizontal':
+        indices = np.broadcast_to(ys, (grid_width, grid_height))
+    elif BACKGROUND_STYLE == 'vertical':
+        indices = np.broadcast_to(xs, (grid_width, grid_height))
+    elif BACKGROUND_STYLE == 'diagonal':
+        indices = xs * ys
+    else:
+        indices = xs + ys
+    return indices % len(BASE_COLORS)
+
+_grid_cache = {}
+
+def clear_grid_cache():
+    _grid_cache.clear()
+
+def _get_grid_entry(screen_width, screen_height, tile_size):
+    key = (screen_width, screen_height, tile_size, BACKGROUND_STYLE, tuple(tuple(color) for color in BASE_COLORS))
+    entry = _grid_cache.get(key)
+    if entry is None:
+        grid_width = screen_width // tile_size + 2
+        grid_height = screen_height // tile_size + 2
+        # Tabela compacta (x, y, rgb) em uint8, no mesmo formato do surfarray
+        colors = np.array(BASE_COLORS, dtype=np.uint8)[_grid_indices(grid_width, grid_height)]
+        entry = {"colors": colors, "rows": None, "width": grid_width, "height": grid_height}
+        _grid_cache[key] = entry
+    return entry
+
+def _get_palette(entry, brightness_factor):
+    # Cores base já multiplicadas pelo brilho do slider; só muda quando o
+    # slider muda
+    palette = entry.get("palette")
+    if palette is None or palette[0] != brightness_factor:
+        palette = (brightness_factor, entry["colors"] * float(brightness_factor))
+        entry["palette"] = palette
+    return palette[1]
+
 def generate_grid_colors(screen_width, screen_height, tile_size):
-    grid_width = screen_width // tile_size + 2
-    grid_height = screen_height // tile_size + 2
-    grid = []
-    for y in range(grid_height):
-        row = []
-        for x in range(grid_width):
-            if BACKGROUND_STYLE == 'horizontal':
-                index = y % len(BASE_COLORS)
-            elif BACKGROUND_STYLE == 'vertical':
-                index = x % len(BASE_COLORS)
-            elif BACKGROUND_STYLE == 'diagonal':
-                index = (x * y) % len(BASE_COLORS)
-            else:
-                index = (x + y) % len(BASE_COLORS)
-            row.append(BASE_COLORS[index])
-        grid.append(row)
-    return grid, grid_width, grid_height
+    entry = _get_grid_entry(screen_width, screen_height, tile_size)
+    if entry["rows"] is None:
+        entry["rows"] = [[tuple(color) for color in row] for row in entry["colors"].transpose(1, 0, 2).tolist()]
+    return entry["rows"], entry["width"], entry["height"]
 
 def default_adjust_brightness(color, factor):
     r = max(0, min(255, int(color[0] * factor)))
@@ -87,25 +131,58 @@ def adjust_brightness_func(color, factor):
         return default_adjust_brightness(color, factor)
 
 game_reference = None
+background_brightness = 1.0
 
 def set_game_reference(game):
     global game_reference
     game_reference = game
 
-def draw_background(screen):
+def set_brightness(factor):
+    global background_brightness
+    background_brightness = factor
+
+def get_brightness():
+    return background_brightness
+
+_tile_surface = None
+_scaled_surface = None
+
+def _get_render_surfaces(grid_width, grid_height):
+    global _tile_surface, _scaled_surface
+    if _tile_surface is None or _tile_surface.get_size() != (grid_width, grid_height):
+        _tile_surface = pygame.Surface((grid_width, grid_height))
+    scaled_size = (grid_width * TILE_SIZE, grid_height * TILE_SIZE)
+    if _scaled_surface is None or _scaled_surface.get_size() != scaled_size:
+        _scaled_surface = pygame.Surface(scaled_size)
+    return _tile_surface, _scaled_surface
+
+def draw_background_numpy(screen, brightness_factor=1.0, t=None):
+    screen_width, screen_height = screen.get_size()
+    entry = _get_grid_entry(screen_width, screen_height, TILE_SIZE)
+    palette, grid_width, grid_height = _get_palette(entry, brightness_factor), entry["width"], entry["height"]
+
+    if ENABLE_ANIMATION:
+        if t is None:
+            t = time.time()
+        phase = np.arange(grid_width)[:, None] + np.arange(grid_height)[None, :]
+        brightness = 1 + 0.15 * np.sin(2 * math.pi * FREQ * t + phase)
+        colors = palette * brightness[:, :, None]
+    else:
+        colors = palette
+    colors = np.clip(colors, 0, 255).astype(np.uint8)
+
+    tile_surface, scaled_surface = _get_render_surfaces(grid_width, grid_height)
+    pygame.surfarray.blit_array(tile_surface, colors)
+    pygame.transform.scale(tile_surface, scaled_surface.get_size(), scaled_surface)
+    screen.blit(scaled_surface, (0, 0))
+
+def _draw_background_tiles(screen, brightness_factor, t=None):
     screen_width, screen_height = screen.get_size()
-    
     grid_colors, grid_width, grid_height = generate_grid_colors(screen_width, screen_height, TILE_SIZE)
-    
-    if draw_background_override:
-        return draw_background_override(screen, grid_colors, TILE_SIZE)
-    
-    t = time.time()
-    
-    brightness_factor = 1.0
-    if game_reference and hasattr(game_reference, 'config_menu'):
-        brightness_factor = game_reference.config_menu.settings_menu.get_brightness_settings()
-    
+
+    if t is None:
+        t = time.time()
+
     for y in range(grid_height):
         for x in range(grid_width):
             base_color = grid_colors[y][x]
@@ -118,8 +195,85 @@ def draw_background(screen):
             rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
             pygame.draw.rect(screen, color, rect)
 
+FRAME_CYCLE_ENABLED = False
+FRAME_CYCLE_FRAMES = 24
+MOD_FRAME_CYCLE_FRAMES = None
+
+_frame_cycle = {"key": None, "frames": [], "brightness": []}
+
+def set_frame_cycle(enabled, frames=None):
+    global FRAME_CYCLE_ENABLED, FRAME_CYCLE_FRAMES
+    FRAME_CYCLE_ENABLED = bool(enabled)
+    if frames is not None:
+        FRAME_CYCLE_FRAMES = max(1, int(frames))
+    if not FRAME_CYCLE_ENABLED:
+        clear_frame_cycle()
+
+def clear_frame_cycle():
+    _frame_cycle["key"] = None
+    _frame_cycle["frames"] = []
+    _frame_cycle["brightness"] = []
+
+def _render_frame(surface, brightness_factor, t):
+    if adjust_brightness:
+        _draw_background_tiles(surface, brightness_factor, t)
+    else:
+        draw_background_numpy(surface, brightness_factor, t)
+
+def prepare_frame_cycle(screen, brightness_factor=None, eager=True):
+    # O brilho de cada tile é periódico (período 1 / FREQ), então um ciclo
+    # inteiro cabe em FRAME_CYCLE_FRAMES superfícies pré-renderizadas.
+    # Quando o slider de brilho muda, os quadros são marcados como velhos e
+    # refeitos um por vez conforme aparecem, para o arraste não travar
+    if brightness_factor is None:
+        brightness_factor = background_brightness
+    frame_count = (MOD_FRAME_CYCLE_FRAMES or FRAME_CYCLE_FRAMES) if ENABLE_ANIMATION and FREQ > 0 else 1
+    layout_key = (screen.get_size(), frame_count, TILE_SIZE, FREQ, ENABLE_ANIMATION)
+    if _frame_cycle["key"] != layout_key:
+        _frame_cycle["key"] = layout_key
+        _frame_cycle["frames"] = [pygame.Surface(screen.get_size(), 0, screen) for _ in range(frame_count)]
+        _frame_cycle["brightness"] = [None] * frame_count
+
+    if eager:
+        for index in range(frame_count):
+            _get_cycle_frame(index, brightness_factor)
+    return _frame_cycle["frames"]
+
+def _get_cycle_frame(index, brightness_factor):
+    frame = _frame_cycle["frames"][index]
+    if _frame_cycle["brightness"][index] != brightness_factor:
+        frame_count = len(_frame_cycle["frames"])
+        t = index / (frame_count * FREQ) if frame_count > 1 else 0
+        _render_frame(frame, brightness_factor, t)
+        _frame_cycle["brightness"][index] = brightness_factor
+    return frame
+
+def draw_background_cycle(screen, brightness_factor=1.0):
+    frames = prepare_frame_cycle(screen, brightness_factor, eager=False)
+    if len(frames) > 1:
+        index = int(time.time() * FREQ * len(frames)) % len(frames)
+    else:
+        index = 0
+    screen.blit(_get_cycle_frame(index, brightness_factor), (0, 0))
+
+def draw_background(screen):
+    if draw_background_override:
+        screen_width, screen_height = screen.get_size()
+        grid_colors, grid_width, grid_height = generate_grid_colors(screen_width, screen_height, TILE_SIZE)
+        return draw_background_override(screen, grid_colors, TILE_SIZE)
+    
+    brightness_factor = background_brightness
+    
+    if FRAME_CYCLE_ENABLED:
+        draw_background_cycle(screen, brightness_factor)
+    # Mods com adjust_brightness próprio continuam no caminho tile a tile
+    elif adjust_brightness:
+        _draw_background_tiles(screen, brightness_factor)
+    else:
+        draw_background_numpy(screen, brightness_factor)
+
 class Background:
-    def __init__(self, tile_size=60, base_colors=None, freq=0.5, enable_animation=True, background_style='quadriculado'):
+    def __init__(self, tile_size=60, base_colors=None, freq=0.5, enable_animation=True, background_style='quadriculado', frame_cycle_frames=None):
         self.tile_size = tile_size
         self.base_colors = base_colors if base_colors else [
             (200, 230, 201),
@@ -131,4 +285,5 @@ class Background:
         ]
         self.freq = freq
         self.enable_animation = enable_animation
-        self.background_style = background_style
\ No newline at end of file
+        self.background_style = background_style
+        self.frame_cycle_frames = frame_cycle_frames
\ No newline at end of file
@@ -101,7 +101,7 @@ class AnimatedButton:
         self.update()
         frame = self.frames[self.current_frame]
         scaled = pygame.transform.smoothscale(frame, (self.rect.width, self.rect.height))
-        screen.blit(scaled, (self.rect.x, self.rect.y))
+        return screen.blit(scaled, (self.rect.x, self.rect.y))
 
     def is_clicked(self, mouse_pos):
         return self.rect.collidepoint(mouse_pos)
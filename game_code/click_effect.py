@@ -1,27 +1,283 @@
-import pygame
-
-class ClickEffect:
-    def __init__(self, x, y, text="+1", color=None):
-        self.x = x
-        self.y = y
-        self.text = text
-        self.color = color if color is not None else (255, 100, 100)
-        self.alpha = 255
-        self.dy = -1
-        self.font = pygame.font.SysFont(None, 32)
-        self.finished = False
-        self.lifetime = 60
+import pygame, numpy as np
+from game_code import fonts, glyph_atlas
+
+DEFAULT_COLOR = (255, 100, 100)
+LIFETIME_ALPHA = 255
+FADE_STEP = 5
+# Alpha do popup em cada quadro de vida (255, 250, ..., 5)
+CLICK_FADE = tuple(range(LIFETIME_ALPHA, 0, -FADE_STEP))
+ALPHA_LEVELS = 256
+# O fade é arredondado para múltiplos disso, então cada sprite tem no
+# máximo ~32 variantes de alpha em vez de uma por quadro de vida
+ALPHA_STEP = 8
+# Popups de renda da mesma fonte (auto-click, hold-click, ...) criados a
+# menos disso de quadros do último viram um só com o valor somado
+COALESCE_FRAMES = 20
+MAX_LIVE_POPUPS = 150
+# Memória das variantes de alpha. Passando disso, sprites que nenhum
+# popup vivo usa são liberados, começando pelos usados há mais tempo
+MAX_VARIANT_BYTES = 8 * 1024 * 1024
+
+class ParticleSystem:
+    # Popups de pontos ("+N", "Upgrade Obtido!", ...) guardados em arrays
+    # NumPy pré-alocados (posição, velocidade, idade, índice do sprite) em
+    # vez de um objeto por popup. Um passo vetorizado atualiza todos, as
+    # vagas dos que terminaram são reaproveitadas e o desenho é um único
+    # Surface.blits. fade é o alpha por quadro de vida; o popup some quando
+    # a idade passa do fim da tabela
+    def __init__(self, capacity=256, max_sprites=256, max_rects=64,
+                 max_live=MAX_LIVE_POPUPS, coalesce_frames=COALESCE_FRAMES,
+                 font_size=32, color=DEFAULT_COLOR, dy=-1, fade=CLICK_FADE,
+                 max_variant_bytes=MAX_VARIANT_BYTES):
+        self.font_size = font_size
+        self.color = tuple(color)
+        self.default_dy = dy
+        fade = np.array(fade, np.int32)
+        self.fade = np.minimum((fade + ALPHA_STEP // 2) // ALPHA_STEP * ALPHA_STEP, 255)
+        self.capacity = 0
+        self.max_sprites = max_sprites
+        self.max_rects = max_rects
+        self.max_variant_bytes = max_variant_bytes
+        self.variant_bytes = 0
+        # Com max_live=None não há limite de popups vivos
+        self.max_live = max_live
+        self.coalesce_frames = coalesce_frames
+        self.frame = 0
+        # fonte -> [vaga, número de série, valor, sufixo, cor, quadro]
+        self.income = {}
+        self.x = np.zeros(0, np.float32)
+        self.y = np.zeros(0, np.float32)
+        self.dy = np.zeros(0, np.float32)
+        self.age = np.zeros(0, np.int32)
+        self.sprite = np.zeros(0, np.int32)
+        self.alive = np.zeros(0, bool)
+        self.serial = np.zeros(0, np.int64)
+        self.free = []
+        self.count = 0
+        self.spawned = 0
+
+        # Sprites: um texto renderizado por (texto, cor), com metade da
+        # largura/altura para centralizar. As variantes de alpha ficam numa
+        # lista plana (sprite * ALPHA_LEVELS + alpha), criadas conforme
+        # aparecem. Cada sprite conta quantos popups vivos o usam, os bytes
+        # das suas variantes e o último quadro em que foi usado
+        self.sprite_ids = {}
+        self.sprite_keys = []
+        self.sprite_surfaces = []
+        self.sprite_half = np.zeros((0, 2), np.int32)
+        self.sprite_refs = np.zeros(0, np.int32)
+        self.sprite_bytes = np.zeros(0, np.int64)
+        self.sprite_used = np.zeros(0, np.int64)
+        self.variants = []
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, capacity):
+        old = self.capacity
+        for name in ("x", "y", "dy", "age", "sprite", "alive", "serial"):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+        self.free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def _render_sprite(self, text, color):
+        font = fonts.get_font(None, self.font_size)
+        # "+N" e variantes são montados com os glifos do atlas; os outros
+        # textos vêm do font.render
+        if text.startswith("+"):
+            return glyph_atlas.get_atlas(font, color).render(text)
+        return font.render(text, True, color)
+
+    def _release_sprite(self, index):
+        del self.sprite_ids[self.sprite_keys[index]]
+        self.sprite_keys[index] = None
+        self.sprite_surfaces[index] = None
+        start = index * ALPHA_LEVELS
+        self.variants[start:start + ALPHA_LEVELS] = [None] * ALPHA_LEVELS
+        self.variant_bytes -= int(self.sprite_bytes[index])
+        self.sprite_bytes[index] = 0
+
+    def _release_unused_sprites(self):
+        for index in np.flatnonzero(self.sprite_refs == 0).tolist():
+            if self.sprite_keys[index] is not None:
+                self._release_sprite(index)
+
+    def _trim_variants(self):
+        if self.variant_bytes <= self.max_variant_bytes:
+            return
+        unused = np.flatnonzero((self.sprite_refs == 0) & (self.sprite_bytes > 0))
+        for index in unused[np.argsort(self.sprite_used[unused], kind="stable")].tolist():
+            self._release_sprite(index)
+            if self.variant_bytes <= self.max_variant_bytes:
+                break
+
+    def _get_sprite(self, text, color):
+        key = (text, color)
+        index = self.sprite_ids.get(key)
+        if index is not None:
+            return index
+
+        if len(self.sprite_ids) >= self.max_sprites:
+            self._release_unused_sprites()
+        surface = self._render_sprite(text, color)
+        try:
+            index = self.sprite_keys.index(None)
+        except ValueError:
+            index = len(self.sprite_keys)
+            self.sprite_keys.append(None)
+            self.sprite_surfaces.append(None)
+            self.variants.extend([None] * ALPHA_LEVELS)
+            self.sprite_half = np.resize(self.sprite_half, (index + 1, 2))
+            self.sprite_refs = np.append(self.sprite_refs, 0).astype(np.int32)
+            self.sprite_bytes = np.append(self.sprite_bytes, 0)
+            self.sprite_used = np.append(self.sprite_used, 0)
+        self.sprite_ids[key] = index
+        self.sprite_keys[index] = key
+        self.sprite_surfaces[index] = surface
+        self.sprite_half[index] = (surface.get_width() // 2, surface.get_height() // 2)
+        self.sprite_used[index] = self.frame
+        return index
+
+    def _make_variant(self, code):
+        # O alpha vai multiplicado no canal alpha da cópia em vez de
+        # set_alpha: superfície com alpha por pixel e alpha de superfície
+        # cai num blit bem mais lento no SDL (diferença de arredondamento
+        # de até 2/255 por canal)
+        index, alpha = divmod(code, ALPHA_LEVELS)
+        variant = self.sprite_surfaces[index].copy()
+        variant.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        self.variants[code] = variant
+        size = variant.get_width() * variant.get_height() * variant.get_bytesize()
+        self.sprite_bytes[index] += size
+        self.variant_bytes += size
+
+    def _free_slots(self, slots):
+        self.alive[slots] = False
+        self.free.extend(slots.tolist())
+        self.count -= len(slots)
+        np.subtract.at(self.sprite_refs, self.sprite[slots], 1)
+
+    def _kill_oldest(self, amount=1):
+        slots = np.flatnonzero(self.alive)
+        if amount < len(slots):
+            slots = slots[np.argpartition(self.serial[slots], amount - 1)[:amount]]
+        self._free_slots(slots)
+
+    def spawn(self, x, y, text="+1", color=None):
+        color = tuple(color) if color is not None else self.color
+        sprite = self._get_sprite(text, color)
+        if self.max_live is not None:
+            # Passando do limite, o popup mais antigo dá lugar ao novo
+            while self.count >= max(1, self.max_live):
+                self._kill_oldest()
+        if not self.free:
+            self._grow(self.capacity * 2)
+        slot = self.free.pop()
+        self.x[slot] = x
+        self.y[slot] = y
+        self.dy[slot] = self.default_dy
+        self.age[slot] = 0
+        self.sprite[slot] = sprite
+        self.sprite_refs[sprite] += 1
+        self.alive[slot] = True
+        self.serial[slot] = self.spawned
+        self.spawned += 1
+        self.count += 1
+        return slot
+
+    def spawn_many(self, xs, ys, texts, color=None):
+        # Vários popups de uma vez (um por trabalhador que produziu no
+        # quadro). Com limite, só os últimos max_live entram e os mais
+        # antigos saem de uma vez só
+        if self.max_live is not None:
+            keep = max(1, self.max_live)
+            xs, ys, texts = xs[-keep:], ys[-keep:], texts[-keep:]
+            excess = self.count + len(texts) - keep
+            if excess > 0:
+                self._kill_oldest(excess)
+        for x, y, text in zip(xs, ys, texts):
+            self.spawn(x, y, text, color)
+
+    def spawn_income(self, source, x, y, value, suffix="", color=None):
+        # Renda da mesma fonte a menos de coalesce_frames da última soma no
+        # popup que já está na tela (mantendo posição e fade) em vez de
+        # abrir outro por cima; um fluxo contínuo alimenta o mesmo popup
+        # até ele sumir
+        entry = self.income.get(source)
+        if entry is not None:
+            slot, serial, total, _, _, frame = entry
+            if (self.frame - frame < self.coalesce_frames and self.alive[slot]
+                    and self.serial[slot] == serial):
+                total += value
+                entry[2] = total
+                entry[5] = self.frame
+                sprite = self._get_sprite(f"+{total}{suffix}", entry[4])
+                old = self.sprite[slot]
+                self.sprite_refs[old] -= 1
+                self.sprite_refs[sprite] += 1
+                self.sprite[slot] = sprite
+                # O total anterior não volta a aparecer; sem outro popup
+                # usando, o sprite e as variantes saem na hora
+                if not self.sprite_refs[old]:
+                    self._release_sprite(old)
+                return slot
+
+        color = tuple(color) if color is not None else self.color
+        slot = self.spawn(x, y, f"+{value}{suffix}", color)
+        self.income[source] = [slot, int(self.serial[slot]), value, suffix, color, self.frame]
+        return slot
 
     def update(self):
-        self.y += self.dy
-        self.alpha -= 5
-        if self.alpha <= 0:
-            self.alpha = 0
-            self.finished = True
+        self.frame += 1
+        if not self.count:
+            return
+        alive = self.alive
+        self.y[alive] += self.dy[alive]
+        self.age[alive] += 1
+        finished = alive & (self.age >= len(self.fade))
+        if finished.any():
+            self._free_slots(np.flatnonzero(finished))
+            self._trim_variants()
+
+    def clear(self):
+        self.alive[:] = False
+        self.free = list(range(self.capacity - 1, -1, -1))
+        self.count = 0
+        self.sprite_refs[:] = 0
+        self.income.clear()
+        self._trim_variants()
 
     def draw(self, screen):
-        if self.alpha > 0:
-            text_surface = self.font.render(self.text, True, self.color)
-            text_surface.set_alpha(self.alpha)
-            text_rect = text_surface.get_rect(center=(self.x, self.y))
-            screen.blit(text_surface, text_rect)
\ No newline at end of file
+        if not self.count:
+            return []
+        # Vagas são reaproveitadas fora de ordem; os mais novos continuam
+        # sendo desenhados por cima, como na lista de antes
+        slots = np.flatnonzero(self.alive)
+        slots = slots[np.argsort(self.serial[slots], kind="stable")]
+        sprites = self.sprite[slots]
+        self.sprite_used[sprites] = self.frame
+        half = self.sprite_half[sprites]
+        # Centro arredondado como o pygame.Rect faz com coordenadas float
+        xs = (np.floor(self.x[slots] + 0.5).astype(np.int32) - half[:, 0]).tolist()
+        ys = (np.floor(self.y[slots] + 0.5).astype(np.int32) - half[:, 1]).tolist()
+
+        # Cada par (sprite, nível de alpha) é uma superfície própria, então
+        # um blits só desenha popups com alphas diferentes
+        codes = sprites * ALPHA_LEVELS + self.fade[self.age[slots]]
+        variants = self.variants
+        for code in np.unique(codes).tolist():
+            if variants[code] is None:
+                self._make_variant(code)
+        surfaces = [variants[code] for code in codes.tolist()]
+        self._trim_variants()
+
+        rects = screen.blits(list(zip(surfaces, zip(xs, ys))))
+        if len(rects) > self.max_rects:
+            # Com muitos popups a tela inteira vai para o flip de qualquer
+            # jeito; um retângulo só basta para o compositor
+            rects = [rects[0].unionall(rects[1:])]
+        return rects
@@ -0,0 +1,72 @@
+import pygame
+from game_code import background
+
+class Compositor:
+    def __init__(self, screen, max_rects=64):
+        self.screen = screen
+        self.max_rects = max_rects
+        self.static_background = None
+        self.static_key = None
+        self.previous_rects = []
+        self.current_rects = []
+        self.full_frame = True
+        self.previous_full = True
+        # Só vale a pena anotar as áreas desenhadas quando o próximo quadro
+        # pode ser parcial; com o fundo animado ou menu aberto elas são
+        # descartadas
+        self.tracking = False
+
+    def add(self, rect):
+        if not rect or not self.tracking:
+            return
+        rect = pygame.Rect(rect).clip(self.screen.get_rect())
+        if rect.width > 0 and rect.height > 0:
+            self.current_rects.append(rect)
+
+    def add_all(self, rects):
+        if not self.tracking:
+            return
+        for rect in rects or ():
+            self.add(rect)
+
+    def _get_static_background(self):
+        key = (self.screen.get_size(), background.get_brightness(), background.get_background_version())
+        if self.static_key != key:
+            self.static_background = pygame.Surface(self.screen.get_size(), 0, self.screen)
+            background.draw_background(self.static_background)
+            self.static_key = key
+            self.previous_full = True
+        return self.static_background
+
+    def begin_frame(self, force_full=False):
+        self.current_rects = []
+
+        # Com o fundo animado todos os pixels mudam a cada quadro, então não
+        # há o que economizar: desenha tudo e faz flip
+        if force_full or not background.is_background_static():
+            background.draw_background(self.screen)
+            self.full_frame = True
+            self.previous_full = True
+            self.tracking = False
+            return True
+
+        static_background = self._get_static_background()
+        if self.previous_full:
+            self.screen.blit(static_background, (0, 0))
+            self.full_frame = True
+        else:
+            # Tudo o que difere do fundo na tela foi desenhado no quadro anterior
+            self.screen.blits([(static_background, rect, rect) for rect in self.previous_rects], False)
+            self.full_frame = False
+        self.previous_full = False
+        self.tracking = True
+        return self.full_frame
+
+    def present(self):
+        rects = self.previous_rects + self.current_rects
+        if self.full_frame or len(rects) > self.max_rects:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+        self.previous_rects = self.current_rects
+        self.current_rects = []
@@ -1,4 +1,6 @@
 import pygame, json, os, sys
+from game_code.scroll_canvas import ScrollCanvas
+from game_code import assets, fonts
 
 def resource_path(relative_path):
     try:
@@ -40,7 +42,9 @@ class FullSettingsMenu:
             "Mostrar sequência": True,  # Alterado de "Mostrar tempo de jogo" para "Mostrar sequência" e padrão True
             "Volume Conquistas": 100,
             "Volume Mini Evento": 100,
-            "Brilho do fundo": 100
+            "Brilho do fundo": 100,
+            "Fundo pré-renderizado": False,
+            "Quadros do fundo": 24
         }
 
         self.visible = False
@@ -50,13 +54,19 @@ class FullSettingsMenu:
         self.valor_original_update = self.options.get("Verificar atualizações", True)
         self.precisa_reiniciar = False
 
-        self.title_font = pygame.font.SysFont(None, 42)
-        self.font = pygame.font.SysFont(None, 32)
-        self.emoji_font = pygame.font.SysFont("segoeuiemoji", 28)
+        self.title_font = fonts.get_font(None, 42)
+        self.page_title_font = fonts.get_font(None, 48)
+        self.font = fonts.get_font(None, 32)
+        self.emoji_font = fonts.get_font("segoeuiemoji", 28)
+        self.search_surf = pygame.transform.scale(self.emoji_font.render("🔍", True, (255, 255, 255)), (24, 24))
+        self.restart_text = fonts.get_font(None, 28).render(
+            "Reinicie o jogo para aplicar as mudanças de atualização", True, (200, 0, 0))
         
         self.hovered_option = None
         self.button_rects = []
         self.slider_rects = []
+        self.hover_rects = []
+        self.canvas = ScrollCanvas(self.bg_color)
         
         self.console_ativo = False
         
@@ -66,10 +76,9 @@ class FullSettingsMenu:
             close_image_path = resource_path("game_assets/close.png")
             if not os.path.exists(close_image_path):
                 close_image_path = os.path.join("..", "game_assets", "close.png")
-            self.close_image = pygame.image.load(close_image_path).convert_alpha()
             # Tamanho reduzido para 40x40 pixels
             target_size = (40, 40)
-            self.close_image = pygame.transform.smoothscale(self.close_image, target_size)
+            self.close_image = assets.load_image(close_image_path, target_size)
         except Exception:
             self.close_image = None
             
@@ -81,6 +90,8 @@ class FullSettingsMenu:
         # Referência ao menu de estatísticas
         self.statistics_menu = None
 
+        self.on_brightness_change = None
+
     def is_click_allowed(self, button):
         if button == 1:
             return self.options.get("Clique Esquerdo", True)
@@ -135,22 +146,22 @@ class FullSettingsMenu:
                 del self.options["Manter console aberto"]
                 self.save_config()
 
-    def draw_section_title(self, title, x, y):
+    def draw_section_title(self, surface, title, x, y):
         box_width = self.width - 2 * x
         box_height = self.option_height
         box_rect = pygame.Rect(x, y, box_width, box_height)
 
         azul_claro = (200, 190, 255, 230)
-        pygame.draw.rect(self.screen, azul_claro, box_rect, border_radius=self.option_radius)
-        pygame.draw.rect(self.screen, (150, 150, 150), box_rect, width=2, border_radius=self.option_radius)
+        pygame.draw.rect(surface, azul_claro, box_rect, border_radius=self.option_radius)
+        pygame.draw.rect(surface, (150, 150, 150), box_rect, width=2, border_radius=self.option_radius)
 
-        title_surf = self.title_font.render(title, True, self.text_color)
+        title_surf = fonts.render(self.title_font, title, True, self.text_color)
         title_rect = title_surf.get_rect(center=box_rect.center)
-        self.screen.blit(title_surf, title_rect)
+        surface.blit(title_surf, title_rect)
 
         return y + box_height + self.spacing_y
 
-    def draw_slider_option(self, key, x, y, width):
+    def draw_slider_option(self, surface, key, x, y, width):
         mouse_pos = pygame.mouse.get_pos()
         
         container_height = self.option_height
@@ -158,15 +169,15 @@ class FullSettingsMenu:
         
         shadow_surface = pygame.Surface((width + 6, container_height + 6), pygame.SRCALPHA)
         pygame.draw.rect(shadow_surface, (0, 0, 0, 20), (0, 0, width + 6, container_height + 6), border_radius=15)
-        self.screen.blit(shadow_surface, (x - 3, y - 3))
+        surface.blit(shadow_surface, (x - 3, y - 3))
         
         color = (220, 235, 255) if container_rect.collidepoint(mouse_pos) else (255, 255, 255)
-        pygame.draw.rect(self.screen, color, container_rect, border_radius=self.option_radius)
-        pygame.draw.rect(self.screen, (150, 150, 150), container_rect, width=2, border_radius=self.option_radius)
+        pygame.draw.rect(surface, color, container_rect, border_radius=self.option_radius)
+        pygame.draw.rect(surface, (150, 150, 150), container_rect, width=2, border_radius=self.option_radius)
         
-        text_surf = self.font.render(key, True, self.text_color)
+        text_surf = fonts.render(self.font, key, True, self.text_color)
         text_rect = text_surf.get_rect(midleft=(x + 20, y + container_height // 2))
-        self.screen.blit(text_surf, text_rect)
+        surface.blit(text_surf, text_rect)
         
         slider_width = 200
         slider_height = 20
@@ -174,8 +185,8 @@ class FullSettingsMenu:
         slider_y = y + (container_height - slider_height) // 2
         
         track_rect = pygame.Rect(slider_x, slider_y, slider_width, slider_height)
-        pygame.draw.rect(self.screen, (200, 200, 200), track_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (100, 100, 100), track_rect, width=1, border_radius=10)
+        pygame.draw.rect(surface, (200, 200, 200), track_rect, border_radius=10)
+        pygame.draw.rect(surface, (100, 100, 100), track_rect, width=1, border_radius=10)
         
         current_value = self.options.get(key, 100)
         
@@ -188,8 +199,8 @@ class FullSettingsMenu:
         handle_rect = pygame.Rect(slider_pos - 6, slider_y - 3, 12, slider_height + 6)
         
         handle_color = (100, 150, 255) if (handle_rect.collidepoint(mouse_pos) or self.dragging_slider == key) else (70, 130, 230)
-        pygame.draw.rect(self.screen, handle_color, handle_rect, border_radius=6)
-        pygame.draw.rect(self.screen, (50, 100, 180), handle_rect, width=1, border_radius=6)
+        pygame.draw.rect(surface, handle_color, handle_rect, border_radius=6)
+        pygame.draw.rect(surface, (50, 100, 180), handle_rect, width=1, border_radius=6)
         
         if key == "Brilho do fundo":
             display_value = max(35, current_value)
@@ -200,15 +211,16 @@ class FullSettingsMenu:
         else:
             value_text = f"{current_value}%"
             
-        value_surf = self.font.render(value_text, True, self.text_color)
+        value_surf = fonts.render(self.font, value_text, True, self.text_color)
         value_rect = value_surf.get_rect(midright=(slider_x - 10, y + container_height // 2))
-        self.screen.blit(value_surf, value_rect)
+        surface.blit(value_surf, value_rect)
         
         self.slider_rects.append((track_rect, handle_rect, key))
+        self.hover_rects.extend((container_rect, handle_rect))
         
         return container_rect.bottom + self.spacing_y
 
-    def draw_options(self, keys, x, y):
+    def draw_options(self, surface, keys, x, y):
         mouse_pos = pygame.mouse.get_pos()
         button_width = (self.width - 2 * x - (self.options_per_row - 1) * self.spacing_x) // self.options_per_row
 
@@ -222,24 +234,25 @@ class FullSettingsMenu:
 
             option_rect = pygame.Rect(option_x, option_y, button_width, self.option_height)
             self.button_rects.append((option_rect, key))
+            self.hover_rects.append(option_rect)
 
             shadow_surface = pygame.Surface((button_width + 6, self.option_height + 6), pygame.SRCALPHA)
             pygame.draw.rect(shadow_surface, (0, 0, 0, 20), (0, 0, button_width + 6, self.option_height + 6), border_radius=15)
-            self.screen.blit(shadow_surface, (option_x - 3, option_y - 3))
+            surface.blit(shadow_surface, (option_x - 3, option_y - 3))
 
             color = (220, 235, 255) if option_rect.collidepoint(mouse_pos) else (255, 255, 255)
 
-            pygame.draw.rect(self.screen, color, option_rect, border_radius=self.option_radius)
-            pygame.draw.rect(self.screen, (150, 150, 150), option_rect, width=2, border_radius=self.option_radius)
+            pygame.draw.rect(surface, color, option_rect, border_radius=self.option_radius)
+            pygame.draw.rect(surface, (150, 150, 150), option_rect, width=2, border_radius=self.option_radius)
 
-            text_surf = self.font.render(key, True, self.text_color)
+            text_surf = fonts.render(self.font, key, True, self.text_color)
             text_rect = text_surf.get_rect(midleft=(option_x + 20, option_rect.centery))
-            self.screen.blit(text_surf, text_rect)
+            surface.blit(text_surf, text_rect)
 
             val_text = "Ativado" if val else "Desativado"
-            val_surf = self.font.render(val_text, True, self.text_color)
+            val_surf = fonts.render(self.font, val_text, True, self.text_color)
             val_rect = val_surf.get_rect(midright=(option_x + button_width - 20, option_rect.centery))
-            self.screen.blit(val_surf, val_rect)
+            surface.blit(val_surf, val_rect)
 
         total_rows = (len(keys) + self.options_per_row - 1) // self.options_per_row
         return y + total_rows * (self.option_height + self.spacing_y)
@@ -259,83 +272,92 @@ class FullSettingsMenu:
             pygame.draw.line(self.screen, (255, 255, 255), (center_x - line_length, center_y + line_length),
                             (center_x + line_length, center_y - line_length), 2)
 
-    def draw(self):
-        if not self.visible:
-            return
+    def get_outros_keys(self):
+        outros_keys = [
+            "Ativar Mods",
+            "Verificar atualizações",
+            "Mostrar descrição de conquistas bloqueadas",
+            "Menu vertical",
+            "Fundo pré-renderizado",
+            "Mostrar sequência"  # Alterado de "Mostrar tempo de jogo" para "Mostrar sequência"
+        ]
 
+        if self.console_ativo and "Manter console aberto" in self.options:
+            if "Manter console aberto" in outros_keys:
+                outros_keys.remove("Manter console aberto")
+            outros_keys.append("Manter console aberto")
+        return outros_keys
+
+    def draw_content(self, surface):
         self.button_rects = []
         self.slider_rects = []
-
-        self.screen.fill(self.bg_color)
+        self.hover_rects = []
 
         x = self.padding_x
-        y = self.padding_y
-
-        title_font = pygame.font.SysFont(None, 48)
-        title_surf = title_font.render("Configurações", True, self.text_color)
-        title_rect = title_surf.get_rect(center=(self.width // 2, 35))
-        self.screen.blit(title_surf, title_rect)
-
-        # Desenhar botão de fechar igual ao do primeiro código
-        self.draw_close_button()
-
-        pygame.draw.rect(self.screen, (120, 180, 255), self.search_button_rect, border_radius=20)
-        pygame.draw.rect(self.screen, (60, 120, 180), self.search_button_rect, 2, border_radius=20)
-        
-        search_surf = self.emoji_font.render("🔍", True, (255, 255, 255))
-        search_surf = pygame.transform.scale(search_surf, (24, 24))
-        search_rect = search_surf.get_rect(center=self.search_button_rect.center)
-        self.screen.blit(search_surf, search_rect)
-
         y = 90
 
-        y = self.draw_section_title("Controles", x, y)
+        y = self.draw_section_title(surface, "Controles", x, y)
         controles_keys = [
             "Clique Esquerdo",
             "Clique Direito",
             "Clique Botão do Meio",
             "Rolagem do Mouse"
         ]
-        y = self.draw_options(controles_keys, x, y)
+        y = self.draw_options(surface, controles_keys, x, y)
 
         y += 40
 
-        y = self.draw_section_title("Som", x, y)
+        y = self.draw_section_title(surface, "Som", x, y)
         slider_width = self.width - 2 * x
         
-        y = self.draw_slider_option("Volume Conquistas", x, y, slider_width)
+        y = self.draw_slider_option(surface, "Volume Conquistas", x, y, slider_width)
         
-        y = self.draw_slider_option("Volume Mini Evento", x, y, slider_width)
+        y = self.draw_slider_option(surface, "Volume Mini Evento", x, y, slider_width)
 
         y += 40
 
-        y = self.draw_section_title("Outros", x, y)
+        y = self.draw_section_title(surface, "Outros", x, y)
         slider_width = self.width - 2 * x
         
-        y = self.draw_slider_option("Brilho do fundo", x, y, slider_width)
+        y = self.draw_slider_option(surface, "Brilho do fundo", x, y, slider_width)
         
         y += 20
-        
-        outros_keys = [
-            "Ativar Mods",
-            "Verificar atualizações",
-            "Mostrar descrição de conquistas bloqueadas",
-            "Menu vertical",
-            "Mostrar sequência"  # Alterado de "Mostrar tempo de jogo" para "Mostrar sequência"
-        ]
 
-        if self.console_ativo and "Manter console aberto" in self.options:
-            if "Manter console aberto" in outros_keys:
-                outros_keys.remove("Manter console aberto")
-            outros_keys.append("Manter console aberto")
+        self.draw_options(surface, self.get_outros_keys(), x, y)
+
+    def get_canvas_key(self):
+        # Tudo o que muda o desenho das opções: valores, slider arrastado e
+        # qual retângulo está sob o mouse
+        mouse_pos = pygame.mouse.get_pos()
+        hover = tuple(rect.collidepoint(mouse_pos) for rect in self.hover_rects)
+        return (tuple(self.options.items()), self.dragging_slider, self.console_ativo, hover)
+
+    def draw(self):
+        if not self.visible:
+            return
 
-        self.draw_options(outros_keys, x, y)
+        self.screen.fill(self.bg_color)
+
+        title_surf = fonts.render(self.page_title_font, "Configurações", True, self.text_color)
+        title_rect = title_surf.get_rect(center=(self.width // 2, 35))
+        self.screen.blit(title_surf, title_rect)
+
+        # Desenhar botão de fechar igual ao do primeiro código
+        self.draw_close_button()
+
+        pygame.draw.rect(self.screen, (120, 180, 255), self.search_button_rect, border_radius=20)
+        pygame.draw.rect(self.screen, (60, 120, 180), self.search_button_rect, 2, border_radius=20)
+        self.screen.blit(self.search_surf, self.search_surf.get_rect(center=self.search_button_rect.center))
+
+        # Os retângulos de hover mudam junto com o layout, então a chave é
+        # recalculada depois de redesenhar
+        if self.canvas.update(self.screen, (self.width, self.height), self.get_canvas_key(), self.draw_content):
+            self.canvas.key = self.get_canvas_key()
+        self.canvas.blit(self.screen)
 
         if self.precisa_reiniciar:
-            restart_font = pygame.font.SysFont(None, 28)
-            restart_text = restart_font.render("Reinicie o jogo para aplicar as mudanças de atualização", True, (200, 0, 0))
-            restart_rect = restart_text.get_rect(center=(self.width // 2, self.height - 40))
-            self.screen.blit(restart_text, restart_rect)
+            restart_rect = self.restart_text.get_rect(center=(self.width // 2, self.height - 40))
+            self.screen.blit(self.restart_text, restart_rect)
 
     def handle_event(self, event):
         if not self.visible:
@@ -368,10 +390,7 @@ class FullSettingsMenu:
                     relative_x = mouse_pos[0] - track_rect.left
                     percentage = max(0, min(100, int((relative_x / track_rect.width) * 100)))
                     
-                    if key == "Brilho do fundo":
-                        percentage = max(35, percentage)
-                    
-                    self.options[key] = percentage
+                    self.set_slider_value(key, percentage)
                     self.save_config()
                     return True
 
@@ -391,6 +410,8 @@ class FullSettingsMenu:
 
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1:
+                if self.dragging_slider:
+                    self.save_config()
                 self.dragging_slider = None
                 self.dragging_start_x = None
 
@@ -401,15 +422,23 @@ class FullSettingsMenu:
                     relative_x = mouse_pos[0] - track_rect.left
                     percentage = max(0, min(100, int((relative_x / track_rect.width) * 100)))
                     
-                    if key == "Brilho do fundo":
-                        percentage = max(35, percentage)
-                    
-                    self.options[key] = percentage
-                    self.save_config()
+                    # Salva só ao soltar o botão, para o arraste continuar fluido
+                    self.set_slider_value(key, percentage)
                     return True
 
         return False
 
+    def set_slider_value(self, key, percentage):
+        if key == "Brilho do fundo":
+            percentage = max(35, percentage)
+
+        if self.options.get(key) == percentage:
+            return
+        self.options[key] = percentage
+
+        if key == "Brilho do fundo" and self.on_brightness_change:
+            self.on_brightness_change(self.get_brightness_settings())
+
     def show(self):
         self.visible = True
         self.valor_original_update = self.options.get("Verificar atualizações", True)
@@ -438,6 +467,12 @@ class FullSettingsMenu:
             "minievent_volume": self.options.get("Volume Mini Evento", 100) / 100.0
         }
 
+    def get_background_cycle_settings(self):
+        return {
+            "enabled": self.options.get("Fundo pré-renderizado", False),
+            "frames": max(1, int(self.options.get("Quadros do fundo", 24)))
+        }
+
     def get_brightness_settings(self):
         brightness = self.options.get("Brilho do fundo", 100)
         return max(35, brightness) / 100.0
\ No newline at end of file
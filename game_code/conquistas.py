@@ -1,5 +1,7 @@
 import pygame, time, os, sys, pytz
 from datetime import datetime
+from game_code import glass
+from game_code import assets, fonts
 
 def resource_path(relative_path):
     try:
@@ -43,9 +45,9 @@ class AchievementTracker:
         self.unlocked = set()
         self.achievement_queue = []
         self.current_achievement = None
-        self.font = pygame.font.SysFont("None", 100, bold=True)
-        self.desc_font = pygame.font.SysFont("None", 100)
-        self.icon_font = pygame.font.SysFont("Segoe UI Emoji", 30)
+        self.font = fonts.get_font("None", 100, bold=True)
+        self.desc_font = fonts.get_font("None", 100)
+        self.icon_font = fonts.get_font("Segoe UI Emoji", 30)
         self.sound = None
         self.achievement_sound = None
         self.animation_speed = 0.08
@@ -328,43 +330,13 @@ class AchievementTracker:
                     self.current_achievement = None
                     self._start_next_achievement()
 
-    def _draw_rounded_rect_aa(self, surface, color, rect, radius):
-        temp_surface = pygame.Surface((rect[2] + 4, rect[3] + 4), pygame.SRCALPHA)
-        temp_surface.fill((0, 0, 0, 0))
-        
-        temp_rect = pygame.Rect(2, 2, rect[2], rect[3])
-        pygame.draw.rect(temp_surface, color, temp_rect, border_radius=radius)
-        
-        surface.blit(temp_surface, (rect[0] - 2, rect[1] - 2))
-
-    def _create_glass_popup(self, width, height, alpha):
-        glass_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        glass_surface.fill((0, 0, 0, 0))
-        
-        bg_color = (230, 178, 186, int(alpha * 0.7))
-        self._draw_rounded_rect_aa(glass_surface, bg_color, (0, 0, width, height), 20)
-        
-        highlight = pygame.Surface((width, height), pygame.SRCALPHA)
-        highlight.fill((0, 0, 0, 0))
-        for i in range(height):
-            line_alpha = int((50 * (1 - i / height * 0.6)) * (alpha / 255))
-            pygame.draw.line(highlight, (255, 255, 255, line_alpha), (0, i), (width, i))
-        
-        mask = pygame.Surface((width, height), pygame.SRCALPHA)
-        mask.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(mask, (255, 255, 255, 255), (0, 0, width, height), 20)
-        
-        highlight.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        glass_surface.blit(highlight, (0, 0))
-        
-        border_color = (190, 100, 110, int(alpha * 0.63))
-        border_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        border_surface.fill((0, 0, 0, 0))
-        pygame.draw.rect(border_surface, border_color, (0, 0, width, height), 
-                        width=2, border_radius=20)
-        glass_surface.blit(border_surface, (0, 0))
-        
-        return glass_surface
+    def _create_glass_popup(self, width, height):
+        # Um painel opaco por tamanho; o fade da animação é aplicado com
+        # set_alpha na cópia, senão cada quadro do fade viraria uma entrada
+        # nova no cache de vidro
+        bg_color = (230, 178, 186, int(255 * 0.7))
+        border_color = (190, 100, 110, int(255 * 0.63))
+        return glass.get_glass_surface(width, height, bg_color, border_color, 20, 2, 50, 0.6)
 
     def draw_popup(self):
         self._update_animation()
@@ -376,8 +348,8 @@ class AchievementTracker:
         alpha = int(eased_progress * 255)
 
         popup_text = f"Conquista desbloqueada: {ach.name}"
-        font = pygame.font.SysFont("None", 28, bold=True)
-        text_surface = font.render(popup_text, True, (47, 24, 63))
+        font = fonts.get_font("None", 28, bold=True)
+        text_surface = fonts.render(font, popup_text, True, (47, 24, 63))
         text_width = text_surface.get_width()
         text_height = text_surface.get_height()
 
@@ -392,11 +364,12 @@ class AchievementTracker:
         shadow_surface = pygame.Surface((w + shadow_offset, h + shadow_offset), pygame.SRCALPHA)
         pygame.draw.rect(shadow_surface, (150, 120, 130, alpha // 2),
                          (shadow_offset, shadow_offset, w, h), border_radius=20)
-        self.screen.blit(shadow_surface, (x - 3, y - 3))
+        shadow_rect = self.screen.blit(shadow_surface, (x - 3, y - 3))
 
-        popup_surface = self._create_glass_popup(w, h, alpha)
+        popup_surface = self._create_glass_popup(w, h).copy()
         popup_surface.blit(text_surface, ((w - text_width) // 2, (h - text_height) // 2))
-        self.screen.blit(popup_surface, (x, y))
+        popup_surface.set_alpha(alpha)
+        return shadow_rect.union(self.screen.blit(popup_surface, (x, y)))
 
 class AchievementsMenu:
     def __init__(self, screen, width, height, config_menu=None):
@@ -417,14 +390,14 @@ class AchievementsMenu:
         self.locked_color = (160, 160, 160)
         self.shadow_color = (0, 0, 0, 25)
         
-        self.title_font = pygame.font.SysFont(None, 48)
-        self.item_font = pygame.font.SysFont("None", 32, bold=True)
-        self.desc_font = pygame.font.SysFont("None", 26)
-        self.date_font = pygame.font.SysFont("None", 20)
-        self.icon_font = pygame.font.SysFont("Segoe UI Emoji", 80)
-        self.filter_font = pygame.font.SysFont("None", 18, bold=True)
-        self.instruction_font = pygame.font.SysFont("None", 22)
-        self.small_font = pygame.font.SysFont("None", 18)
+        self.title_font = fonts.get_font(None, 48)
+        self.item_font = fonts.get_font("None", 32, bold=True)
+        self.desc_font = fonts.get_font("None", 26)
+        self.date_font = fonts.get_font("None", 20)
+        self.icon_font = fonts.get_font("Segoe UI Emoji", 80)
+        self.filter_font = fonts.get_font("None", 18, bold=True)
+        self.instruction_font = fonts.get_font("None", 22)
+        self.small_font = fonts.get_font("None", 18)
         self.radius = 25
 
         self.current_filter = "all"
@@ -437,10 +410,9 @@ class AchievementsMenu:
             close_image_path = resource_path("game_assets/close.png")
             if not os.path.exists(close_image_path):
                 close_image_path = os.path.join("..", "game_assets", "close.png")
-            self.close_image = pygame.image.load(close_image_path).convert_alpha()
             # Tamanho reduzido para 40x40 pixels
             target_size = (40, 40)
-            self.close_image = pygame.transform.smoothscale(self.close_image, target_size)
+            self.close_image = assets.load_image(close_image_path, target_size)
         except Exception:
             self.close_image = None
 
@@ -448,6 +420,9 @@ class AchievementsMenu:
         self.achievements_per_page = 10
         self.page_button_size = 40
 
+        self.card_cache = {}
+        self.wrap_cache = {}
+
     def _init_filter_buttons(self):
         button_width = 140
         button_height = 45
@@ -470,7 +445,7 @@ class AchievementsMenu:
         self.screen.fill(self.bg_color)
 
         title_text = "Conquistas"
-        title_surf = self.title_font.render(title_text, True, self.text_color)
+        title_surf = fonts.render(self.title_font, title_text, True, self.text_color)
         title_rect = title_surf.get_rect(center=(self.width // 2, 35))
         self.screen.blit(title_surf, title_rect)
 
@@ -521,11 +496,24 @@ class AchievementsMenu:
             text_color = (255, 255, 255) if button["active"] else (52, 152, 219)
             pygame.draw.rect(self.screen, bg_color, button["rect"], border_radius=22)
             pygame.draw.rect(self.screen, (52, 152, 219), button["rect"], 2, border_radius=22)
-            text_surf = self.filter_font.render(button["text"], True, text_color)
+            text_surf = fonts.render(self.filter_font, button["text"], True, text_color)
             self.screen.blit(text_surf, (button["rect"].centerx - text_surf.get_width() // 2,
                                          button["rect"].centery - text_surf.get_height() // 2))
 
     def _draw_achievement_card(self, ach, x, y, width, height, show_hidden):
+        # O card pronto (com sombra e o fundo do menu em volta) fica em
+        # cache por conquista e só é refeito quando o estado dela muda
+        key = (ach.unlocked, ach.unlock_date, show_hidden and not ach.unlocked, width, height)
+        cached = self.card_cache.get(ach.id)
+        if cached is None or cached[0] != key:
+            card_surface = pygame.Surface((width + 12, height + 12), 0, self.screen)
+            card_surface.fill(self.bg_color)
+            self._render_achievement_card(card_surface, ach, 3, 3, width, height, show_hidden)
+            cached = (key, card_surface)
+            self.card_cache[ach.id] = cached
+        self.screen.blit(cached[1], (x - 3, y - 3))
+
+    def _render_achievement_card(self, surface, ach, x, y, width, height, show_hidden):
         if ach.unlocked:
             border_color = self.unlocked_color
             bg_color = (255, 255, 255)
@@ -545,43 +533,49 @@ class AchievementsMenu:
 
         shadow_surface = pygame.Surface((width + 12, height + 12), pygame.SRCALPHA)
         pygame.draw.rect(shadow_surface, (0, 0, 0, 35), (6, 6, width, height), border_radius=self.radius)
-        self.screen.blit(shadow_surface, (x - 3, y - 3))
+        surface.blit(shadow_surface, (x - 3, y - 3))
 
         card_rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(self.screen, bg_color, card_rect, border_radius=self.radius)
-        pygame.draw.rect(self.screen, border_color, card_rect, 3, border_radius=self.radius)
+        pygame.draw.rect(surface, bg_color, card_rect, border_radius=self.radius)
+        pygame.draw.rect(surface, border_color, card_rect, 3, border_radius=self.radius)
 
-        icon_surf = self.icon_font.render(icon, True, border_color)
-        self.screen.blit(icon_surf, (x + (width - icon_surf.get_width()) // 2, y + 10))
+        icon_surf = fonts.render(self.icon_font, icon, True, border_color)
+        surface.blit(icon_surf, (x + (width - icon_surf.get_width()) // 2, y + 10))
 
-        self._draw_multiline_text(ach.name, self.item_font, text_color, x, y + 100, width)
-        self._draw_multiline_text(desc_text, self.desc_font, desc_color, x, y + 160, width)
+        self._draw_multiline_text(surface, ach.name, self.item_font, text_color, x, y + 100, width)
+        self._draw_multiline_text(surface, desc_text, self.desc_font, desc_color, x, y + 160, width)
         
         if ach.unlocked and ach.unlock_date:
-            date_surf = self.date_font.render(ach.unlock_date, True, date_color)
+            date_surf = fonts.render(self.date_font, ach.unlock_date, True, date_color)
             date_x = x + (width - date_surf.get_width()) // 2
             date_y = y + height - 30
-            self.screen.blit(date_surf, (date_x, date_y))
-
-    def _draw_multiline_text(self, text, font, color, x, y, max_width):
-        words = text.split()
-        lines = []
-        current_line = ""
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if font.size(test_line)[0] <= max_width - 20:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
-
-        for i, line in enumerate(lines):
-            line_surf = font.render(line, True, color)
+            surface.blit(date_surf, (date_x, date_y))
+
+    def _wrap_text(self, text, font, max_width):
+        key = (text, font, max_width)
+        lines = self.wrap_cache.get(key)
+        if lines is None:
+            words = text.split()
+            lines = []
+            current_line = ""
+            for word in words:
+                test_line = current_line + (" " if current_line else "") + word
+                if font.size(test_line)[0] <= max_width - 20:
+                    current_line = test_line
+                else:
+                    if current_line:
+                        lines.append(current_line)
+                    current_line = word
+            if current_line:
+                lines.append(current_line)
+            self.wrap_cache[key] = lines
+        return lines
+
+    def _draw_multiline_text(self, surface, text, font, color, x, y, max_width):
+        for i, line in enumerate(self._wrap_text(text, font, max_width)):
+            line_surf = fonts.render(font, line, True, color)
             line_x = x + (max_width - line_surf.get_width()) // 2
-            self.screen.blit(line_surf, (line_x, y + i * (font.get_height() + 2)))
+            surface.blit(line_surf, (line_x, y + i * (font.get_height() + 2)))
 
     def _draw_minimalist_navigation(self, total_pages):
         nav_y = self.height - 80
@@ -590,7 +584,7 @@ class AchievementsMenu:
         self.next_button_rect = pygame.Rect(self.width // 2 + 10, nav_y, self.page_button_size, self.page_button_size)
         
         page_text = f"{self.current_page + 1}/{total_pages}"
-        page_surf = self.small_font.render(page_text, True, (100, 100, 100))
+        page_surf = fonts.render(self.small_font, page_text, True, (100, 100, 100))
         page_rect = page_surf.get_rect(center=(self.width // 2, nav_y + self.page_button_size // 2))
         self.screen.blit(page_surf, page_rect)
 
@@ -1,11 +1,12 @@
 import pygame
+from game_code import fonts
 
 class Console:
     def __init__(self, screen, width, height, on_exit_callback=None, on_open_callback=None, tracker=None, config_menu=None, upgrade_manager=None, game=None):
         self.screen = screen
         self.width = width
         self.height = height
-        self.font = pygame.font.SysFont("Consolas", 24)
+        self.font = fonts.get_font("Consolas", 24)
         self.visible = False
         self.input_text = ""
         self.max_lines = 20
@@ -254,8 +255,8 @@ class Console:
         pygame.draw.rect(self.screen, (100, 100, 200), console_rect, 2, border_radius=10)
 
         for i, line in enumerate(self.lines):
-            text = self.font.render(line, True, (200, 200, 255))
+            text = fonts.render(self.font, line, True, (200, 200, 255))
             self.screen.blit(text, (console_rect.x + 10, console_rect.y + 10 + i * 25))
 
-        input_surface = self.font.render("> " + self.input_text, True, (200, 255, 200))
+        input_surface = fonts.render(self.font, "> " + self.input_text, True, (200, 255, 200))
         self.screen.blit(input_surface, (console_rect.x + 10, console_rect.y + 10 + len(self.lines) * 25))
\ No newline at end of file
@@ -1,10 +1,12 @@
 import pygame
+from game_code import glass
+from game_code import fonts
 
 class ControlsMenu:
     def __init__(self, screen, window_width, window_height, settings_menu):
         self.screen = screen
         self.settings_menu = settings_menu
-        self.font = pygame.font.SysFont(None, 22)
+        self.font = fonts.get_font(None, 22)
         self.bg_color = (180, 210, 255, 180)
         self.option_color = (255, 255, 255, 220)
         self.option_border = (150, 180, 230, 160)
@@ -27,8 +29,11 @@ class ControlsMenu:
         ]
 
         self.visible = False
+        self.animation = 0.0
+        self.speed = 0.15
         self.controls_list = []
         self.last_config_state = None
+        self.panel = None
 
         self.key_box_width = 220
         self.colon_space = 6
@@ -43,6 +48,7 @@ class ControlsMenu:
 
         self.last_config_state = current_config
         self.controls_list = []
+        self.panel = None
 
         for key, desc, config_key in self.all_controls:
             if config_key is None:
@@ -88,73 +94,12 @@ class ControlsMenu:
         self.y = self.window_height - self.height - self.margin_y
         self.box_rect = pygame.Rect(self.x, self.y, self.width, self.height)
 
-    def _draw_rounded_rect_aa(self, surface, color, rect, radius):
-        temp_surface = pygame.Surface((rect[2] + 4, rect[3] + 4), pygame.SRCALPHA)
-        temp_surface.fill((0, 0, 0, 0))
-        
-        temp_rect = pygame.Rect(2, 2, rect[2], rect[3])
-        pygame.draw.rect(temp_surface, color, temp_rect, border_radius=radius)
-        
-        surface.blit(temp_surface, (rect[0] - 2, rect[1] - 2))
-
-    def _create_glass_effect(self, width, height):
-        glass_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        glass_surface.fill((0, 0, 0, 0))
-        
-        self._draw_rounded_rect_aa(glass_surface, self.bg_color, (0, 0, width, height), 20)
-        
-        highlight = pygame.Surface((width, height), pygame.SRCALPHA)
-        highlight.fill((0, 0, 0, 0))
-        for i in range(height):
-            alpha = int(50 * (1 - i / height * 0.6))
-            pygame.draw.line(highlight, (255, 255, 255, alpha), (0, i), (width, i))
-        
-        mask = pygame.Surface((width, height), pygame.SRCALPHA)
-        mask.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(mask, (255, 255, 255, 255), (0, 0, width, height), 20)
-        
-        highlight.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        glass_surface.blit(highlight, (0, 0))
-        
-        border_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        border_surface.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(border_surface, (0, 0, 0, 0), (0, 0, width, height), 20)
-        pygame.draw.rect(border_surface, self.option_border, (0, 0, width, height), 
-                        width=2, border_radius=20)
-        glass_surface.blit(border_surface, (0, 0))
-        
-        return glass_surface
-
-    def _create_glass_option(self, width, height, color):
-        option_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        option_surface.fill((0, 0, 0, 0))
-        
-        self._draw_rounded_rect_aa(option_surface, color, (0, 0, width, height), 14)
-        
-        highlight = pygame.Surface((width, height), pygame.SRCALPHA)
-        highlight.fill((0, 0, 0, 0))
-        for i in range(height):
-            alpha = int(40 * (1 - i / height * 0.7))
-            pygame.draw.line(highlight, (255, 255, 255, alpha), (0, i), (width, i))
-        
-        mask = pygame.Surface((width, height), pygame.SRCALPHA)
-        mask.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(mask, (255, 255, 255, 255), (0, 0, width, height), 14)
-        
-        highlight.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        option_surface.blit(highlight, (0, 0))
-        
-        border_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        border_surface.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(border_surface, (0, 0, 0, 0), (0, 0, width, height), 14)
-        pygame.draw.rect(border_surface, self.option_border, (0, 0, width, height), 
-                        width=1, border_radius=14)
-        option_surface.blit(border_surface, (0, 0))
-        
-        return option_surface
+    def is_animating(self):
+        return self.visible or self.animation > 0
 
     def draw(self):
-        if not self.visible:
+        self.animation = min(1.0, self.animation + self.speed) if self.visible else max(0.0, self.animation - self.speed)
+        if self.animation <= 0:
             return
 
         self.update_controls_list()
@@ -162,31 +107,38 @@ class ControlsMenu:
         if not self.controls_list:
             return
 
-        panel = self._create_glass_effect(self.width, self.height)
+        if self.panel is None:
+            self.panel = self._render_panel()
+
+        # A caixa fica presa ao canto de baixo, então abre de baixo para cima
+        glass.blit_reveal(self.screen, self.panel, (self.x, self.y), self.animation, from_bottom=True)
+
+    def _render_panel(self):
+        panel = glass.get_glass_panel(self.width, self.height, self.bg_color, self.option_border).copy()
 
         for i, (key, desc) in enumerate(self.controls_list):
             oy = self.padding_y + i * (self.option_height + self.spacing)
             
             key_width = self.key_box_width
-            option_surface = self._create_glass_option(key_width, self.option_height, self.option_color)
+            option_surface = glass.get_glass_option(key_width, self.option_height, self.option_color, self.option_border)
             panel.blit(option_surface, (self.padding_x, oy))
 
-            key_text = self.font.render(key, True, self.text_color)
+            key_text = fonts.render(self.font, key, True, self.text_color)
             key_text_rect = key_text.get_rect(center=(self.padding_x + key_width // 2, oy + self.option_height // 2))
             panel.blit(key_text, key_text_rect)
 
-            colon_text = self.font.render(":", True, self.text_color)
+            colon_text = fonts.render(self.font, ":", True, self.text_color)
             colon_x = self.padding_x + key_width + self.colon_space + colon_text.get_width() // 2
             colon_y = oy + self.option_height // 2
             colon_rect = colon_text.get_rect(center=(colon_x, colon_y))
             panel.blit(colon_text, colon_rect)
 
-            desc_text = self.font.render(desc, True, self.text_color)
+            desc_text = fonts.render(self.font, desc, True, self.text_color)
             desc_x = colon_rect.right + self.text_space
             desc_text_rect = desc_text.get_rect(midleft=(desc_x, oy + self.option_height // 2))
             panel.blit(desc_text, desc_text_rect)
 
-        self.screen.blit(panel, (self.x, self.y))
+        return panel
 
     def handle_event(self, event):
         if not self.visible:
@@ -0,0 +1,26 @@
+import pygame
+
+_display_size = None
+
+def set_display_size(width, height):
+    global _display_size
+    _display_size = (int(width), int(height))
+
+def resolve_display_size():
+    # Lê o tamanho do monitor uma única vez; só inicializa o subsistema de
+    # vídeo (sem pygame.init/quit, que reiniciariam o mixer)
+    if _display_size is None:
+        if not pygame.display.get_init():
+            pygame.display.init()
+        info = pygame.display.Info()
+        set_display_size(info.current_w, info.current_h)
+    return _display_size
+
+def get_display_size():
+    return resolve_display_size()
+
+def get_width():
+    return resolve_display_size()[0]
+
+def get_height():
+    return resolve_display_size()[1]
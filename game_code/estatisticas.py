@@ -1,5 +1,11 @@
 import pygame, pytz, sys, os
 from datetime import datetime
+from game_code.scroll_canvas import ScrollCanvas
+from game_code import assets, fonts, number_format
+
+# Valores que mudam a cada segundo (tempo de jogo, pontuação com renda
+# automática): ficam fora da chave do canvas e são desenhados por cima dele
+LIVE_STATS = ("Pontuação Atual", "Pontuação Máxima", "Pontuação Total", "Tempo de Jogo")
 
 def resource_path(relative_path):
     try:
@@ -27,9 +33,10 @@ class StatisticsMenu:
 
         self.visible = False
 
-        self.title_font = pygame.font.SysFont(None, 42)
-        self.font = pygame.font.SysFont(None, 32)
-        self.emoji_font = pygame.font.SysFont("segoeuiemoji", 28)
+        self.title_font = fonts.get_font(None, 42)
+        self.page_title_font = fonts.get_font(None, 48)
+        self.font = fonts.get_font(None, 32)
+        self.emoji_font = fonts.get_font("segoeuiemoji", 28)
         
         self.hovered_option = None
         self.button_rects = []
@@ -40,10 +47,9 @@ class StatisticsMenu:
             close_image_path = resource_path("game_assets/close.png")
             if not os.path.exists(close_image_path):
                 close_image_path = os.path.join("..", "game_assets", "close.png")
-            self.close_image = pygame.image.load(close_image_path).convert_alpha()
             # Tamanho reduzido para 40x40 pixels
             target_size = (40, 40)
-            self.close_image = pygame.transform.smoothscale(self.close_image, target_size)
+            self.close_image = assets.load_image(close_image_path, target_size)
         except Exception:
             self.close_image = None
 
@@ -54,6 +60,8 @@ class StatisticsMenu:
         self.scrollbar_rect = None
         self.is_scrolling = False
         self.scroll_drag_start = 0
+        self.canvas = ScrollCanvas(self.bg_color)
+        self.live_positions = {}
 
         self.first_join_date = self.get_first_join_date()
 
@@ -80,7 +88,7 @@ class StatisticsMenu:
         try:
             if isinstance(number, str):
                 number = float(number.replace('.', '').replace(',', ''))
-            return f"{int(number):,}".replace(",", ".")
+            return number_format.format_number(number, max_length=30)
         except (ValueError, TypeError):
             return "0"
 
@@ -169,54 +177,54 @@ class StatisticsMenu:
             "Maior Sequência": "0 dias"
         }
 
-    def draw_section_title(self, title, x, y):
+    def draw_section_title(self, surface, title, x, y):
         box_width = self.width - 2 * x - self.scrollbar_width - 10
         box_height = self.option_height
-        box_rect = pygame.Rect(x, y - self.scroll_y, box_width, box_height)
-
-        if box_rect.bottom < 0 or box_rect.top > self.height:
-            return y + box_height + self.spacing_y
+        box_rect = pygame.Rect(x, y, box_width, box_height)
 
         azul_claro = (200, 190, 255, 230)
-        pygame.draw.rect(self.screen, azul_claro, box_rect, border_radius=self.option_radius)
-        pygame.draw.rect(self.screen, (150, 150, 150), box_rect, width=2, border_radius=self.option_radius)
+        pygame.draw.rect(surface, azul_claro, box_rect, border_radius=self.option_radius)
+        pygame.draw.rect(surface, (150, 150, 150), box_rect, width=2, border_radius=self.option_radius)
 
-        title_surf = self.title_font.render(title, True, self.text_color)
+        title_surf = fonts.render(self.title_font, title, True, self.text_color)
         title_rect = title_surf.get_rect(center=box_rect.center)
-        self.screen.blit(title_surf, title_rect)
+        surface.blit(title_surf, title_rect)
 
         return y + box_height + self.spacing_y
 
-    def draw_stat_option(self, key, value, x, y, width):
+    def draw_stat_option(self, surface, key, value, x, y, width):
         container_height = self.option_height
-        container_rect = pygame.Rect(x, y - self.scroll_y, width, container_height)
-        
-        if container_rect.bottom < 0 or container_rect.top > self.height:
-            return y + container_height + self.spacing_y
+        container_rect = pygame.Rect(x, y, width, container_height)
 
         shadow_surface = pygame.Surface((width + 6, container_height + 6), pygame.SRCALPHA)
         pygame.draw.rect(shadow_surface, (0, 0, 0, 20), (0, 0, width + 6, container_height + 6), border_radius=15)
-        self.screen.blit(shadow_surface, (x - 3, y - self.scroll_y - 3))
+        surface.blit(shadow_surface, (x - 3, y - 3))
         
         color = (220, 235, 255)
-        pygame.draw.rect(self.screen, color, container_rect, border_radius=self.option_radius)
-        pygame.draw.rect(self.screen, (150, 150, 150), container_rect, width=2, border_radius=self.option_radius)
-        
-        text_surf = self.font.render(key, True, self.text_color)
-        text_rect = text_surf.get_rect(midleft=(x + 20, y - self.scroll_y + container_height // 2))
-        self.screen.blit(text_surf, text_rect)
+        pygame.draw.rect(surface, color, container_rect, border_radius=self.option_radius)
+        pygame.draw.rect(surface, (150, 150, 150), container_rect, width=2, border_radius=self.option_radius)
         
+        text_surf = fonts.render(self.font, key, True, self.text_color)
+        text_rect = text_surf.get_rect(midleft=(x + 20, y + container_height // 2))
+        surface.blit(text_surf, text_rect)
+
+        value_pos = (x + width - 20, y + container_height // 2)
+        if key in LIVE_STATS:
+            self.live_positions[key] = value_pos
+        else:
+            self.draw_stat_value(surface, key, value, value_pos)
+
+        return y + container_height + self.spacing_y
+
+    def draw_stat_value(self, surface, key, value, pos):
         # Formata o valor corretamente
         if isinstance(value, (int, float)) and key not in ["Conquistas Desbloqueadas", "Tempo de Jogo", "Primeira Entrada", "Sequência Atual", "Maior Sequência"]:
             display_value = self.format_number(value)
         else:
             display_value = str(value)
-            
-        value_surf = self.font.render(display_value, True, self.text_color)
-        value_rect = value_surf.get_rect(midright=(x + width - 20, y - self.scroll_y + container_height // 2))
-        self.screen.blit(value_surf, value_rect)
-        
-        return y + container_height + self.spacing_y
+
+        value_surf = fonts.render(self.font, display_value, True, self.text_color)
+        surface.blit(value_surf, value_surf.get_rect(midright=pos))
 
     def draw_scrollbar(self):
         if self.max_scroll <= 0:
@@ -239,8 +247,6 @@ class StatisticsMenu:
         pygame.draw.rect(self.screen, (70, 70, 70), self.scrollbar_rect, 1, border_radius=6)
 
     def calculate_content_height(self):
-        stats_data = self.get_statistics_data()
-        
         total_height = 90
         
         total_height += self.option_height + self.spacing_y
@@ -274,6 +280,36 @@ class StatisticsMenu:
             pygame.draw.line(self.screen, (255, 255, 255), (center_x - line_length, center_y + line_length),
                             (center_x + line_length, center_y - line_length), 2)
 
+    def draw_content(self, surface, stats_data):
+        x = self.padding_x
+        y = 90
+
+        slider_width = self.width - 2 * x - self.scrollbar_width - 10
+
+        y = self.draw_section_title(surface, "Pontuação", x, y)
+        y = self.draw_stat_option(surface, "Pontuação Atual", stats_data.get("Pontuação Atual", "0"), x, y, slider_width)
+        y = self.draw_stat_option(surface, "Pontuação Máxima", stats_data.get("Pontuação Máxima", "0"), x, y, slider_width)
+        y = self.draw_stat_option(surface, "Pontuação Total", stats_data.get("Pontuação Total", "0"), x, y, slider_width)
+
+        y += 40
+
+        y = self.draw_section_title(surface, "Progresso Geral", x, y)
+        y = self.draw_stat_option(surface, "Cliques Totais", stats_data.get("Cliques Totais", "0"), x, y, slider_width)
+        y = self.draw_stat_option(surface, "Conquistas Desbloqueadas", stats_data.get("Conquistas Desbloqueadas", "0/0"), x, y, slider_width)
+        y = self.draw_stat_option(surface, "Tempo de Jogo", stats_data.get("Tempo de Jogo", "00:00:00"), x, y, slider_width)
+        y = self.draw_stat_option(surface, "Upgrades Comprados", stats_data.get("Upgrades Comprados", "0"), x, y, slider_width)
+        y = self.draw_stat_option(surface, "Eventos Participados", stats_data.get("Eventos Participados", "0"), x, y, slider_width)
+        y = self.draw_stat_option(surface, "Primeira Entrada", stats_data.get("Primeira Entrada", "Não disponível"), x, y, slider_width)
+        y = self.draw_stat_option(surface, "Sequência Atual", stats_data.get("Sequência Atual", "0 dias"), x, y, slider_width)
+        y = self.draw_stat_option(surface, "Maior Sequência", stats_data.get("Maior Sequência", "0 dias"), x, y, slider_width)
+
+        y += 40
+
+        # CORRIGIDO: Agora mostra 2 estatísticas apenas
+        y = self.draw_section_title(surface, "Mini Eventos", x, y)
+        y = self.draw_stat_option(surface, "Mini Eventos Sessão", stats_data.get("Mini Eventos Sessão", "0"), x, y, slider_width)
+        y = self.draw_stat_option(surface, "Mini Eventos Totais", stats_data.get("Mini Eventos Totais", "0"), x, y, slider_width)
+
     def draw(self):
         if not self.visible:
             return
@@ -282,47 +318,24 @@ class StatisticsMenu:
 
         self.screen.fill(self.bg_color)
 
-        self.calculate_content_height()
+        content_height = self.calculate_content_height()
         
         self.scroll_y = max(0, min(self.scroll_y, self.max_scroll))
 
-        x = self.padding_x
-        y = self.padding_y
-
-        title_font = pygame.font.SysFont(None, 48)
-        title_surf = title_font.render("Estatísticas", True, self.text_color)
+        title_surf = fonts.render(self.page_title_font, "Estatísticas", True, self.text_color)
         title_rect = title_surf.get_rect(center=(self.width // 2, 35))
         self.screen.blit(title_surf, title_rect)
 
-        y = 90
-
+        # O conteúdo só é redesenhado quando algum valor fixo muda; os de
+        # LIVE_STATS vão direto na tela depois do canvas
         stats_data = self.get_statistics_data()
-
-        slider_width = self.width - 2 * x - self.scrollbar_width - 10
-
-        y = self.draw_section_title("Pontuação", x, y)
-        y = self.draw_stat_option("Pontuação Atual", stats_data.get("Pontuação Atual", "0"), x, y, slider_width)
-        y = self.draw_stat_option("Pontuação Máxima", stats_data.get("Pontuação Máxima", "0"), x, y, slider_width)
-        y = self.draw_stat_option("Pontuação Total", stats_data.get("Pontuação Total", "0"), x, y, slider_width)
-
-        y += 40
-
-        y = self.draw_section_title("Progresso Geral", x, y)
-        y = self.draw_stat_option("Cliques Totais", stats_data.get("Cliques Totais", "0"), x, y, slider_width)
-        y = self.draw_stat_option("Conquistas Desbloqueadas", stats_data.get("Conquistas Desbloqueadas", "0/0"), x, y, slider_width)
-        y = self.draw_stat_option("Tempo de Jogo", stats_data.get("Tempo de Jogo", "00:00:00"), x, y, slider_width)
-        y = self.draw_stat_option("Upgrades Comprados", stats_data.get("Upgrades Comprados", "0"), x, y, slider_width)
-        y = self.draw_stat_option("Eventos Participados", stats_data.get("Eventos Participados", "0"), x, y, slider_width)
-        y = self.draw_stat_option("Primeira Entrada", stats_data.get("Primeira Entrada", "Não disponível"), x, y, slider_width)
-        y = self.draw_stat_option("Sequência Atual", stats_data.get("Sequência Atual", "0 dias"), x, y, slider_width)
-        y = self.draw_stat_option("Maior Sequência", stats_data.get("Maior Sequência", "0 dias"), x, y, slider_width)
-
-        y += 40
-
-        # CORRIGIDO: Agora mostra 2 estatísticas apenas
-        y = self.draw_section_title("Mini Eventos", x, y)
-        y = self.draw_stat_option("Mini Eventos Sessão", stats_data.get("Mini Eventos Sessão", "0"), x, y, slider_width)
-        y = self.draw_stat_option("Mini Eventos Totais", stats_data.get("Mini Eventos Totais", "0"), x, y, slider_width)
+        canvas_size = (self.width, max(self.height, content_height))
+        key = tuple(item for item in stats_data.items() if item[0] not in LIVE_STATS)
+        self.canvas.update(self.screen, canvas_size, key,
+                           lambda surface: self.draw_content(surface, stats_data))
+        self.canvas.blit(self.screen, self.scroll_y)
+        for stat, (x, y) in self.live_positions.items():
+            self.draw_stat_value(self.screen, stat, stats_data.get(stat, "0"), (x, y - int(self.scroll_y)))
 
         if self.max_scroll > 0:
             self.draw_scrollbar()
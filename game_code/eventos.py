@@ -1,5 +1,7 @@
 import requests, json, pygame, os, sys, numpy as np
 from datetime import datetime, timedelta
+from game_code.scroll_canvas import ScrollCanvas
+from game_code import assets, fonts
 
 def resource_path(relative_path):
     try:
@@ -233,10 +235,10 @@ class EventosMenu:
         self.cor_passado = (150, 150, 150)
         self.scrollbar_color = (100, 100, 120, 180)
         self.scrollbar_hover_color = (80, 80, 100, 200)
-        self.title_font = pygame.font.SysFont(None, 48)
-        self.section_font = pygame.font.SysFont(None, 42)
-        self.normal_font = pygame.font.SysFont(None, 32)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.title_font = fonts.get_font(None, 48)
+        self.section_font = fonts.get_font(None, 42)
+        self.normal_font = fonts.get_font(None, 32)
+        self.small_font = fonts.get_font(None, 24)
         self.padding_x = 20
         self.padding_y = 20
         self.option_height = 60
@@ -252,16 +254,16 @@ class EventosMenu:
         self.scrollbar_rect = None
         self.scrollbar_handle_rect = None
         self.gerenciador = None
+        self.canvas = ScrollCanvas(self.bg_color)
         
         # Carregar e redimensionar a imagem de fechar - tamanho muito menor
         try:
             close_image_path = resource_path("game_assets/close.png")
             if not os.path.exists(close_image_path):
                 close_image_path = os.path.join("..", "game_assets", "close.png")
-            self.close_image = pygame.image.load(close_image_path).convert_alpha()
             # Tamanho reduzido para 40x40 pixels (era 60x60)
             target_size = (40, 40)
-            self.close_image = pygame.transform.smoothscale(self.close_image, target_size)
+            self.close_image = assets.load_image(close_image_path, target_size)
         except Exception:
             self.close_image = None
             
@@ -331,10 +333,7 @@ class EventosMenu:
         
         return False
         
-    def calculate_content_height(self):
-        if not self.gerenciador:
-            return 0
-        height = 90
+    def separar_eventos(self):
         eventos_ativos = self.gerenciador.get_eventos_ativos()
         eventos_futuros = []
         eventos_passados = []
@@ -351,62 +350,64 @@ class EventosMenu:
                     eventos_passados.append(evento)
             except:
                 eventos_passados.append(evento)
-        if eventos_ativos:
-            height += self.option_height + self.spacing_y
-            height += len(eventos_ativos) * (self.card_height + self.spacing_y)
-        if eventos_futuros:
-            height += self.option_height + self.spacing_y
-            height += len(eventos_futuros) * (self.card_height + self.spacing_y)
-        if eventos_passados:
-            height += self.option_height + self.spacing_y
-            height += len(eventos_passados) * (self.card_height + self.spacing_y)
+        return eventos_ativos, eventos_futuros, eventos_passados
+
+    def calculate_content_height(self, grupos=None):
+        if not self.gerenciador:
+            return 0
+        height = 90
+        for eventos in grupos or self.separar_eventos():
+            if eventos:
+                height += self.option_height + self.spacing_y
+                height += len(eventos) * (self.card_height + self.spacing_y)
         return height
         
-    def draw_section_title(self, title, x, y, width):
+    def draw_section_title(self, surface, title, x, y, width):
         box_rect = pygame.Rect(x, y, width, self.option_height)
-        pygame.draw.rect(self.screen, self.section_color, box_rect, border_radius=self.option_radius)
-        pygame.draw.rect(self.screen, self.border_color, box_rect, width=2, border_radius=self.option_radius)
-        title_surf = self.section_font.render(title, True, self.text_color)
+        pygame.draw.rect(surface, self.section_color, box_rect, border_radius=self.option_radius)
+        pygame.draw.rect(surface, self.border_color, box_rect, width=2, border_radius=self.option_radius)
+        title_surf = fonts.render(self.section_font, title, True, self.text_color)
         title_rect = title_surf.get_rect(center=box_rect.center)
-        self.screen.blit(title_surf, title_rect)
+        surface.blit(title_surf, title_rect)
         return y + self.option_height + self.spacing_y
+
+    def get_status_text(self, evento):
+        if evento.ativo:
+            return f"Ativo - {evento.get_tempo_restante()}"
+        try:
+            inicio_str = f"{evento.data_inicio} {evento.hora_inicio}"
+            inicio = datetime.strptime(inicio_str, "%d/%m/%Y %H:%M")
+            agora = datetime.now()
+            return "Em breve" if inicio > agora else "Finalizado"
+        except:
+            return "Finalizado"
         
-    def draw_evento_card(self, evento, x, y, width, cor_status):
+    def draw_evento_card(self, surface, evento, x, y, width, cor_status, status_text, hover):
         card_rect = pygame.Rect(x, y, width, self.card_height)
-        mouse_pos = pygame.mouse.get_pos()
-        if card_rect.bottom < 0 or card_rect.top > self.window_height:
-            return self.card_height + self.spacing_y
         shadow_surface = pygame.Surface((width + 6, self.card_height + 6), pygame.SRCALPHA)
         pygame.draw.rect(shadow_surface, (0, 0, 0, 20), (0, 0, width + 6, self.card_height + 6), border_radius=15)
-        self.screen.blit(shadow_surface, (x - 3, y - 3))
-        color = self.hover_color if card_rect.collidepoint(mouse_pos) else self.option_color
-        pygame.draw.rect(self.screen, color, card_rect, border_radius=self.option_radius)
-        pygame.draw.rect(self.screen, self.border_color, card_rect, width=2, border_radius=self.option_radius)
-        nome_surf = self.normal_font.render(evento.nome, True, self.text_color)
-        self.screen.blit(nome_surf, (x + 15, y + 12))
-        desc_surf = self.small_font.render(evento.get_descricao(), True, self.text_color)
-        self.screen.blit(desc_surf, (x + 15, y + 40))
+        surface.blit(shadow_surface, (x - 3, y - 3))
+        color = self.hover_color if hover else self.option_color
+        pygame.draw.rect(surface, color, card_rect, border_radius=self.option_radius)
+        pygame.draw.rect(surface, self.border_color, card_rect, width=2, border_radius=self.option_radius)
+        nome_surf = fonts.render(self.normal_font, evento.nome, True, self.text_color)
+        surface.blit(nome_surf, (x + 15, y + 12))
+        desc_surf = fonts.render(self.small_font, evento.get_descricao(), True, self.text_color)
+        surface.blit(desc_surf, (x + 15, y + 40))
         periodo = f"{evento.data_inicio} {evento.hora_inicio} - {evento.data_final} {evento.hora_final}"
-        periodo_surf = self.small_font.render(periodo, True, self.text_color)
+        periodo_surf = fonts.render(self.small_font, periodo, True, self.text_color)
         periodo_rect = periodo_surf.get_rect(right=x + width - 15, top=y + 12)
-        self.screen.blit(periodo_surf, periodo_rect)
-        if evento.ativo:
-            status_text = f"Ativo - {evento.get_tempo_restante()}"
-        else:
-            try:
-                inicio_str = f"{evento.data_inicio} {evento.hora_inicio}"
-                inicio = datetime.strptime(inicio_str, "%d/%m/%Y %H:%M")
-                agora = datetime.now()
-                status_text = "Em breve" if inicio > agora else "Finalizado"
-            except:
-                status_text = "Finalizado"
-        status_surf = self.small_font.render(status_text, True, cor_status)
-        status_rect = status_surf.get_rect(right=x + width - 15, top=y + 40)
-        self.screen.blit(status_surf, status_rect)
+        surface.blit(periodo_surf, periodo_rect)
+        if status_text is not None:
+            self.draw_status_text(surface, status_text, cor_status, x, y, width)
         return self.card_height + self.spacing_y
+
+    def draw_status_text(self, surface, status_text, cor_status, x, y, width):
+        status_surf = fonts.render(self.small_font, status_text, True, cor_status)
+        status_rect = status_surf.get_rect(right=x + width - 15, top=y + 40)
+        surface.blit(status_surf, status_rect)
     
-    def draw_scrollbar(self):
-        content_height = self.calculate_content_height()
+    def draw_scrollbar(self, content_height):
         visible_height = self.window_height
         if content_height <= visible_height:
             self.max_scroll = 0
@@ -439,80 +440,73 @@ class EventosMenu:
             pygame.draw.line(self.screen, (255, 255, 255), (center_x - line_length, center_y + line_length),
                             (center_x + line_length, center_y - line_length), 2)  # Espessura reduzida de 3 para 2
     
+    def get_layout(self, grupos):
+        # Posição de cada card no conteúdo, na mesma ordem em que são desenhados
+        layout = []
+        y_position = 90
+        titulos = ("Eventos Ativos", "Proximos Eventos", "Eventos Passados")
+        cores = (self.cor_ativo, self.cor_futuro, self.cor_passado)
+        for titulo, cor, eventos in zip(titulos, cores, grupos):
+            if not eventos:
+                continue
+            layout.append((titulo, None, None, y_position))
+            y_position += self.option_height + self.spacing_y
+            for evento in eventos:
+                layout.append((evento, cor, self.get_status_text(evento), y_position))
+                y_position += self.card_height + self.spacing_y
+        return layout
+
+    def draw_content(self, surface, layout, content_width, hover_index):
+        for index, (item, cor, status_text, y) in enumerate(layout):
+            if cor is None:
+                self.draw_section_title(surface, item, self.padding_x, y, content_width)
+            else:
+                self.draw_evento_card(surface, item, self.padding_x, y, content_width, cor, None, index == hover_index)
+        if not layout:
+            empty_text = fonts.render(self.normal_font, "Nenhum evento encontrado", True, self.text_color)
+            empty_rect = empty_text.get_rect(center=(self.window_width // 2, self.window_height // 2))
+            surface.blit(empty_text, empty_rect)
+
     def draw(self):
         if not self.visible or not self.gerenciador:
             return
         self.gerenciador.atualizar_eventos()
-        content_y_start = -self.scroll_offset
         self.screen.fill(self.bg_color)
-        title_surf = self.title_font.render("Eventos do Jogo", True, self.text_color)
+        title_surf = fonts.render(self.title_font, "Eventos do Jogo", True, self.text_color)
         title_rect = title_surf.get_rect(center=(self.window_width // 2, 35))
         self.screen.blit(title_surf, title_rect)
         self.draw_close_button()
         content_width = self.window_width - 2 * self.padding_x - self.scrollbar_width - self.scrollbar_padding
-        y_position = 90 + content_y_start
-        eventos_ativos = self.gerenciador.get_eventos_ativos()
-        eventos_futuros = []
-        eventos_passados = []
-        for evento in self.gerenciador.eventos:
-            if evento.ativo:
-                continue
-            try:
-                inicio_str = f"{evento.data_inicio} {evento.hora_inicio}"
-                inicio = datetime.strptime(inicio_str, "%d/%m/%Y %H:%M")
-                agora = datetime.now()
-                if inicio > agora:
-                    eventos_futuros.append(evento)
-                else:
-                    eventos_passados.append(evento)
-            except:
-                eventos_passados.append(evento)
-        if eventos_ativos:
-            section_y = y_position
-            if section_y + self.option_height > 0 and section_y < self.window_height:
-                y_position = self.draw_section_title("Eventos Ativos", self.padding_x, section_y, content_width)
-            else:
-                y_position += self.option_height + self.spacing_y
-            for evento in eventos_ativos:
-                card_y = y_position
-                if card_y + self.card_height > 0 and card_y < self.window_height:
-                    card_height_used = self.draw_evento_card(evento, self.padding_x, card_y, content_width, self.cor_ativo)
-                    y_position += card_height_used
-                else:
-                    y_position += self.card_height + self.spacing_y
-        if eventos_futuros:
-            section_y = y_position
-            if section_y + self.option_height > 0 and section_y < self.window_height:
-                y_position = self.draw_section_title("Proximos Eventos", self.padding_x, section_y, content_width)
-            else:
-                y_position += self.option_height + self.spacing_y
-            for evento in eventos_futuros:
-                card_y = y_position
-                if card_y + self.card_height > 0 and card_y < self.window_height:
-                    card_height_used = self.draw_evento_card(evento, self.padding_x, card_y, content_width, self.cor_futuro)
-                    y_position += card_height_used
-                else:
-                    y_position += self.card_height + self.spacing_y
-        if eventos_passados:
-            section_y = y_position
-            if section_y + self.option_height > 0 and section_y < self.window_height:
-                y_position = self.draw_section_title("Eventos Passados", self.padding_x, section_y, content_width)
-            else:
-                y_position += self.option_height + self.spacing_y
-            for evento in eventos_passados:
-                card_y = y_position
-                if card_y + self.card_height > 0 and card_y < self.window_height:
-                    card_height_used = self.draw_evento_card(evento, self.padding_x, card_y, content_width, self.cor_passado)
-                    y_position += card_height_used
-                else:
-                    y_position += self.card_height + self.spacing_y
-        if not eventos_ativos and not eventos_futuros and not eventos_passados:
-            empty_y = self.window_height // 2 + content_y_start
-            if empty_y > 0 and empty_y < self.window_height:
-                empty_text = self.normal_font.render("Nenhum evento encontrado", True, self.text_color)
-                empty_rect = empty_text.get_rect(center=(self.window_width // 2, empty_y))
-                self.screen.blit(empty_text, empty_rect)
-        self.draw_scrollbar()
+        grupos = self.separar_eventos()
+        content_height = self.calculate_content_height(grupos)
+        self.max_scroll = max(0, content_height - self.window_height)
+        self.scroll_offset = min(self.scroll_offset, self.max_scroll)
+        layout = self.get_layout(grupos)
+
+        # O hover é resolvido em coordenadas do conteúdo; só entra na chave
+        # do canvas o índice do card sob o mouse
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_y += self.scroll_offset
+        hover_index = None
+        for index, (item, cor, status_text, y) in enumerate(layout):
+            if cor is not None and pygame.Rect(self.padding_x, y, content_width, self.card_height).collidepoint(mouse_x, mouse_y):
+                hover_index = index
+                break
+
+        # O status ("Ativo - tempo restante" muda a cada segundo) fica fora
+        # da chave e é desenhado por cima do canvas
+        key = (tuple((item if cor is None else (item.nome, item.tipo, item.data_inicio, item.hora_inicio,
+                                                item.data_final, item.hora_final), y)
+                     for item, cor, status_text, y in layout), content_width, hover_index)
+        canvas_size = (self.window_width, max(self.window_height, content_height))
+        self.canvas.update(self.screen, canvas_size, key,
+                           lambda surface: self.draw_content(surface, layout, content_width, hover_index))
+        self.canvas.blit(self.screen, self.scroll_offset)
+        scroll = int(self.scroll_offset)
+        for item, cor, status_text, y in layout:
+            if cor is not None:
+                self.draw_status_text(self.screen, status_text, cor, self.padding_x, y - scroll, content_width)
+        self.draw_scrollbar(content_height)
     
     def show(self):
         self.visible = True
@@ -1,4 +1,5 @@
 import pygame, sys
+from game_code import fonts
 
 class ExitHandler:
     def __init__(self, screen, width, height):
@@ -8,8 +9,8 @@ class ExitHandler:
         self.active = False
         self.user_text = ""
         self.detected_console = False
-        self.font = pygame.font.SysFont(None, 32)
-        self.prompt_font = pygame.font.SysFont(None, 28)
+        self.font = fonts.get_font(None, 32)
+        self.prompt_font = fonts.get_font(None, 28)
         self.input_rect = pygame.Rect(self.width // 2 - 150, self.height // 2 + 10, 300, 40)
         self.bg_rect = pygame.Rect(self.width // 2 - 540, self.height // 2 - 60, 1080, 130)
         self.text_color = (40, 40, 60)
@@ -0,0 +1,209 @@
+import os, sys, json, pygame
+from collections import OrderedDict
+from game_code import glyph_atlas
+
+# Com GCG_DEBUG_FONTS=1 o jogo avisa no console toda fonte criada depois
+# da inicialização; em jogo normal só os contadores são atualizados
+DEBUG_FONTS = os.getenv("GCG_DEBUG_FONTS", "") not in ("", "0")
+
+# Fontes usadas em caminhos quentes (efeitos de clique, popups, títulos)
+PRELOAD = [
+    (None, 20, False), (None, 22, False), (None, 24, False), (None, 26, False),
+    (None, 28, False), (None, 32, False), (None, 36, False), (None, 40, False),
+    (None, 48, False), (None, 64, False),
+    ("None", 28, True), ("Segoe UI Emoji", 20, False),
+]
+
+_fonts = {}
+_stats = {"created": 0, "created_after_startup": 0, "requests": 0, "discoveries": 0}
+_startup_done = False
+
+FONT_CACHE_VERSION = 1
+_resolved = None
+_resolved_dirty = False
+
+def get_font_cache_path():
+    appdata = os.getenv("APPDATA") or "."
+    return os.path.join(appdata, "genericclickergame", "font_cache.json")
+
+def _get_font_dirs():
+    home = os.path.expanduser("~")
+    if sys.platform.startswith("win"):
+        return [os.path.join(os.getenv("WINDIR") or "C:\\Windows", "Fonts"),
+                os.path.join(os.getenv("LOCALAPPDATA") or home, "Microsoft", "Windows", "Fonts")]
+    if sys.platform == "darwin":
+        return ["/Library/Fonts", "/System/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+    return ["/usr/share/fonts", "/usr/local/share/fonts",
+            os.path.join(home, ".fonts"), os.path.join(home, ".local", "share", "fonts")]
+
+def _get_font_dirs_signature():
+    # mtime das pastas de fontes e das subpastas diretas: instalar ou
+    # remover uma fonte muda alguma delas e invalida o cache
+    signature = []
+    for folder in _get_font_dirs():
+        try:
+            signature.append([folder, os.stat(folder).st_mtime])
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        signature.append([entry.path, entry.stat().st_mtime])
+        except OSError:
+            continue
+    return sorted(signature)
+
+def _load_resolved():
+    global _resolved
+    _resolved = {}
+    try:
+        with open(get_font_cache_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == FONT_CACHE_VERSION and data.get("signature") == _get_font_dirs_signature():
+            _resolved = data.get("fonts", {})
+    except (OSError, ValueError, AttributeError):
+        pass
+
+def save_font_cache():
+    global _resolved_dirty
+    if not _resolved_dirty:
+        return
+    try:
+        path = get_font_cache_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {"version": FONT_CACHE_VERSION, "signature": _get_font_dirs_signature(), "fonts": _resolved}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        _resolved_dirty = False
+    except OSError:
+        pass
+
+def _resolve_font(name, bold, italic):
+    # Família -> (arquivo, negrito falso, itálico falso), como o SysFont
+    # resolveria. A busca nas fontes do sistema (registro no Windows,
+    # fc-list no Linux) só roda quando a família não está no cache
+    global _resolved_dirty
+    if _resolved is None:
+        _load_resolved()
+    key = f"{name.lower()}|{int(bold)}|{int(italic)}"
+    entry = _resolved.get(key)
+    if entry and (entry[0] is None or os.path.exists(entry[0])):
+        return entry
+
+    found = []
+    pygame.font.SysFont(name, 1, bold, italic, constructor=lambda path, size, b, i: found.append([path, b, i]))
+    entry = found[0]
+    _resolved[key] = entry
+    _resolved_dirty = True
+    _stats["discoveries"] += 1
+    return entry
+
+def _create_font(name, size, bold, italic):
+    path, set_bold, set_italic = None, bold, italic
+    if name:
+        path, set_bold, set_italic = _resolve_font(name, bold, italic)
+    try:
+        font = pygame.font.Font(path, size)
+    except (OSError, pygame.error):
+        return pygame.font.SysFont(name, size, bold, italic)
+    if set_bold:
+        font.set_bold(True)
+    if set_italic:
+        font.set_italic(True)
+    return font
+
+def get_font(name=None, size=24, bold=False, italic=False):
+    # Cada (família, tamanho, negrito, itálico) é resolvido e carregado uma
+    # única vez; quem pede a mesma fonte recebe o mesmo objeto
+    key = (name.lower() if isinstance(name, str) else name, int(size), bool(bold), bool(italic))
+    _stats["requests"] += 1
+    font = _fonts.get(key)
+    if font is None:
+        font = _create_font(name, int(size), bool(bold), bool(italic))
+        _fonts[key] = font
+        _stats["created"] += 1
+        if _startup_done:
+            _stats["created_after_startup"] += 1
+            save_font_cache()
+            if DEBUG_FONTS:
+                print(f"[fonts] fonte criada depois da inicialização: {key}")
+    return font
+
+def _forget_fonts():
+    # Depois do pygame.quit os objetos Font antigos ficam inválidos (usar
+    # um deles derruba o processo); o registro e tudo que usa a fonte como
+    # chave recomeçam vazios no próximo pygame.init
+    _fonts.clear()
+    text_cache.clear()
+    glyph_atlas.clear_atlases()
+
+pygame.register_quit(_forget_fonts)
+
+def preload(specs=None):
+    for name, size, bold in specs or PRELOAD:
+        get_font(name, size, bold)
+
+def finish_startup():
+    global _startup_done
+    _startup_done = True
+    save_font_cache()
+    if DEBUG_FONTS:
+        print(f"[fonts] {_stats['created']} fontes carregadas na inicialização")
+
+def get_stats():
+    return dict(_stats, fonts=len(_fonts))
+
+class TextCache:
+    # LRU das superfícies de texto já renderizadas. Quase todo texto do
+    # jogo se repete quadro a quadro (rótulos, contadores, pontuação)
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, bool(antialias), tuple(color), tuple(background) if background is not None else None)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+text_cache = TextCache()
+
+def render(font, text, antialias=True, color=(0, 0, 0), background=None):
+    # A superfície devolvida é compartilhada: quem for alterá-la (set_alpha,
+    # desenhar por cima) precisa usar .copy()
+    return text_cache.render(font, text, antialias, color, background)
+
+def get_text_cache_stats():
+    return text_cache.stats()
+
+def set_text_cache_size(max_entries):
+    text_cache.max_entries = max_entries
+    text_cache.clear()
@@ -1,10 +1,13 @@
 import os, pygame, pytz, random, sys, webbrowser, time
 from datetime import datetime
-from game_code.background import draw_background, WIDTH, HEIGHT, set_game_reference
+from game_code.background import set_game_reference
+from game_code import display_metrics
+from game_code import glyph_atlas, number_format
 from game_code.button import AnimatedButton
+from game_code.compositor import Compositor
 from game_code.score_manager import ScoreManager
 from game_code.menu import ConfigMenu
-from game_code.click_effect import ClickEffect
+from game_code.click_effect import ParticleSystem
 from game_code.conquistas import AchievementTracker, AchievementsMenu
 from game_code.upgrades import UpgradeMenu
 from game_code.console import Console
@@ -16,6 +19,7 @@ from game_code.image_viewer import ImageViewer
 from game_code.estatisticas import StatisticsMenu
 from game_code.mod_manager import load_mod
 from game_code import background
+from game_code import fonts
 
 mod = load_mod()
 if mod:
@@ -31,6 +35,7 @@ def resource_path(relative_path):
 class Game:
     def __init__(self, screen):
         self.screen = screen
+        self.width, self.height = display_metrics.get_display_size()
         self.clock = pygame.time.Clock()
         pygame.mixer.init()
 
@@ -42,8 +47,8 @@ class Game:
         
         self.load_game_data()
         
-        self.config_menu = ConfigMenu(screen, WIDTH, HEIGHT, score_manager=self.score_manager)
-        self.image_viewer = ImageViewer(screen, WIDTH, HEIGHT)
+        self.config_menu = ConfigMenu(screen, self.width, self.height, score_manager=self.score_manager)
+        self.image_viewer = ImageViewer(screen, self.width, self.height)
         self.setup_fonts()
         self.setup_game_components()
         self.setup_console()
@@ -61,15 +66,20 @@ class Game:
         self.update_volumes()
         
         set_game_reference(self)
+        self.compositor = Compositor(self.screen)
+        self.config_menu.settings_menu.on_brightness_change = background.set_brightness
+        background.set_brightness(self.config_menu.settings_menu.get_brightness_settings())
+        self.update_background_settings(prerender=True)
         
         self.calcular_ganhos_offline()
         self.verificar_update()
         self.last_save_time = pygame.time.get_ticks()
         
-        self.statistics_menu = StatisticsMenu(screen, WIDTH, HEIGHT, self)
+        self.statistics_menu = StatisticsMenu(screen, self.width, self.height, self)
         self.config_menu.settings_menu.statistics_menu = self.statistics_menu
         
         self.update_daily_streak()
+        fonts.finish_startup()
 
     def inicializar_dados_zerados(self):
         self.score = 0
@@ -117,23 +127,16 @@ class Game:
             bonus_auto = self.upgrade_menu.get_auto_click_bonus()
             pontos_offline += int(ciclos_auto_click * bonus_auto)
         
-        for trabalhador in self.upgrade_menu.trabalhadores:
-            if hasattr(trabalhador, 'get_offline_production'):
-                pontos_trabalhador = trabalhador.get_offline_production(tempo_offline)
-                pontos_offline += pontos_trabalhador
-        
         if pontos_offline > 0:
             self.adicionar_pontos(pontos_offline)
             self.tracker.check_unlock(self.score)
     
-            self.click_effects.append(
-                ClickEffect(
-                    WIDTH // 2, 
-                    HEIGHT // 2,
-                    
-                    f"+{pontos_offline} pts Offline! ({self.format_time(tempo_offline)})",
-                    color=(100, 255, 100)
-                )
+            self.click_effects.spawn(
+                self.width // 2, 
+                self.height // 2,
+                
+                f"+{pontos_offline} pts Offline! ({self.format_time(tempo_offline)})",
+                color=(100, 255, 100)
             )
     
         self.upgrade_menu.offline_time_bank = max(0, self.upgrade_menu.offline_time_bank - tempo_offline)
@@ -243,29 +246,35 @@ class Game:
             return False
 
     def setup_fonts(self):
-        self.FONT = pygame.font.SysFont(None, 64)
+        fonts.preload()
+        self.FONT = fonts.get_font(None, 64)
         self.TEXT_COLOR_SCORE = (40, 40, 60)
-        self.fonte_update = pygame.font.SysFont(None, 24)
-        self.fonte_aviso = pygame.font.SysFont(None, 28)
-        self.fonte_evento = pygame.font.SysFont(None, 26)
-        self.fonte_evento_pequena = pygame.font.SysFont(None, 20)
-        self.fonte_tempo = pygame.font.SysFont(None, 22)
-        self.fonte_streak = pygame.font.SysFont(None, 28)
+        self.score_atlas = glyph_atlas.get_atlas(self.FONT, self.TEXT_COLOR_SCORE)
+        self.score_surf = None
+        self.score_surf_value = None
+        self.offline_bg = None
+        self.fonte_update = fonts.get_font(None, 24)
+        self.fonte_aviso = fonts.get_font(None, 28)
+        self.fonte_evento = fonts.get_font(None, 26)
+        self.fonte_evento_pequena = fonts.get_font(None, 20)
+        self.fonte_tempo = fonts.get_font(None, 22)
+        self.fonte_streak = fonts.get_font(None, 28)
         try:
-            self.fonte_emoji = pygame.font.SysFont("seguiemj", 32)
+            self.fonte_emoji = fonts.get_font("seguiemj", 32)
         except:
             try:
-                self.fonte_emoji = pygame.font.SysFont("apple color emoji", 32)
+                self.fonte_emoji = fonts.get_font("apple color emoji", 32)
             except:
                 try:
-                    self.fonte_emoji = pygame.font.SysFont("noto color emoji", 32)
+                    self.fonte_emoji = fonts.get_font("noto color emoji", 32)
                 except:
-                    self.fonte_emoji = pygame.font.SysFont(None, 32)
+                    self.fonte_emoji = fonts.get_font(None, 32)
+        self.fonte_emoji_streak = fonts.get_font("Segoe UI Emoji", 20)
 
     def setup_game_components(self):
         button_path = resource_path(os.path.join("game_assets", "button.gif"))
         self.button = AnimatedButton(
-            WIDTH // 2, HEIGHT // 2, 200, 200,
+            self.width // 2, self.height // 2, 200, 200,
             button_path
         )
 
@@ -277,7 +286,7 @@ class Game:
         self.tracker.mini_event_clicks = self.mini_event_click_count
         self.tracker.normal_clicks = self.saved_normal_clicks
 
-        self.upgrade_menu = UpgradeMenu(self.screen, WIDTH, HEIGHT, achievement_tracker=self.tracker)
+        self.upgrade_menu = UpgradeMenu(self.screen, self.width, self.height, achievement_tracker=self.tracker)
         self.upgrade_menu.load_upgrades(self.saved_upgrades)
         self.upgrade_menu.set_trabalhador_limit(self.saved_trabalhador_limit_enabled)
         self.upgrade_menu.offline_time_bank = self.offline_time_bank
@@ -285,15 +294,15 @@ class Game:
         if hasattr(self, 'saved_trabalhadores_data'):
             self.upgrade_menu.load_trabalhadores(self.saved_trabalhadores_data)
 
-        self.click_effects = []
+        self.click_effects = ParticleSystem()
         self.auto_click_counter = 0
         self.hold_click_start_time = None
         self.hold_click_accumulator = 0
 
-        self.exit_handler = ExitHandler(self.screen, WIDTH, HEIGHT)
+        self.exit_handler = ExitHandler(self.screen, self.width, self.height)
         self.config_menu.exit_handler = self.exit_handler
 
-        self.config_menu.achievements_menu = AchievementsMenu(self.screen, WIDTH, HEIGHT, self.config_menu)
+        self.config_menu.achievements_menu = AchievementsMenu(self.screen, self.width, self.height, self.config_menu)
         self.config_menu.achievements_menu.achievements = self.tracker.achievements
         self.config_menu.achievements_menu.unlocked = self.tracker.unlocked
 
@@ -311,11 +320,11 @@ class Game:
         self.mini_event2_cooldown = 120000
 
         if random.random() < 0.3:
-            self.mini_event = MiniEvent(self.screen, WIDTH, HEIGHT, "normal")
+            self.mini_event = MiniEvent(self.screen, self.width, self.height, "normal")
             self.last_mini_event_time = pygame.time.get_ticks()
 
         if random.random() < 0.2:
-            self.mini_event2 = MiniEvent(self.screen, WIDTH, HEIGHT, "rare")
+            self.mini_event2 = MiniEvent(self.screen, self.width, self.height, "rare")
             self.last_mini_event2_time = pygame.time.get_ticks()
 
         self.config_menu.achievements_menu.tracker = self.tracker
@@ -335,6 +344,12 @@ class Game:
         if hasattr(self, 'mini_event2') and self.mini_event2 and hasattr(self.mini_event2, 'set_volume'):
             self.mini_event2.set_volume(self.minigame_sound_volume)
 
+    def update_background_settings(self, prerender=False):
+        cycle_settings = self.config_menu.settings_menu.get_background_cycle_settings()
+        background.set_frame_cycle(cycle_settings["enabled"], cycle_settings["frames"])
+        if background.FRAME_CYCLE_ENABLED:
+            background.prepare_frame_cycle(self.screen, eager=prerender)
+
     def get_total_play_time(self):
         if self.is_paused:
             return self.last_session_time
@@ -362,7 +377,7 @@ class Game:
             self.session_start_time = pygame.time.get_ticks()
 
     def resetar_trabalhadores(self):
-        self.upgrade_menu.trabalhadores = []
+        self.upgrade_menu.trabalhadores.clear()
 
     def adicionar_trabalhador(self):
         pass
@@ -402,8 +417,8 @@ class Game:
 
         self.console = Console(
             self.screen,
-            WIDTH,
-            HEIGHT,
+            self.width,
+            self.height,
             on_exit_callback=on_console_close,
             on_open_callback=on_console_open,
             tracker=self.tracker,
@@ -475,6 +490,7 @@ class Game:
             if self.config_menu.settings_menu.visible:
                 if self.config_menu.settings_menu.handle_event(event):
                     self.update_volumes()
+                    self.update_background_settings()
                     continue
 
             if self.config_menu.eventos_menu.visible:
@@ -589,11 +605,9 @@ class Game:
                 self.score = prev_score + pontos_com_evento
 
                 if upgrade:
-                    self.click_effects.append(
-                        ClickEffect(event.pos[0], event.pos[1], "Upgrade Obtido!"))
+                    self.click_effects.spawn(event.pos[0], event.pos[1], "Upgrade Obtido!")
                 else:
-                    self.click_effects.append(
-                        ClickEffect(event.pos[0], event.pos[1], f"+{pontos_com_evento}"))
+                    self.click_effects.spawn(event.pos[0], event.pos[1], f"+{pontos_com_evento}")
                 
                 self.save_game_data()
                 return
@@ -612,11 +626,9 @@ class Game:
                 self.score = prev_score + pontos_com_evento
 
                 if upgrade:
-                    self.click_effects.append(
-                        ClickEffect(event.pos[0], event.pos[1], "Upgrade Raro!", color=(0, 255, 100)))
+                    self.click_effects.spawn(event.pos[0], event.pos[1], "Upgrade Raro!", color=(0, 255, 100))
                 else:
-                    self.click_effects.append(
-                        ClickEffect(event.pos[0], event.pos[1], f"+{pontos_com_evento}!"))
+                    self.click_effects.spawn(event.pos[0], event.pos[1], f"+{pontos_com_evento}!")
                 
                 self.save_game_data()
                 return
@@ -653,8 +665,7 @@ class Game:
                     
                     self.tracker.check_unlock(self.score)
                     
-                    self.click_effects.append(
-                        ClickEffect(event.pos[0], event.pos[1], f"+{int(bonus_com_evento)}"))
+                    self.click_effects.spawn(event.pos[0], event.pos[1], f"+{int(bonus_com_evento)}")
                     
                     self.save_game_data()
                     return
@@ -688,8 +699,7 @@ class Game:
                 if pontos_adicionados > 0:
                     self.tracker.check_unlock(self.score)
                 
-                self.click_effects.append(
-                    ClickEffect(WIDTH // 2, HEIGHT // 2, f"+{int(bonus_com_evento)} (Auto)"))
+                self.click_effects.spawn_income("auto_click", self.width // 2, self.height // 2, int(bonus_com_evento), " (Auto)")
 
         mouse_buttons = pygame.mouse.get_pressed()
         mouse_pos = pygame.mouse.get_pos()
@@ -716,8 +726,7 @@ class Game:
                             if pontos_adicionados > 0:
                                 self.tracker.check_unlock(self.score)
                             
-                            self.click_effects.append(
-                                ClickEffect(WIDTH // 2, HEIGHT // 2, f"+{int(hold_com_evento)}"))
+                            self.click_effects.spawn_income("hold_click", self.width // 2, self.height // 2, int(hold_com_evento))
         else:
             self.hold_click_start_time = None
             self.hold_click_accumulator = 0
@@ -732,80 +741,72 @@ class Game:
                 self.tracker.check_unlock(self.score)
 
         if self.mini_event and self.mini_event.visible and self.upgrade_menu.mini_event_enabled():
-            for trab in self.upgrade_menu.trabalhadores:
-                if trab.active and trab.visible:
-                    trab_rect = trab.rect
-                    mini_rect = pygame.Rect(
-                        self.mini_event.x, 
-                        self.mini_event.y, 
-                        self.mini_event.image.get_width() if hasattr(self.mini_event, 'image') else 50,
-                        self.mini_event.image.get_height() if hasattr(self.mini_event, 'image') else 50
-                    )
+            mini_rect = pygame.Rect(
+                self.mini_event.x, 
+                self.mini_event.y, 
+                self.mini_event.image.get_width() if hasattr(self.mini_event, 'image') else 50,
+                self.mini_event.image.get_height() if hasattr(self.mini_event, 'image') else 50
+            )
+            # Cada trabalhador encostando no evento conta um clique
+            for _ in range(self.upgrade_menu.trabalhadores.count_colliding(mini_rect)):
+                success = self.mini_event.handle_worker_click()
+                if success:
+                    pontos_ganhos = random.randint(1, 1000)
+                    pontos_com_evento = self.gerenciador_eventos.aplicar_efeitos_pontos(pontos_ganhos)
                     
-                    if trab_rect.colliderect(mini_rect):
-                        success = self.mini_event.handle_worker_click()
-                        if success:
-                            pontos_ganhos = random.randint(1, 1000)
-                            pontos_com_evento = self.gerenciador_eventos.aplicar_efeitos_pontos(pontos_ganhos)
-                            
-                            pontos_adicionados = self.adicionar_pontos(pontos_com_evento)
-                            
-                            if pontos_adicionados > 0:
-                                self.tracker.check_unlock(self.score)
-                            
-                            self.click_effects.append(
-                                ClickEffect(
-                                    self.mini_event.x + 25, 
-                                    self.mini_event.y + 25, 
-                                    f"+{int(pontos_com_evento)}! (Trabalhador)"
-                                )
-                            )
-                            self.mini_event.visible = False
-                            break
+                    pontos_adicionados = self.adicionar_pontos(pontos_com_evento)
+                    
+                    if pontos_adicionados > 0:
+                        self.tracker.check_unlock(self.score)
+                    
+                    self.click_effects.spawn_income(
+                        "trabalhador",
+                        self.mini_event.x + 25, 
+                        self.mini_event.y + 25, 
+                        int(pontos_com_evento), "! (Trabalhador)"
+                    )
+                    self.mini_event.visible = False
+                    break
 
         if self.mini_event2 and self.mini_event2.visible and self.upgrade_menu.mini_event_enabled():
-            for trab in self.upgrade_menu.trabalhadores:
-                if trab.active and trab.visible:
-                    trab_rect = trab.rect
-                    mini_rect = pygame.Rect(
-                        self.mini_event2.x, 
-                        self.mini_event2.y, 
-                        self.mini_event2.image.get_width() if hasattr(self.mini_event2, 'image') else 60,
-                        self.mini_event2.image.get_height() if hasattr(self.mini_event2, 'image') else 60
-                    )
+            mini_rect = pygame.Rect(
+                self.mini_event2.x, 
+                self.mini_event2.y, 
+                self.mini_event2.image.get_width() if hasattr(self.mini_event2, 'image') else 60,
+                self.mini_event2.image.get_height() if hasattr(self.mini_event2, 'image') else 60
+            )
+            # Cada trabalhador encostando no evento conta um clique
+            for _ in range(self.upgrade_menu.trabalhadores.count_colliding(mini_rect)):
+                success = self.mini_event2.handle_worker_click()
+                if success:
+                    pontos_ganhos = random.randint(1, 1000) * 2
+                    pontos_com_evento = self.gerenciador_eventos.aplicar_efeitos_pontos(pontos_ganhos)
                     
-                    if trab_rect.colliderect(mini_rect):
-                        success = self.mini_event2.handle_worker_click()
-                        if success:
-                            pontos_ganhos = random.randint(1, 1000) * 2
-                            pontos_com_evento = self.gerenciador_eventos.aplicar_efeitos_pontos(pontos_ganhos)
-                            
-                            pontos_adicionados = self.adicionar_pontos(pontos_com_evento)
-                            
-                            if pontos_adicionados > 0:
-                                self.tracker.check_unlock(self.score)
-                            
-                            self.click_effects.append(
-                                ClickEffect(
-                                    self.mini_event2.x + 30, 
-                                    self.mini_event2.y + 30, 
-                                    f"+{int(pontos_com_evento)}! (Trabalhador)"
-                                )
-                            )
-                            self.mini_event2.visible = False
-                            break
+                    pontos_adicionados = self.adicionar_pontos(pontos_com_evento)
+                    
+                    if pontos_adicionados > 0:
+                        self.tracker.check_unlock(self.score)
+                    
+                    self.click_effects.spawn_income(
+                        "trabalhador",
+                        self.mini_event2.x + 30, 
+                        self.mini_event2.y + 30, 
+                        int(pontos_com_evento), "! (Trabalhador)"
+                    )
+                    self.mini_event2.visible = False
+                    break
 
         if (current_time - self.last_mini_event_time > self.mini_event_cooldown and
                 not self.mini_event and
                 random.random() < 0.3):
-            self.mini_event = MiniEvent(self.screen, WIDTH, HEIGHT, "normal")
+            self.mini_event = MiniEvent(self.screen, self.width, self.height, "normal")
             self.mini_event.set_volume(self.minigame_sound_volume)
             self.last_mini_event_time = current_time
 
         if (current_time - self.last_mini_event2_time > self.mini_event2_cooldown and
                 not self.mini_event2 and
                 random.random() < 0.2):
-            self.mini_event2 = MiniEvent(self.screen, WIDTH, HEIGHT, "rare")
+            self.mini_event2 = MiniEvent(self.screen, self.width, self.height, "rare")
             self.mini_event2.set_volume(self.minigame_sound_volume)
             self.last_mini_event2_time = current_time
 
@@ -819,83 +820,103 @@ class Game:
             if not self.mini_event2.visible:
                 self.mini_event2 = None
 
-        for eff in self.click_effects[:]:
-            eff.update()
-            if eff.finished:
-                self.click_effects.remove(eff)
+        self.click_effects.update()
 
         if current_time - self.last_save_time >= 1000:
             self.save_game_data()
             self.last_save_time = current_time
 
+    def menus_cobrem_tela(self):
+        # Menus e painéis não informam as áreas que desenham, então com
+        # qualquer um deles aberto a tela inteira é redesenhada
+        return (
+            self.upgrade_menu.visible or self.upgrade_menu.animation > 0 or
+            self.config_menu.is_open or self.config_menu.animation_progress > 0 or
+            self.config_menu.controls_menu.is_animating() or
+            self.config_menu.settings_menu.visible or
+            self.config_menu.achievements_menu.visible or
+            self.config_menu.eventos_menu.visible or
+            self.statistics_menu.visible or
+            self.console.visible or
+            self.exit_handler.active or
+            self.image_viewer.visible
+        )
+
     def draw(self):
-        draw_background(self.screen)
+        compositor = self.compositor
+        compositor.begin_frame(force_full=self.menus_cobrem_tela())
         
-        self.upgrade_menu.draw_trabalhadores()
+        compositor.add_all(self.upgrade_menu.draw_trabalhadores())
         
-        self.button.draw(self.screen)
+        compositor.add(self.button.draw(self.screen))
 
-        for eff in self.click_effects:
-            eff.draw(self.screen)
+        compositor.add_all(self.click_effects.draw(self.screen))
 
         if self.mini_event and self.mini_event.visible:
-            self.mini_event.draw()
+            compositor.add(self.mini_event.draw())
 
         if self.mini_event2 and self.mini_event2.visible:
-            self.mini_event2.draw()
-
-        score_surf = self.FONT.render(str(self.score), True, self.TEXT_COLOR_SCORE)
-        score_rect = score_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 180))
-        self.screen.blit(score_surf, score_rect)
+            compositor.add(self.mini_event2.draw())
+
+        # A pontuação só é remontada quando o valor muda, com os glifos do
+        # atlas em vez de font.render. Separadores até 999.999.999, depois
+        # B/T e notação científica
+        if self.score_surf is None or self.score_surf_value != self.score:
+            self.score_surf = self.score_atlas.render(number_format.format_number(self.score, max_length=11))
+            self.score_surf_value = self.score
+        score_surf = self.score_surf
+        score_rect = score_surf.get_rect(center=(self.width // 2, self.height // 2 - 180))
+        compositor.add(self.screen.blit(score_surf, score_rect))
 
         mostrar_sequencia = self.config_menu.settings_menu.get_option("Mostrar sequência")
         if mostrar_sequencia and self.streak_data["current_streak"] > 0:
-            self.fonte_emoji = pygame.font.SysFont("Segoe UI Emoji", 20)
-            emoji_surf = self.fonte_emoji.render("🔥", True, (255, 100, 0))
+            emoji_surf = fonts.render(self.fonte_emoji_streak, "🔥", True, (255, 100, 0))
 
-            numero_surf = self.fonte_streak.render(str(self.streak_data['current_streak']), True, (40, 40, 60))
+            numero_surf = fonts.render(self.fonte_streak, str(self.streak_data['current_streak']), True, (40, 40, 60))
             
             margin = 20
             total_width = emoji_surf.get_width() + numero_surf.get_width() + 2
             total_height = max(emoji_surf.get_height(), numero_surf.get_height())
             
-            x_pos = WIDTH - total_width - margin
-            y_pos = HEIGHT - total_height - margin
+            x_pos = self.width - total_width - margin
+            y_pos = self.height - total_height - margin
             
-            self.screen.blit(emoji_surf, (x_pos, y_pos))
-            self.screen.blit(numero_surf, (x_pos + emoji_surf.get_width() + 2, y_pos))
+            compositor.add(self.screen.blit(emoji_surf, (x_pos, y_pos)))
+            compositor.add(self.screen.blit(numero_surf, (x_pos + emoji_surf.get_width() + 2, y_pos)))
 
         if self.upgrade_menu.ganhos_offline_enabled():
             tempo_offline_text = f"Offline: {self.upgrade_menu.get_offline_time_formatted()}"
-            tempo_offline_surf = self.fonte_tempo.render(tempo_offline_text, True, (100, 150, 255))
+            tempo_offline_surf = fonts.render(self.fonte_tempo, tempo_offline_text, True, (100, 150, 255))
             
-            x_pos = (WIDTH - tempo_offline_surf.get_width()) // 2
+            x_pos = (self.width - tempo_offline_surf.get_width()) // 2
             y_pos = 20
             
+            # O fundo só é refeito quando a largura do texto muda
             bg_width = tempo_offline_surf.get_width() + 10
             bg_height = tempo_offline_surf.get_height() + 6
-            bg_surface = pygame.Surface((bg_width, bg_height), pygame.SRCALPHA)
-            pygame.draw.rect(bg_surface, (50, 50, 80, 180), (0, 0, bg_width, bg_height), border_radius=8)
-            self.screen.blit(bg_surface, (x_pos - 5, y_pos - 3))
+            if self.offline_bg is None or self.offline_bg.get_size() != (bg_width, bg_height):
+                self.offline_bg = pygame.Surface((bg_width, bg_height), pygame.SRCALPHA)
+                pygame.draw.rect(self.offline_bg, (50, 50, 80, 180), (0, 0, bg_width, bg_height), border_radius=8)
+            compositor.add(self.screen.blit(self.offline_bg, (x_pos - 5, y_pos - 3)))
             
             self.screen.blit(tempo_offline_surf, (x_pos, y_pos))
 
-        self.tracker.draw_popup()
+        compositor.add(self.tracker.draw_popup())
 
         eventos_ativos = self.gerenciador_eventos.get_eventos_ativos()
         if eventos_ativos:
             for i, evento in enumerate(eventos_ativos):
-                evento_ativo_surf = self.fonte_evento.render("EVENTO ATIVO: ", True, (255, 215, 0))
-                nome_evento_surf = self.fonte_evento.render(f"{evento.nome}", True, (0, 0, 0))
+                evento_ativo_surf = fonts.render(self.fonte_evento, "EVENTO ATIVO: ", True, (255, 215, 0))
+                nome_evento_surf = fonts.render(self.fonte_evento, f"{evento.nome}", True, (0, 0, 0))
                 
-                evento_ativo_rect = evento_ativo_surf.get_rect(center=(WIDTH // 2 - nome_evento_surf.get_width() // 2, HEIGHT - 50))
-                nome_evento_rect = nome_evento_surf.get_rect(center=(WIDTH // 2 + evento_ativo_rect.width // 2, HEIGHT - 50))
+                evento_ativo_rect = evento_ativo_surf.get_rect(center=(self.width // 2 - nome_evento_surf.get_width() // 2, self.height - 50))
+                nome_evento_rect = nome_evento_surf.get_rect(center=(self.width // 2 + evento_ativo_rect.width // 2, self.height - 50))
                 
                 bg_width = evento_ativo_rect.width + nome_evento_rect.width + 20
                 bg_height = max(evento_ativo_rect.height, nome_evento_rect.height) + 10
                 bg_rect = pygame.Rect(
-                    WIDTH // 2 - bg_width // 2,
-                    HEIGHT - 50 - bg_height // 2,
+                    self.width // 2 - bg_width // 2,
+                    self.height - 50 - bg_height // 2,
                     bg_width,
                     bg_height
                 )
@@ -908,25 +929,25 @@ class Game:
                 pygame.draw.rect(bg_surface, (150, 150, 150), (0, 0, bg_width, bg_height), 
                                2, border_radius=8)
                 
-                self.screen.blit(bg_surface, bg_rect)
+                compositor.add(self.screen.blit(bg_surface, bg_rect))
                 
-                self.screen.blit(evento_ativo_surf, evento_ativo_rect)
-                self.screen.blit(nome_evento_surf, nome_evento_rect)
+                compositor.add(self.screen.blit(evento_ativo_surf, evento_ativo_rect))
+                compositor.add(self.screen.blit(nome_evento_surf, nome_evento_rect))
 
         if self.aviso_update:
-            text_surf = self.fonte_update.render(self.texto_update, True, (255, 50, 50))
-            text_rect = text_surf.get_rect(bottomleft=(10, HEIGHT - 10))
-            self.screen.blit(text_surf, text_rect)
+            text_surf = fonts.render(self.fonte_update, self.texto_update, True, (255, 50, 50))
+            text_rect = text_surf.get_rect(bottomleft=(10, self.height - 10))
+            compositor.add(self.screen.blit(text_surf, text_rect))
             self.update_rect = text_rect
 
         if hasattr(self.config_menu.settings_menu, "precisa_reiniciar") and self.config_menu.settings_menu.precisa_reiniciar:
-            aviso = self.fonte_aviso.render("Reinicie o jogo para aplicar mudanças", True, (200, 0, 0))
-            aviso_rect = aviso.get_rect(center=(WIDTH // 2, HEIGHT - 30))
-            self.screen.blit(aviso, aviso_rect)
+            aviso = fonts.render(self.fonte_aviso, "Reinicie o jogo para aplicar mudanças", True, (200, 0, 0))
+            aviso_rect = aviso.get_rect(center=(self.width // 2, self.height - 30))
+            compositor.add(self.screen.blit(aviso, aviso_rect))
 
-        self.upgrade_menu.draw(self.score)
-        self.config_menu.draw_icon()
-        self.config_menu.draw()
+        compositor.add(self.upgrade_menu.draw(self.score))
+        compositor.add(self.config_menu.draw_icon())
+        compositor.add(self.config_menu.draw())
         
         self.config_menu.achievements_menu.draw()
         self.config_menu.eventos_menu.draw()
@@ -940,12 +961,15 @@ class Game:
 
         self.image_viewer.draw()
 
+    def present(self):
+        self.compositor.present()
+
     def run(self):
         while self.running:
             self.handle_events()
             self.update()
             self.draw()
-            pygame.display.flip()
+            self.present()
             self.clock.tick(60)
             
             if pygame.time.get_ticks() % 30 == 0:
@@ -956,7 +980,7 @@ class Game:
 
 if __name__ == "__main__":
     pygame.init()
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    screen = pygame.display.set_mode(display_metrics.get_display_size())
     pygame.display.set_caption("Generic Clicker Game")
     game = Game(screen)
     game.run()
\ No newline at end of file
@@ -0,0 +1,215 @@
+import pygame
+import numpy as np
+from collections import OrderedDict
+
+class GlassCache:
+    def __init__(self, max_bytes=32 * 1024 * 1024, max_entries=512):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, factory):
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = factory()
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        # Superfícies maiores que o orçamento inteiro não entram no cache
+        if size > self.max_bytes:
+            return surface
+
+        self.entries[key] = surface
+        self.memory += size
+        while self.memory > self.max_bytes or len(self.entries) > self.max_entries:
+            _, old = self.entries.popitem(last=False)
+            self.memory -= old.get_width() * old.get_height() * old.get_bytesize()
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+        self.memory = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "memory": self.memory,
+            "max_bytes": self.max_bytes,
+        }
+
+glass_cache = GlassCache()
+
+def get_cache_stats():
+    return glass_cache.stats()
+
+def set_memory_budget(max_bytes):
+    glass_cache.max_bytes = max_bytes
+    glass_cache.clear()
+
+def draw_rounded_rect_aa(surface, color, rect, radius):
+    temp_surface = pygame.Surface((rect[2] + 4, rect[3] + 4), pygame.SRCALPHA)
+    temp_surface.fill((0, 0, 0, 0))
+
+    temp_rect = pygame.Rect(2, 2, rect[2], rect[3])
+    pygame.draw.rect(temp_surface, color, temp_rect, border_radius=radius)
+
+    surface.blit(temp_surface, (rect[0] - 2, rect[1] - 2))
+
+def _gradient_progress(width, height, direction):
+    if direction == 'horizontal':
+        return np.broadcast_to((np.arange(width) / width)[:, None], (width, height))
+    if direction == 'radial':
+        xs = np.arange(width)[:, None] - (width - 1) / 2
+        ys = np.arange(height)[None, :] - (height - 1) / 2
+        distance = np.sqrt(xs * xs + ys * ys)
+        return distance / max(distance.max(), 1)
+    return np.broadcast_to((np.arange(height) / height)[None, :], (width, height))
+
+def create_gradient(width, height, color=(255, 255, 255), alpha=50, falloff=0.6, direction='vertical'):
+    # Rampa de alpha alpha * (1 - progresso * falloff), escrita de uma vez
+    # com surfarray. direction: 'vertical' (de cima para baixo, como os
+    # destaques do vidro), 'horizontal' (da esquerda para a direita) ou
+    # 'radial' (do centro para as bordas)
+    gradient = pygame.Surface((width, height), pygame.SRCALPHA)
+    gradient.fill((color[0], color[1], color[2], 0))
+    if width <= 0 or height <= 0:
+        return gradient
+
+    ramp = alpha * (1 - _gradient_progress(width, height, direction) * falloff)
+    alphas = pygame.surfarray.pixels_alpha(gradient)
+    alphas[:] = np.clip(ramp, 0, 255).astype(np.uint8)
+    del alphas
+    return gradient
+
+def create_glass_surface(width, height, color, border_color, radius=20, border_width=2,
+                         highlight_alpha=50, highlight_falloff=0.6):
+    glass_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    glass_surface.fill((0, 0, 0, 0))
+
+    draw_rounded_rect_aa(glass_surface, color, (0, 0, width, height), radius)
+
+    highlight = create_gradient(width, height, (255, 255, 255), highlight_alpha, highlight_falloff)
+
+    mask = pygame.Surface((width, height), pygame.SRCALPHA)
+    mask.fill((0, 0, 0, 0))
+    draw_rounded_rect_aa(mask, (255, 255, 255, 255), (0, 0, width, height), radius)
+
+    highlight.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+    glass_surface.blit(highlight, (0, 0))
+
+    border_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    border_surface.fill((0, 0, 0, 0))
+    pygame.draw.rect(border_surface, border_color, (0, 0, width, height),
+                    width=border_width, border_radius=radius)
+    glass_surface.blit(border_surface, (0, 0))
+
+    return glass_surface
+
+def get_glass_surface(width, height, color, border_color, radius=20, border_width=2,
+                      highlight_alpha=50, highlight_falloff=0.6):
+    # A superfície devolvida é compartilhada: quem for desenhar por cima
+    # dela precisa usar .copy()
+    width, height = int(width), int(height)
+    key = (width, height, tuple(color), tuple(border_color), radius, border_width,
+           highlight_alpha, highlight_falloff)
+    return glass_cache.get(key, lambda: create_glass_surface(
+        width, height, color, border_color, radius, border_width,
+        highlight_alpha, highlight_falloff))
+
+def get_glass_panel(width, height, color, border_color):
+    # Painéis de menu: a altura muda com o conteúdo (upgrades liberados,
+    # layout do menu de configurações), então cada tamanho novo é montado
+    # com o nine-slice em vez de renderizado do zero
+    width, height = int(width), int(height)
+    key = ("panel", width, height, tuple(color), tuple(border_color))
+    return glass_cache.get(key, lambda: _build_glass_panel(width, height, color, border_color))
+
+def get_glass_option(width, height, color, border_color):
+    return get_glass_surface(width, height, color, border_color, 14, 1, 40, 0.7)
+
+# Referência de onde saem os pedaços do nine-slice: o miolo tem largura
+# de sobra para cobrir painéis largos com poucos blits por linha
+NINE_SLICE_WIDTH = 512
+NINE_SLICE_HEIGHT = 256
+
+def draw_nine_slice(target, source, rect, corner, special_flags=0):
+    # Desenha em target um painel do tamanho de rect com os cantos, bordas
+    # e miolo de source, sem criar superfícies. Cantos vão inteiros; bordas
+    # e miolo são esticados repetindo colunas/linhas de 1 pixel de source.
+    # Na vertical as linhas são amostradas proporcionalmente, então o
+    # degradê do destaque acompanha a altura do painel. Num destino
+    # transparente, BLEND_RGBA_MAX copia os pedaços sem misturar o alpha
+    x, y, width, height = pygame.Rect(rect)
+    source_width, source_height = source.get_size()
+    middle_width = width - 2 * corner
+    middle_height = height - 2 * corner
+    source_middle_width = source_width - 2 * corner
+    source_middle_height = source_height - 2 * corner
+    right = source_width - corner
+    bottom = source_height - corner
+
+    pieces = [
+        (source, (x, y), (0, 0, corner, corner), special_flags),
+        (source, (x + width - corner, y), (right, 0, corner, corner), special_flags),
+        (source, (x, y + height - corner), (0, bottom, corner, corner), special_flags),
+        (source, (x + width - corner, y + height - corner), (right, bottom, corner, corner), special_flags),
+    ]
+    for i in range(0, middle_width, source_middle_width):
+        span = min(source_middle_width, middle_width - i)
+        pieces.append((source, (x + corner + i, y), (corner, 0, span, corner), special_flags))
+        pieces.append((source, (x + corner + i, y + height - corner), (corner, bottom, span, corner), special_flags))
+    for j in range(middle_height):
+        row = corner + j * source_middle_height // middle_height
+        row_y = y + corner + j
+        pieces.append((source, (x, row_y), (0, row, corner, 1), special_flags))
+        pieces.append((source, (x + width - corner, row_y), (right, row, corner, 1), special_flags))
+        for i in range(0, middle_width, source_middle_width):
+            span = min(source_middle_width, middle_width - i)
+            pieces.append((source, (x + corner + i, row_y), (corner, row, span, 1), special_flags))
+    target.blits(pieces, False)
+    return pygame.Rect(x, y, width, height)
+
+def draw_glass_panel(target, rect, color, border_color, radius=20, border_width=2,
+                     highlight_alpha=50, highlight_falloff=0.6, special_flags=0):
+    # Para painéis que mudam de tamanho: uma referência por
+    # estilo fica no cache e qualquer tamanho é montado direto no destino
+    rect = pygame.Rect(rect)
+    corner = radius + border_width
+    # Abaixo de dois cantos o pygame achata o raio, então renderiza direto
+    if rect.width < 2 * corner or rect.height < 2 * corner:
+        panel = get_glass_surface(rect.width, rect.height, color, border_color, radius,
+                                  border_width, highlight_alpha, highlight_falloff)
+        return target.blit(panel, rect, special_flags=special_flags)
+
+    source = get_glass_surface(NINE_SLICE_WIDTH + 2 * corner, NINE_SLICE_HEIGHT + 2 * corner,
+                               color, border_color, radius, border_width,
+                               highlight_alpha, highlight_falloff)
+    return draw_nine_slice(target, source, rect, corner, special_flags)
+
+def _build_glass_panel(width, height, color, border_color):
+    panel = pygame.Surface((width, height), pygame.SRCALPHA)
+    draw_glass_panel(panel, panel.get_rect(), color, border_color,
+                     special_flags=pygame.BLEND_RGBA_MAX)
+    return panel
+
+def blit_reveal(target, panel, pos, progress, from_bottom=False):
+    # Animação de abertura: o painel completo fica pronto e só a parte já
+    # revelada é copiada, sem criar superfícies a cada quadro
+    width, height = panel.get_size()
+    visible = int(height * progress)
+    if visible <= 0:
+        return None
+    if from_bottom:
+        return target.blit(panel, (pos[0], pos[1] + height - visible), (0, height - visible, width, visible))
+    return target.blit(panel, pos, (0, 0, width, visible))
@@ -0,0 +1,88 @@
+import pygame
+
+DIGITS = "0123456789"
+SEPARATORS = "+-.,:!/ "
+# Sufixos dos popups de pontos, renderizados inteiros como um glifo só
+SUFFIXES = (" (Auto)", "! (Trabalhador)")
+
+class GlyphAtlas:
+    # Dígitos, separadores e sufixos renderizados uma vez por fonte e cor.
+    # Um número novo é montado com blits dos glifos, sem font.render
+    def __init__(self, font, color, antialias=True, suffixes=SUFFIXES):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.height = font.get_height()
+        self.suffixes = sorted(suffixes, key=len, reverse=True)
+        self.glyphs = {}
+        self.layouts = {}
+        for token in DIGITS + SEPARATORS:
+            self._get_glyph(token)
+        for token in suffixes:
+            self._get_glyph(token)
+
+    def _get_glyph(self, token):
+        glyph = self.glyphs.get(token)
+        if glyph is None:
+            # Caracteres fora do conjunto inicial entram na primeira vez que
+            # aparecem. O avanço é fracionário (medido numa sequência do
+            # mesmo glifo), senão os números ficam mais apertados que no
+            # font.render
+            single = self.font.size(token)[0]
+            advance = (self.font.size(token * 21)[0] - single) / 20
+            glyph = (self.font.render(token, self.antialias, self.color), advance, single)
+            self.glyphs[token] = glyph
+        return glyph
+
+    def _tokens(self, text):
+        i = 0
+        while i < len(text):
+            for suffix in self.suffixes:
+                if text.startswith(suffix, i):
+                    yield suffix
+                    i += len(suffix)
+                    break
+            else:
+                yield text[i]
+                i += 1
+
+    def _get_layout(self, text):
+        # Um popup desenha o mesmo texto por vários quadros; a posição de
+        # cada glifo é calculada uma vez por texto
+        layout = self.layouts.get(text)
+        if layout is None:
+            offsets = []
+            x = 0.0
+            width = 0
+            for token in self._tokens(text):
+                surface, advance, single = self._get_glyph(token)
+                offsets.append((surface, int(x + 0.5)))
+                width = int(x + 0.5) + single
+                x += advance
+            layout = (offsets, width)
+            if len(self.layouts) >= 512:
+                self.layouts.clear()
+            self.layouts[text] = layout
+        return layout
+
+    def render(self, text):
+        # Superfície própria com o texto montado, para quem vai reutilizá-la
+        # por vários quadros. O destino começa transparente e BLEND_RGBA_MAX
+        # junta os glifos sem misturar o alpha das bordas
+        offsets, width = self._get_layout(text)
+        surface = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+        surface.blits([(glyph, (dx, 0), None, pygame.BLEND_RGBA_MAX) for glyph, dx in offsets], False)
+        return surface
+
+_atlases = {}
+
+def get_atlas(font, color, antialias=True):
+    key = (font, tuple(color), bool(antialias))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font, color, antialias)
+        _atlases[key] = atlas
+    return atlas
+
+def clear_atlases():
+    _atlases.clear()
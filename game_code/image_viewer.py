@@ -1,6 +1,7 @@
 import pygame, urllib.request
 from io import BytesIO
 from PIL import Image
+from game_code import fonts
 
 class ImageViewer:
     def __init__(self, screen, width, height):
@@ -98,8 +99,8 @@ class ImageViewer:
         self.screen.blit(overlay, (0, 0))
         
         if self.error:
-            font = pygame.font.SysFont(None, 36)
-            error_text = font.render("Erro ao carregar a imagem", True, (255, 0, 0))
+            font = fonts.get_font(None, 36)
+            error_text = fonts.render(font, "Erro ao carregar a imagem", True, (255, 0, 0))
             text_rect = error_text.get_rect(center=(self.width // 2, self.height // 2))
             self.screen.blit(error_text, text_rect)
         elif self.image and self.image_rect:
@@ -125,14 +126,14 @@ class ImageViewer:
             pygame.draw.rect(self.screen, (255, 80, 80), self.close_button_rect, border_radius=20)
             pygame.draw.rect(self.screen, (255, 255, 255), self.close_button_rect, 2, border_radius=20)
             
-            font = pygame.font.SysFont(None, 40)
-            text = font.render("×", True, (255, 255, 255))
+            font = fonts.get_font(None, 40)
+            text = fonts.render(font, "×", True, (255, 255, 255))
             text_rect = text.get_rect(center=self.close_button_rect.center)
             self.screen.blit(text, text_rect)
             
         if self.loading:
-            font = pygame.font.SysFont(None, 36)
-            loading_text = font.render("Carregando imagem...", True, (255, 255, 255))
+            font = fonts.get_font(None, 36)
+            loading_text = fonts.render(font, "Carregando imagem...", True, (255, 255, 255))
             text_rect = loading_text.get_rect(center=(self.width // 2, self.height // 2))
             self.screen.blit(loading_text, text_rect)
 
@@ -5,6 +5,8 @@ from game_code.exit_handler import ExitHandler
 from game_code.conquistas import AchievementsMenu
 from game_code.console import Console
 from game_code.eventos import EventosMenu
+from game_code import glass
+from game_code import assets, fonts
 
 
 def resource_path(relative_path):
@@ -20,7 +22,7 @@ class ConfigMenu:
         self.screen = screen
         self.window_width = window_width
         self.window_height = window_height
-        self.font = pygame.font.SysFont(None, 26)
+        self.font = fonts.get_font(None, 26)
         
         self.bg_color = (180, 210, 255, 180)
         self.option_color = (255, 255, 255, 220)
@@ -45,8 +47,7 @@ class ConfigMenu:
         self.icon_path = os.path.join(assets_folder, "menu.png")
 
         try:
-            self.icon_image = pygame.image.load(self.icon_path).convert_alpha()
-            self.icon_image = pygame.transform.smoothscale(self.icon_image, (60, 60))
+            self.icon_image = assets.load_image(self.icon_path, (60, 60))
         except Exception:
             self.icon_image = None
 
@@ -73,6 +74,10 @@ class ConfigMenu:
             upgrade_manager=None
         )
 
+        self._menu_panel = None
+        self._menu_panel_state = None
+        self._item_variants = {}
+
         self.extra_icons = []
         self.score_manager = score_manager
         self.get_score_callback = None
@@ -82,71 +87,6 @@ class ConfigMenu:
         if hasattr(self.settings_menu, 'get_option') and self.settings_menu.get_option("Manter console aberto"):
             self.enable_console(add_option=True)
 
-    def _draw_rounded_rect_aa(self, surface, color, rect, radius):
-        temp_surface = pygame.Surface((rect[2] + 4, rect[3] + 4), pygame.SRCALPHA)
-        temp_surface.fill((0, 0, 0, 0))
-        
-        temp_rect = pygame.Rect(2, 2, rect[2], rect[3])
-        pygame.draw.rect(temp_surface, color, temp_rect, border_radius=radius)
-        
-        surface.blit(temp_surface, (rect[0] - 2, rect[1] - 2))
-
-    def _create_glass_effect(self, width, height):
-        glass_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        glass_surface.fill((0, 0, 0, 0))
-        
-        self._draw_rounded_rect_aa(glass_surface, self.bg_color, (0, 0, width, height), 20)
-        
-        highlight = pygame.Surface((width, height), pygame.SRCALPHA)
-        highlight.fill((0, 0, 0, 0))
-        for i in range(height):
-            alpha = int(50 * (1 - i / height * 0.6))
-            pygame.draw.line(highlight, (255, 255, 255, alpha), (0, i), (width, i))
-        
-        mask = pygame.Surface((width, height), pygame.SRCALPHA)
-        mask.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(mask, (255, 255, 255, 255), (0, 0, width, height), 20)
-        
-        highlight.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        glass_surface.blit(highlight, (0, 0))
-        
-        border_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        border_surface.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(border_surface, (0, 0, 0, 0), (0, 0, width, height), 20)
-        pygame.draw.rect(border_surface, self.option_border, (0, 0, width, height), 
-                        width=2, border_radius=20)
-        glass_surface.blit(border_surface, (0, 0))
-        
-        return glass_surface
-
-    def _create_glass_option(self, width, height, color):
-        option_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        option_surface.fill((0, 0, 0, 0))
-        
-        self._draw_rounded_rect_aa(option_surface, color, (0, 0, width, height), 14)
-        
-        highlight = pygame.Surface((width, height), pygame.SRCALPHA)
-        highlight.fill((0, 0, 0, 0))
-        for i in range(height):
-            alpha = int(40 * (1 - i / height * 0.7))
-            pygame.draw.line(highlight, (255, 255, 255, alpha), (0, i), (width, i))
-        
-        mask = pygame.Surface((width, height), pygame.SRCALPHA)
-        mask.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(mask, (255, 255, 255, 255), (0, 0, width, height), 14)
-        
-        highlight.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        option_surface.blit(highlight, (0, 0))
-        
-        border_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        border_surface.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(border_surface, (0, 0, 0, 0), (0, 0, width, height), 14)
-        pygame.draw.rect(border_surface, self.option_border, (0, 0, width, height), 
-                        width=1, border_radius=14)
-        option_surface.blit(border_surface, (0, 0))
-        
-        return option_surface
-
     def set_score_accessors(self, get_score_func, set_score_func):
         self.get_score_callback = get_score_func
         self.set_score_callback = set_score_func
@@ -175,11 +115,11 @@ class ConfigMenu:
         if self.icon_image:
             icon_pos = (self.icon_rect.x + (self.icon_rect.width - self.icon_image.get_width()) // 2,
                        self.icon_rect.y + (self.icon_rect.height - self.icon_image.get_height()) // 2)
-            self.screen.blit(self.icon_image, icon_pos)
+            return self.screen.blit(self.icon_image, icon_pos)
         else:
-            text = self.font.render("MENU", True, (255, 255, 255))
+            text = fonts.render(self.font, "MENU", True, (255, 255, 255))
             text_rect = text.get_rect(center=self.icon_rect.center)
-            self.screen.blit(text, text_rect)
+            return self.screen.blit(text, text_rect)
 
     def update_animation(self):
         if self.is_open:
@@ -187,68 +127,23 @@ class ConfigMenu:
         else:
             self.animation_progress = max(0.0, self.animation_progress - self.animation_speed)
 
-    def draw_menu(self):
-        self.update_animation()
-        if self.animation_progress <= 0:
-            return
-
-        unlocked_count = len(self.achievements_menu.tracker.unlocked) if hasattr(self.achievements_menu, "tracker") else 0
-
-        menu_items = [
-            ("Configurações", False),
-            ("Controles", False),
-            (f"Conquistas ({unlocked_count})", False),
-            ("Eventos", False)
-        ]
-
-        if self.console_enabled:
-            menu_items.append(("Console", False))
-
-        menu_items.append(("Sair", not self.console_enabled))
-
-        vertical_menu = False
-        if hasattr(self.settings_menu, "get_option"):
-            vertical_menu = self.settings_menu.get_option("Menu vertical")
-
+    def _get_menu_layout(self, menu_items, vertical_menu):
         button_height = self.option_height
         vertical_padding = 12
         horizontal_padding = self.padding_x
         button_spacing = self.spacing_y
         button_width = 200
-        
-        mouse_pos = pygame.mouse.get_pos()
-        self.menu_rects = []
+        layout = []
 
         if vertical_menu:
             menu_width = button_width + 2 * horizontal_padding
             total_height = len(menu_items) * (button_height + button_spacing) - button_spacing + 2 * vertical_padding
-            height = int(total_height * self.animation_progress)
-            
-            x_pos = self.window_width - menu_width - 14
-            y_pos = self.icon_rect.bottom + 10
-            
-            surf = self._create_glass_effect(menu_width, height)
-            
+
             for i, (text, full_width) in enumerate(menu_items):
                 current_width = menu_width - 2 * horizontal_padding if full_width else button_width
                 button_x = (menu_width - current_width) // 2
                 button_y = vertical_padding + i * (button_height + button_spacing)
-                
-                abs_rect = pygame.Rect(
-                    x_pos + button_x,
-                    y_pos + button_y,
-                    current_width,
-                    button_height
-                )
-                self.menu_rects.append((abs_rect, text))
-
-                color = self.option_hover_color if abs_rect.collidepoint(mouse_pos) else self.option_color
-                option_surface = self._create_glass_option(current_width, button_height, color)
-                surf.blit(option_surface, (button_x, button_y))
-
-                txt = self.font.render(text, True, self.text_color)
-                txt_rect = txt.get_rect(center=(button_x + current_width // 2, button_y + button_height // 2))
-                surf.blit(txt, txt_rect)
+                layout.append((text, pygame.Rect(button_x, button_y, current_width, button_height)))
         else:
             menu_width = 2 * button_width + self.spacing_x + 2 * horizontal_padding
             
@@ -258,66 +153,104 @@ class ConfigMenu:
             num_regular_rows = (len(regular_items) + 1) // 2
             total_rows = num_regular_rows + len(full_width_items)
             total_height = total_rows * (button_height + button_spacing) - button_spacing + 2 * vertical_padding
-            height = int(total_height * self.animation_progress)
-            
-            x_pos = self.window_width - menu_width - 14
-            y_pos = self.icon_rect.bottom + 10
-            
-            surf = self._create_glass_effect(menu_width, height)
-            
+
             for i, (text, full_width) in enumerate(regular_items):
                 col = i % 2
                 row = i // 2
-                
                 button_x = horizontal_padding + col * (button_width + self.spacing_x)
                 button_y = vertical_padding + row * (button_height + button_spacing)
-                
-                abs_rect = pygame.Rect(
-                    x_pos + button_x,
-                    y_pos + button_y,
-                    button_width,
-                    button_height
-                )
-                self.menu_rects.append((abs_rect, text))
-
-                color = self.option_hover_color if abs_rect.collidepoint(mouse_pos) else self.option_color
-                option_surface = self._create_glass_option(button_width, button_height, color)
-                surf.blit(option_surface, (button_x, button_y))
-
-                txt = self.font.render(text, True, self.text_color)
-                txt_rect = txt.get_rect(center=(button_x + button_width // 2, button_y + button_height // 2))
-                surf.blit(txt, txt_rect)
+                layout.append((text, pygame.Rect(button_x, button_y, button_width, button_height)))
             
             current_row = num_regular_rows
             for text, full_width in full_width_items:
-                button_x = horizontal_padding
                 button_width_full = menu_width - 2 * horizontal_padding
                 button_y = vertical_padding + current_row * (button_height + button_spacing)
-                
-                abs_rect = pygame.Rect(
-                    x_pos + button_x,
-                    y_pos + button_y,
-                    button_width_full,
-                    button_height
-                )
-                self.menu_rects.append((abs_rect, text))
-
-                color = self.option_hover_color if abs_rect.collidepoint(mouse_pos) else self.option_color
-                option_surface = self._create_glass_option(button_width_full, button_height, color)
-                surf.blit(option_surface, (button_x, button_y))
-
-                txt = self.font.render(text, True, self.text_color)
-                txt_rect = txt.get_rect(center=(button_x + button_width_full // 2, button_y + button_height // 2))
-                surf.blit(txt, txt_rect)
-                
+                layout.append((text, pygame.Rect(horizontal_padding, button_y, button_width_full, button_height)))
                 current_row += 1
 
-        self.screen.blit(surf, (x_pos, y_pos))
+        return menu_width, total_height, layout
+
+    def _get_item_variants(self, text, width, height):
+        # O texto fica separado do fundo do botão: misturar os dois antes de
+        # ir para o painel mudaria o alpha das bordas das letras
+        variants = self._item_variants.get((text, width))
+        if variants is None:
+            txt = fonts.render(self.font, text, True, self.text_color)
+            txt_pos = txt.get_rect(center=(width // 2, height // 2)).topleft
+            variants = tuple(
+                (glass.get_glass_option(width, height, color, self.option_border), txt, txt_pos)
+                for color in (self.option_color, self.option_hover_color)
+            )
+            self._item_variants[(text, width)] = variants
+        return variants
+
+    def _render_menu_panel(self, menu_width, total_height, layout, hovered_text):
+        surf = glass.get_glass_panel(menu_width, total_height, self.bg_color, self.option_border).copy()
+
+        # Descarta variantes de rótulos que saíram do menu, como
+        # "Conquistas (N)" com a contagem antiga
+        in_use = set((text, rect.width) for text, rect in layout)
+        for key in list(self._item_variants):
+            if key not in in_use:
+                del self._item_variants[key]
+
+        for text, rect in layout:
+            normal, hover = self._get_item_variants(text, rect.width, rect.height)
+            option_surface, txt, txt_pos = hover if text == hovered_text else normal
+            surf.blit(option_surface, rect.topleft)
+            surf.blit(txt, (rect.x + txt_pos[0], rect.y + txt_pos[1]))
+
+        return surf
+
+    def draw_menu(self):
+        self.update_animation()
+        if self.animation_progress <= 0:
+            return
+
+        unlocked_count = len(self.achievements_menu.tracker.unlocked) if hasattr(self.achievements_menu, "tracker") else 0
+
+        menu_items = [
+            ("Configurações", False),
+            ("Controles", False),
+            (f"Conquistas ({unlocked_count})", False),
+            ("Eventos", False)
+        ]
+
+        if self.console_enabled:
+            menu_items.append(("Console", False))
+
+        menu_items.append(("Sair", not self.console_enabled))
+
+        vertical_menu = False
+        if hasattr(self.settings_menu, "get_option"):
+            vertical_menu = self.settings_menu.get_option("Menu vertical")
+
+        menu_width, total_height, layout = self._get_menu_layout(menu_items, vertical_menu)
+        x_pos = self.window_width - menu_width - 14
+        y_pos = self.icon_rect.bottom + 10
+        
+        mouse_pos = pygame.mouse.get_pos()
+        self.menu_rects = []
+        hovered_text = None
+        for text, rect in layout:
+            abs_rect = rect.move(x_pos, y_pos)
+            self.menu_rects.append((abs_rect, text))
+            if hovered_text is None and abs_rect.collidepoint(mouse_pos):
+                hovered_text = text
+
+        # O painel inteiro é desenhado uma vez por estado e a animação só
+        # revela uma parte maior dele a cada quadro
+        state = (tuple(menu_items), vertical_menu, hovered_text)
+        if state != self._menu_panel_state:
+            self._menu_panel = self._render_menu_panel(menu_width, total_height, layout, hovered_text)
+            self._menu_panel_state = state
+
+        glass.blit_reveal(self.screen, self._menu_panel, (x_pos, y_pos), self.animation_progress)
 
     def draw(self):
-        self.draw_icon()
+        icon_rect = self.draw_icon()
         self.draw_menu()
-        if self.controls_menu.visible:
+        if self.controls_menu.is_animating():
             self.controls_menu.draw()
         if self.settings_menu.visible:
             self.settings_menu.draw()
@@ -328,6 +261,7 @@ class ConfigMenu:
         if self.console_instance and self.console_instance.visible:
             self.console_instance.draw()
         self.exit_handler.draw()
+        return icon_rect
 
     def handle_event(self, event):
         if self.console_instance and self.console_instance.visible:
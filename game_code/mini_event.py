@@ -1,4 +1,5 @@
 import pygame, random, os, sys
+from game_code import assets, fonts
 
 def resource_path(relative_path):
     try:
@@ -48,13 +49,12 @@ class MiniEvent:
         self.sound_path = resource_path(os.path.join("game_assets", self.sound_name))
 
         try:
-            self.image = pygame.image.load(self.image_path).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (self.size, self.size))
+            self.image = assets.load_image(self.image_path, (self.size, self.size), smooth=False)
         except Exception:
             self.image = pygame.Surface((self.size, self.size))
             self.image.fill(self.base_color)
-            font = pygame.font.SysFont(None, 20)
-            text = font.render(self.text_label, True, (255, 255, 255))
+            font = fonts.get_font(None, 20)
+            text = fonts.render(font, self.text_label, True, (255, 255, 255))
             text_rect = text.get_rect(center=(self.size//2, self.size//2))
             self.image.blit(text, text_rect)
 
@@ -72,7 +72,7 @@ class MiniEvent:
         self.y = random.randint(0, self.height - self.size)
         self.spawn_time = pygame.time.get_ticks()
         self.visible = True
-        self.font = pygame.font.SysFont(None, 24)
+        self.font = fonts.get_font(None, 24)
         self.rect = pygame.Rect(self.x, self.y, self.size, self.size)
         self.pos = (self.x, self.y)
 
@@ -130,7 +130,7 @@ class MiniEvent:
         if not self.visible:
             return
 
-        self.screen.blit(self.image, (self.x, self.y))
+        image_rect = self.screen.blit(self.image, (self.x, self.y))
 
         elapsed_time = pygame.time.get_ticks() - self.spawn_time
         time_left = max(0, self.time_to_live - elapsed_time) // 1000
@@ -138,17 +138,19 @@ class MiniEvent:
         text_color = (255, 255, 255) if self.event_type == "rare" else (0, 0, 0)
 
         if self.event_type == "rare":
-            progress_text = self.font.render(f"{self.clicks_done}/{self.clicks_needed}", True, text_color)
-            time_text = self.font.render(f"{time_left}s", True, text_color)
+            progress_text = fonts.render(self.font, f"{self.clicks_done}/{self.clicks_needed}", True, text_color)
+            time_text = fonts.render(self.font, f"{time_left}s", True, text_color)
             progress_rect = progress_text.get_rect(center=(self.x + self.size//2, self.y + self.size//2 - 8))
             time_rect = time_text.get_rect(center=(self.x + self.size//2, self.y + self.size//2 + 8))
             self.screen.blit(progress_text, progress_rect)
             self.screen.blit(time_text, time_rect)
         else:
-            time_text = self.font.render(f"{time_left}s", True, text_color)
+            time_text = fonts.render(self.font, f"{time_left}s", True, text_color)
             time_rect = time_text.get_rect(center=(self.x + self.size//2, self.y + self.size//2))
             self.screen.blit(time_text, time_rect)
 
+        return image_rect.union(time_rect)
+
     def handle_click(self, pos, score, upgrade_menu):
         if not self.visible:
             return score, False, 0
@@ -1,4 +1,6 @@
 import pygame, os, json, importlib.util, inspect, sys
+from game_code import glass
+from game_code import assets, fonts
 
 def resource_path(relative_path):
     try:
@@ -84,78 +86,14 @@ def group_mods_by_class(mod_files, mods_folder):
             mod_groups["Outros"].append(mod_file)
     return mod_groups
 
-def _draw_rounded_rect_aa(surface, color, rect, radius):
-    temp_surface = pygame.Surface((rect[2] + 4, rect[3] + 4), pygame.SRCALPHA)
-    temp_surface.fill((0, 0, 0, 0))
-    temp_rect = pygame.Rect(2, 2, rect[2], rect[3])
-    pygame.draw.rect(temp_surface, color, temp_rect, border_radius=radius)
-    surface.blit(temp_surface, (rect[0] - 2, rect[1] - 2))
-
 def _create_glass_effect(width, height, bg_color=(180, 210, 255, 180), border_color=(120, 150, 220, 160)):
-    glass_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    glass_surface.fill((0, 0, 0, 0))
-    _draw_rounded_rect_aa(glass_surface, bg_color, (0, 0, width, height), 20)
-    highlight = pygame.Surface((width, height), pygame.SRCALPHA)
-    highlight.fill((0, 0, 0, 0))
-    for i in range(height):
-        alpha = int(50 * (1 - i / height * 0.6))
-        pygame.draw.line(highlight, (255, 255, 255, alpha), (0, i), (width, i))
-    mask = pygame.Surface((width, height), pygame.SRCALPHA)
-    mask.fill((0, 0, 0, 0))
-    _draw_rounded_rect_aa(mask, (255, 255, 255, 255), (0, 0, width, height), 20)
-    highlight.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-    glass_surface.blit(highlight, (0, 0))
-    border_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    border_surface.fill((0, 0, 0, 0))
-    _draw_rounded_rect_aa(border_surface, (0, 0, 0, 0), (0, 0, width, height), 20)
-    pygame.draw.rect(border_surface, border_color, (0, 0, width, height), 
-                    width=2, border_radius=20)
-    glass_surface.blit(border_surface, (0, 0))
-    return glass_surface
+    return glass.get_glass_surface(width, height, bg_color, border_color, 20, 2, 50, 0.6)
 
 def _create_glass_button(width, height, color, border_color=(150, 180, 230, 160)):
-    button_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    button_surface.fill((0, 0, 0, 0))
-    _draw_rounded_rect_aa(button_surface, color, (0, 0, width, height), 14)
-    highlight = pygame.Surface((width, height), pygame.SRCALPHA)
-    highlight.fill((0, 0, 0, 0))
-    for i in range(height):
-        alpha = int(40 * (1 - i / height * 0.7))
-        pygame.draw.line(highlight, (255, 255, 255, alpha), (0, i), (width, i))
-    mask = pygame.Surface((width, height), pygame.SRCALPHA)
-    mask.fill((0, 0, 0, 0))
-    _draw_rounded_rect_aa(mask, (255, 255, 255, 255), (0, 0, width, height), 14)
-    highlight.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-    button_surface.blit(highlight, (0, 0))
-    border_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    border_surface.fill((0, 0, 0, 0))
-    _draw_rounded_rect_aa(border_surface, (0, 0, 0, 0), (0, 0, width, height), 14)
-    pygame.draw.rect(border_surface, border_color, (0, 0, width, height), 
-                    width=1, border_radius=14)
-    button_surface.blit(border_surface, (0, 0))
-    return button_surface
+    return glass.get_glass_surface(width, height, color, border_color, 14, 1, 40, 0.7)
 
 def _create_glass_title(width, height, color=(120, 160, 255, 200), border_color=(100, 140, 220, 180)):
-    title_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    title_surface.fill((0, 0, 0, 0))
-    _draw_rounded_rect_aa(title_surface, color, (0, 0, width, height), 16)
-    highlight = pygame.Surface((width, height), pygame.SRCALPHA)
-    highlight.fill((0, 0, 0, 0))
-    for i in range(height):
-        alpha = int(60 * (1 - i / height * 0.5))
-        pygame.draw.line(highlight, (255, 255, 255, alpha), (0, i), (width, i))
-    mask = pygame.Surface((width, height), pygame.SRCALPHA)
-    mask.fill((0, 0, 0, 0))
-    _draw_rounded_rect_aa(mask, (255, 255, 255, 255), (0, 0, width, height), 16)
-    highlight.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-    title_surface.blit(highlight, (0, 0))
-    border_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    border_surface.fill((0, 0, 0, 0))
-    _draw_rounded_rect_aa(border_surface, (0, 0, 0, 0), (0, 0, width, height), 16)
-    pygame.draw.rect(border_surface, border_color, (0, 0, width, height), 
-                    width=2, border_radius=16)
-    title_surface.blit(border_surface, (0, 0))
-    return title_surface
+    return glass.get_glass_surface(width, height, color, border_color, 16, 2, 60, 0.5)
 
 def _create_rounded_button_with_image(image, radius=20):
     width, height = image.get_size()
@@ -189,13 +127,13 @@ def choose_mod(mod_groups, current_setting):
     padding_x = 20
     padding_y = 20
     spacing_y = 10
-    title_font = pygame.font.SysFont(None, 56)
-    font = pygame.font.SysFont(None, 36)
-    small_font = pygame.font.SysFont(None, 26)
+    title_font = fonts.get_font(None, 56)
+    font = fonts.get_font(None, 36)
+    small_font = fonts.get_font(None, 26)
 
     try:
         start_image_path = resource_path("game_assets/start.png")
-        start_image = pygame.image.load(start_image_path).convert_alpha()
+        start_image = assets.load_image(start_image_path)
         original_width, original_height = start_image.get_size()
         button_width = original_width
         button_height = original_height
@@ -226,8 +164,8 @@ def choose_mod(mod_groups, current_setting):
 
     while running:
         screen.fill(bg_main)
-        main_surface = _create_glass_effect(main_box_width, main_box_height, blue_glass_bg, blue_glass_border)
-        title_surf = title_font.render("Seleção de Mods", True, text_color)
+        main_surface = _create_glass_effect(main_box_width, main_box_height, blue_glass_bg, blue_glass_border).copy()
+        title_surf = fonts.render(title_font, "Seleção de Mods", True, text_color)
         title_rect = title_surf.get_rect(center=(main_box_width // 2, 50))
         main_surface.blit(title_surf, title_rect)
         mouse_pos = pygame.mouse.get_pos()
@@ -237,13 +175,13 @@ def choose_mod(mod_groups, current_setting):
         left_title_y = 100
         left_title_surface = _create_glass_title(col_width, option_height, title_color, title_border_color)
         main_surface.blit(left_title_surface, (left_col_x, left_title_y))
-        left_title = font.render("Mods Desativados", True, text_color)
+        left_title = fonts.render(font, "Mods Desativados", True, text_color)
         left_title_pos = left_title.get_rect(center=(left_col_x + col_width // 2, left_title_y + option_height // 2))
         main_surface.blit(left_title, left_title_pos)
         right_col_x = left_col_x + col_width + padding_x
         right_title_surface = _create_glass_title(col_width, option_height, title_color, title_border_color)
         main_surface.blit(right_title_surface, (right_col_x, left_title_y))
-        right_title = font.render("Mods Ativos", True, text_color)
+        right_title = fonts.render(font, "Mods Ativos", True, text_color)
         right_title_pos = right_title.get_rect(center=(right_col_x + col_width // 2, left_title_y + option_height // 2))
         main_surface.blit(right_title, right_title_pos)
         content_start_y = left_title_y + option_height + spacing_y
@@ -263,7 +201,7 @@ def choose_mod(mod_groups, current_setting):
             color = button_disabled_hover if is_hovered else button_disabled_color
             button_surface = _create_glass_button(mod_rect_rel.width, mod_rect_rel.height, color, blue_glass_border)
             main_surface.blit(button_surface, (mod_rect_rel.x, mod_rect_rel.y))
-            mod_text = small_font.render(mod_file, True, text_color)
+            mod_text = fonts.render(small_font, mod_file, True, text_color)
             mod_text_rect = mod_text.get_rect(midleft=(mod_rect_rel.x + 15, mod_rect_rel.centery))
             main_surface.blit(mod_text, mod_text_rect)
             current_y += option_height + spacing_y
@@ -278,7 +216,7 @@ def choose_mod(mod_groups, current_setting):
             color = button_enabled_hover if is_hovered else button_enabled_color
             button_surface = _create_glass_button(mod_rect_rel.width, mod_rect_rel.height, color, blue_glass_border)
             main_surface.blit(button_surface, (mod_rect_rel.x, mod_rect_rel.y))
-            mod_text = small_font.render(mod_file, True, text_color)
+            mod_text = fonts.render(small_font, mod_file, True, text_color)
             mod_text_rect = mod_text.get_rect(midleft=(mod_rect_rel.x + 15, mod_rect_rel.centery))
             main_surface.blit(mod_text, mod_text_rect)
             current_y_right += option_height + spacing_y
@@ -288,7 +226,7 @@ def choose_mod(mod_groups, current_setting):
         visible_height = content_height - 20
         max_scroll = max(0, max_content_height - visible_height)
         counter_text = f"Mods ativados: {len(enabled_mods)}"
-        counter_surf = small_font.render(counter_text, True, (80, 120, 80))
+        counter_surf = fonts.render(small_font, counter_text, True, (80, 120, 80))
         counter_rect = counter_surf.get_rect(center=(main_box_width // 2, main_box_height - 110))
         main_surface.blit(counter_surf, counter_rect)
 
@@ -315,7 +253,7 @@ def choose_mod(mod_groups, current_setting):
             concluido_color = (150, 200, 255, 220) if not is_concluido_hovered else (120, 180, 240, 240)
             concluido_surface = _create_glass_button(button_width, button_height, concluido_color, blue_glass_border)
             main_surface.blit(concluido_surface, (button_x, button_y))
-            concluido_text = font.render("Concluído", True, text_color)
+            concluido_text = fonts.render(font, "Concluído", True, text_color)
             concluido_text_rect = concluido_text.get_rect(center=(button_x + button_width // 2, button_y + button_height // 2))
             main_surface.blit(concluido_text, concluido_text_rect)
 
@@ -0,0 +1,84 @@
+import math
+
+# Abreviações em potências de mil; acima de T vai para notação científica
+SUFFIXES = ((15, None), (12, "T"), (9, "B"), (6, "M"), (3, "K"))
+
+LOG10_2 = math.log10(2)
+
+_memo = {}
+_MEMO_LIMIT = 4096
+
+def _magnitude(n):
+    # Expoente e e potência p com p <= n < 10 * p, sem converter o número
+    # inteiro para string (que fica lento e tem limite de dígitos em ints
+    # de centenas de casas)
+    e = int((n.bit_length() - 1) * LOG10_2)
+    p = 10 ** e
+    while p * 10 <= n:
+        p *= 10
+        e += 1
+    while p > n:
+        p //= 10
+        e -= 1
+    return e, p
+
+def _mantissa(n, p, decimals=2):
+    # Parte inteira e casas decimais truncadas (sem arredondar para cima,
+    # senão 999.999 viraria "1000K")
+    scaled = str(n * 10 ** decimals // p)
+    integer, fraction = scaled[:-decimals], scaled[-decimals:].rstrip("0")
+    return f"{integer},{fraction}" if fraction else integer
+
+def with_separators(n):
+    return f"{n:,}".replace(",", ".")
+
+def scientific(n):
+    if n == 0:
+        return "0"
+    e, p = _magnitude(n)
+    return f"{_mantissa(n, p)}e{e}"
+
+def short(n):
+    if n < 1000:
+        return str(n)
+    e, p = _magnitude(n)
+    for exponent, suffix in SUFFIXES:
+        if e >= exponent:
+            if suffix is None:
+                return f"{_mantissa(n, p)}e{e}"
+            return _mantissa(n, 10 ** exponent) + suffix
+    return str(n)
+
+def _format(n, style, max_length):
+    if style == "separators":
+        return with_separators(n)
+    if style == "short":
+        return short(n)
+    if style == "scientific":
+        return scientific(n)
+    # auto: separadores enquanto couberem em max_length, depois K/M/B/T e
+    # por fim notação científica
+    if n.bit_length() <= 4 * max_length:
+        text = with_separators(n)
+        if len(text) <= max_length:
+            return text
+    return short(n)
+
+def format_number(value, style="auto", max_length=19):
+    # style: 'separators' (1.234.567), 'short' (1,23M), 'scientific'
+    # (1,23e300) ou 'auto'. O resultado fica em memória por (valor, estilo)
+    value = int(value)
+    key = (value, style, max_length)
+    text = _memo.get(key)
+    if text is None:
+        if value < 0:
+            text = "-" + _format(-value, style, max_length)
+        else:
+            text = _format(value, style, max_length)
+        if len(_memo) >= _MEMO_LIMIT:
+            _memo.clear()
+        _memo[key] = text
+    return text
+
+def clear_memo():
+    _memo.clear()
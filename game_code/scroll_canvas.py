@@ -0,0 +1,38 @@
+import pygame
+
+class ScrollCanvas:
+    # Conteúdo de um menu de tela cheia desenhado uma vez numa superfície
+    # alta fora da tela. Rolar é só copiar outro trecho dela; o conteúdo só
+    # é redesenhado quando a chave (dados + hover) muda
+    def __init__(self, bg_color):
+        self.bg_color = bg_color
+        self.surface = None
+        self.key = None
+        self.renders = 0
+
+    def invalidate(self):
+        self.key = None
+
+    def update(self, target, size, key, render):
+        size = (int(size[0]), int(size[1]))
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = pygame.Surface(size, 0, target)
+            # Pixels com a cor de fundo ficam transparentes, então o que foi
+            # desenhado antes na tela (título, etc.) continua aparecendo
+            self.surface.set_colorkey(self.bg_color)
+            self.key = None
+
+        if key == self.key:
+            return False
+        self.surface.fill(self.bg_color)
+        render(self.surface)
+        self.key = key
+        self.renders += 1
+        return True
+
+    def blit(self, target, scroll_y=0, dest=(0, 0)):
+        if self.surface is None:
+            return None
+        width, height = target.get_size()
+        view = pygame.Rect(0, int(scroll_y), width - dest[0], height - dest[1])
+        return target.blit(self.surface, dest, view)
@@ -1,4 +1,23 @@
-import pygame, random, os, math
+import pygame, random, os, numpy as np
+from game_code import assets
+from game_code.click_effect import ParticleSystem
+
+POPUP_DURATION = 1000
+POPUP_STEP = 16
+# Alpha dos popups de pontos por quadro de vida: opaco até faltar meio
+# segundo, depois some aos poucos
+POPUP_FADE = tuple(min(255, int(255 * (time_left / 500)))
+                   for time_left in range(POPUP_DURATION, 0, -POPUP_STEP))
+
+# Camada única com os popups "+N" de todos os trabalhadores: o custo de
+# atualizar e desenhar não cresce com o número de trabalhadores
+popup_layer = ParticleSystem(font_size=24, color=(0, 0, 0), dy=-0.5, fade=POPUP_FADE)
+
+BAR_COLOR = (255, 255, 0)
+# Acima disso os ícones cobririam a tela inteira e cada um custa um blit
+# com alpha; os demais trabalhadores continuam produzindo e pegando mini
+# eventos normalmente
+MAX_DRAWN_WORKERS = 300
 
 class Trabalhador:
     def __init__(self, screen, width, height, pontos_gerados=0, pontos_total=None):
@@ -18,10 +37,6 @@ class Trabalhador:
         self.active = True
         self.visible = True
         
-        self.popups = []
-        self.popup_duration = 1000
-        self.popup_font = pygame.font.Font(None, 24)
-        
         self.pontos_por_segundo = self.pontos_total / 30
 
     @property
@@ -53,100 +68,19 @@ class Trabalhador:
             assets_dir = os.path.join(parent_dir, "game_assets")
             icon_path = os.path.join(assets_dir, "trabalhador.png")
             if os.path.exists(icon_path):
-                original_icon = pygame.image.load(icon_path).convert_alpha()
-                new_width = int(original_icon.get_width() * self.size_factor)
-                new_height = int(original_icon.get_height() * self.size_factor)
-                return pygame.transform.smoothscale(original_icon, (new_width, new_height))
+                return assets.load_image(icon_path, scale=self.size_factor)
         except Exception as e:
             pass
+        return assets.get_surface("trabalhador_fallback", self._draw_fallback_icon)
+
+    @staticmethod
+    def _draw_fallback_icon():
         size = 30
         surface = pygame.Surface((size, size), pygame.SRCALPHA)
         pygame.draw.circle(surface, (0, 150, 0), (size//2, size//2), size//2)
         pygame.draw.circle(surface, (0, 200, 0), (size//2, size//2), size//2-3)
         return surface
 
-    def _add_popup(self, pontos):
-        popup_text = f"+{int(pontos)}"
-        popup_x = self.pos[0] + self.icon.get_width() // 2
-        popup_y = self.pos[1] - 20
-        self.popups.append([popup_text, [popup_x, popup_y], self.popup_duration])
-
-    def _update_popups(self, current_time):
-        for popup in self.popups[:]:
-            popup[2] -= 16
-            if popup[2] <= 0:
-                self.popups.remove(popup)
-            else:
-                popup[1][1] -= 0.5
-
-    def _draw_popups(self):
-        for popup_text, pos, time_left in self.popups:
-            alpha = min(255, int(255 * (time_left / 500)))
-            text_surface = self.popup_font.render(popup_text, True, (0, 0, 0))
-            
-            temp_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-            temp_surface.fill((0, 0, 0, 0))
-            text_surface.set_alpha(alpha)
-            temp_surface.blit(text_surface, (0, 0))
-            
-            text_rect = temp_surface.get_rect(center=pos)
-            self.screen.blit(temp_surface, text_rect)
-
-    def update(self, current_time):
-        if not self.active:
-            return None
-
-        self._update_popups(current_time)
-
-        if current_time - self.creation_time >= self.lifetime:
-            self.active = False
-            self.visible = False
-            pontos_restantes = self.pontos_total - self.pontos_gerados
-            if pontos_restantes > 0:
-                self.pontos_gerados = self.pontos_total
-                return pontos_restantes
-            return 0
-
-        if self.icon:
-            self.pos[0] += self.speed[0]
-            self.pos[1] += self.speed[1]
-            if self.pos[0] <= 0 or self.pos[0] >= self.window_width - self.icon.get_width():
-                self.speed[0] = -self.speed[0]
-            if self.pos[1] <= 0 or self.pos[1] >= self.window_height - self.icon.get_height():
-                self.speed[1] = -self.speed[1]
-
-        pontos_gerados_now = 0
-        if current_time - self.last_geracao_time >= self.intervalo_geracao:
-            segundos_passados = (current_time - self.last_geracao_time) // 1000
-            if segundos_passados > 0:
-                pontos_a_gerar = min(
-                    self.pontos_por_segundo * segundos_passados, 
-                    self.pontos_total - self.pontos_gerados
-                )
-                
-                if pontos_a_gerar > 0:
-                    pontos_gerados_now = math.ceil(pontos_a_gerar)
-                    self.pontos_gerados += pontos_gerados_now
-                    self.last_geracao_time = current_time
-                    
-                    if pontos_gerados_now > 0:
-                        self._add_popup(pontos_gerados_now)
-
-        return pontos_gerados_now if pontos_gerados_now > 0 else 0
-
-    def draw(self):
-        if not self.visible or not self.icon:
-            return
-
-        self.screen.blit(self.icon, (self.pos[0], self.pos[1]))
-
-        bar_width = self.icon.get_width()
-        tempo_decorrido = pygame.time.get_ticks() - self.creation_time
-        tempo_progresso = max(0.0, 1.0 - (tempo_decorrido / self.lifetime))
-        pygame.draw.rect(self.screen, (255, 255, 0), (self.pos[0], self.pos[1]-5, bar_width * tempo_progresso, 3))
-        
-        self._draw_popups()
-
     @classmethod
     def from_state(cls, screen, width, height, state):
         trabalhador = cls(
@@ -161,4 +95,156 @@ class Trabalhador:
         trabalhador.creation_time = state.get('creation_time', pygame.time.get_ticks())
         trabalhador.lifetime = state.get('lifetime', 30000)
         trabalhador.pontos_por_segundo = trabalhador.pontos_total / 30
-        return trabalhador
\ No newline at end of file
+        return trabalhador
+
+class WorkerSwarm:
+    # Todos os trabalhadores em arrays NumPy (posição, velocidade, tempos,
+    # pontos gerados e total). Movimento, rebatida nas bordas, produção e
+    # fim da vida são um passo vetorizado por quadro, e os que expiram saem
+    # de uma vez, mantendo os vivos contíguos no início dos arrays.
+    # Para o resto do jogo se comporta como a lista de Trabalhador de antes
+    # (len, append, clear)
+    FIELDS = (("x", np.int64), ("y", np.int64), ("vx", np.int64), ("vy", np.int64),
+              ("creation_time", np.int64), ("lifetime", np.int64),
+              ("last_geracao_time", np.int64), ("intervalo_geracao", np.int64),
+              ("pontos_gerados", np.int64), ("pontos_total", np.int64),
+              ("pontos_por_segundo", np.float64))
+
+    def __init__(self, screen, width, height, capacity=64, max_drawn=MAX_DRAWN_WORKERS):
+        self.screen = screen
+        self.window_width = width
+        self.window_height = height
+        self.max_drawn = max_drawn
+        self.icon = None
+        self.bars = []
+        self.count = 0
+        self.capacity = capacity
+        for name, dtype in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype))
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def _grow(self, capacity):
+        for name, dtype in self.FIELDS:
+            grown = np.zeros(capacity, dtype)
+            grown[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def append(self, trabalhador):
+        if self.icon is None:
+            self.icon = trabalhador.icon
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+        i = self.count
+        self.x[i], self.y[i] = trabalhador.pos
+        self.vx[i], self.vy[i] = trabalhador.speed
+        self.creation_time[i] = trabalhador.creation_time
+        self.lifetime[i] = trabalhador.lifetime
+        self.last_geracao_time[i] = trabalhador.last_geracao_time
+        self.intervalo_geracao[i] = trabalhador.intervalo_geracao
+        self.pontos_gerados[i] = trabalhador.pontos_gerados
+        self.pontos_total[i] = trabalhador.pontos_total
+        self.pontos_por_segundo[i] = trabalhador.pontos_por_segundo
+        self.count += 1
+
+    def clear(self):
+        self.count = 0
+
+    def count_colliding(self, rect):
+        # Quantos trabalhadores encostam em rect (regra do Rect.colliderect).
+        # Contam todos, inclusive os que passam de max_drawn e não são
+        # desenhados: o limite é só do desenho, não muda o jogo
+        n = self.count
+        if not n or self.icon is None:
+            return 0
+        rect = pygame.Rect(rect)
+        width, height = self.icon.get_size()
+        x, y = self.x[:n], self.y[:n]
+        return int(np.count_nonzero((x < rect.right) & (x + width > rect.x) &
+                                    (y < rect.bottom) & (y + height > rect.y)))
+
+    def update(self, current_time):
+        # Devolve (pontos gerados no quadro, quantos trabalhadores saíram)
+        n = self.count
+        if not n:
+            return 0, 0
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        gerados, total = self.pontos_gerados[:n], self.pontos_total[:n]
+        last = self.last_geracao_time[:n]
+
+        # No fim da vida o trabalhador entrega o que faltava gerar e sai
+        expired = current_time - self.creation_time[:n] >= self.lifetime[:n]
+        restantes = np.where(expired, total - gerados, 0)
+        pontos = int(restantes[restantes > 0].sum())
+        alive = ~expired
+
+        width, height = self.icon.get_size()
+        x[alive] += vx[alive]
+        y[alive] += vy[alive]
+        bounce_x = alive & ((x <= 0) | (x >= self.window_width - width))
+        bounce_y = alive & ((y <= 0) | (y >= self.window_height - height))
+        vx[bounce_x] = -vx[bounce_x]
+        vy[bounce_y] = -vy[bounce_y]
+
+        elapsed = current_time - last
+        due = alive & (elapsed >= self.intervalo_geracao[:n]) & (elapsed >= 1000)
+        if due.any():
+            segundos = elapsed[due] // 1000
+            a_gerar = np.minimum(self.pontos_por_segundo[:n][due] * segundos, total[due] - gerados[due])
+            producing = np.flatnonzero(due)[a_gerar > 0]
+            agora = np.ceil(a_gerar[a_gerar > 0]).astype(np.int64)
+            if len(producing):
+                gerados[producing] += agora
+                last[producing] = current_time
+                pontos += int(agora.sum())
+                popup_layer.spawn_many((x[producing] + width // 2).tolist(),
+                                       (y[producing] - 20).tolist(),
+                                       [f"+{value}" for value in agora.tolist()])
+
+        removed = n - int(alive.sum())
+        if removed:
+            keep = np.flatnonzero(alive)
+            for name, _ in self.FIELDS:
+                array = getattr(self, name)
+                array[:len(keep)] = array[keep]
+            self.count = len(keep)
+        return pontos, removed
+
+    def _get_bar(self, width):
+        while len(self.bars) <= width:
+            bar = pygame.Surface((max(1, len(self.bars)), 3))
+            bar.fill(BAR_COLOR)
+            self.bars.append(bar)
+        return self.bars[width]
+
+    def draw(self):
+        n = min(self.count, self.max_drawn)
+        if not n or self.icon is None:
+            return []
+        width, height = self.icon.get_size()
+        x, y = self.x[:n], self.y[:n]
+
+        # Barra de tempo restante: largura truncada como no pygame.draw.rect
+        elapsed = pygame.time.get_ticks() - self.creation_time[:n]
+        progresso = np.maximum(0.0, 1.0 - elapsed / self.lifetime[:n])
+        bar_widths = (width * progresso).astype(np.int64)
+        self._get_bar(width)
+
+        sequence = []
+        bars = self.bars
+        icon = self.icon
+        for px, py, bar_width in zip(x.tolist(), y.tolist(), bar_widths.tolist()):
+            sequence.append((icon, (px, py)))
+            if bar_width > 0:
+                sequence.append((bars[bar_width], (px, py - 5)))
+        self.screen.blits(sequence, False)
+
+        rects = [pygame.Rect(px, py - 5, width, height + 5) for px, py in zip(x.tolist(), y.tolist())]
+        if len(rects) > 64:
+            rects = [rects[0].unionall(rects[1:])]
+        return rects
@@ -1,5 +1,10 @@
 import pygame, random, os, sys
-from game_code.trabalhador import Trabalhador
+from game_code.trabalhador import Trabalhador, WorkerSwarm, popup_layer
+from game_code import glass
+from game_code import assets, fonts, number_format
+
+# Upgrades comprados uma única vez; somem do menu depois da compra
+ONE_TIME_UPGRADES = ("hold_click", "mini_event", "auto_compra_trabalhador", "ganhos_offline")
 
 class Upgrade:
     def __init__(self, id, name, cost, bonus, price_increase=0, bonus_increment=0):
@@ -12,6 +17,41 @@ class Upgrade:
         self.amount = 0
         self.price_increase = price_increase
 
+class UpgradeLayout:
+    # Posições das opções do menu aberto. Todas as linhas têm a mesma
+    # altura, então achar a opção sob um ponto é só uma divisão
+    def __init__(self, upgrades, x, top, width, padding_x, vertical_padding, option_height, spacing):
+        self.upgrades = upgrades
+        self.x = x
+        self.top = top
+        self.width = width
+        self.padding_x = padding_x
+        self.vertical_padding = vertical_padding
+        self.option_height = option_height
+        self.spacing = spacing
+        self.option_width = width - 2 * padding_x
+        self.full_height = len(upgrades) * (option_height + spacing) - spacing + 2 * vertical_padding
+        self.menu_rect = pygame.Rect(x, top, width, self.full_height)
+
+    def option_y(self, index):
+        return self.vertical_padding + index * (self.option_height + self.spacing)
+
+    def option_rect(self, index):
+        return pygame.Rect(self.x + self.padding_x, self.top + self.option_y(index), self.option_width, self.option_height)
+
+    def option_at(self, pos, visible_height=None):
+        # visible_height limita às opções inteiras já reveladas pela animação
+        px = pos[0] - self.x - self.padding_x
+        py = pos[1] - self.top - self.vertical_padding
+        if px < 0 or px >= self.option_width or py < 0:
+            return None
+        index, offset = divmod(py, self.option_height + self.spacing)
+        if offset >= self.option_height or index >= len(self.upgrades):
+            return None
+        if visible_height is not None and self.option_y(index) + self.option_height > visible_height:
+            return None
+        return int(index)
+
 class UpgradeMenu:
     def __init__(self, screen, window_width, window_height, achievement_tracker=None):
         self.screen = screen
@@ -25,7 +65,7 @@ class UpgradeMenu:
         self.visible = False
         self.animation = 0.0
         self.speed = 0.12
-        self.font = pygame.font.SysFont("None", 26)
+        self.font = fonts.get_font("None", 26)
 
         self.bg_color = (180, 210, 255, 180)
         self.option_color = (255, 255, 255, 220)
@@ -57,12 +97,18 @@ class UpgradeMenu:
         self.icon_rect = pygame.Rect(self.x, self.y, 70, 70)
 
         self.purchased = {}
-        self.trabalhadores = []
+        self.trabalhadores = WorkerSwarm(screen, window_width, window_height)
         self.max_trabalhadores = 10
         self.trabalhador_limit_enabled = True
 
         self.purchase_quantity = 1
         self.hovered_option = None
+
+        self.retained = True
+        self._panel = None
+        self._panel_state = None
+        self._layout = None
+        self._layout_key = None
         
         self.offline_time_bank = 0
         self.max_offline_time = 7200
@@ -78,7 +124,7 @@ class UpgradeMenu:
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
     def _format_cost(self, cost):
-        return f"{cost:,}".replace(",", ".")
+        return number_format.format_number(cost, max_length=11)
 
     def _load_icon(self):
         try:
@@ -87,8 +133,7 @@ class UpgradeMenu:
             else:
                 base_path = os.path.abspath(".")
             icon_path = os.path.join(base_path, "game_assets", "upgrades.png")
-            icon = pygame.image.load(icon_path).convert_alpha()
-            return pygame.transform.smoothscale(icon, (60, 60))
+            return assets.load_image(icon_path, (60, 60))
         except Exception:
             return None
 
@@ -134,113 +179,68 @@ class UpgradeMenu:
         if self.icon:
             icon_pos = (self.icon_rect.x + (self.icon_rect.width - self.icon.get_width()) // 2,
                         self.icon_rect.y + (self.icon_rect.height - self.icon.get_height()) // 2)
-            self.screen.blit(self.icon, icon_pos)
+            return self.screen.blit(self.icon, icon_pos)
         else:
-            text = self.font.render("UPG", True, (255, 255, 255))
+            text = fonts.render(self.font, "UPG", True, (255, 255, 255))
             text_rect = text.get_rect(center=self.icon_rect.center)
-            self.screen.blit(text, text_rect)
+            return self.screen.blit(text, text_rect)
 
-    def _draw_rounded_rect_aa(self, surface, color, rect, radius):
-        temp_surface = pygame.Surface((rect[2] + 4, rect[3] + 4), pygame.SRCALPHA)
-        temp_surface.fill((0, 0, 0, 0))
-        
-        temp_rect = pygame.Rect(2, 2, rect[2], rect[3])
-        pygame.draw.rect(temp_surface, color, temp_rect, border_radius=radius)
-        
-        surface.blit(temp_surface, (rect[0] - 2, rect[1] - 2))
+    def _get_upgrades_to_show(self):
+        return [
+            upg for upg in self.upgrades
+            if not (upg.id in ONE_TIME_UPGRADES and self.purchased.get(upg.id, 0) >= 1)
+        ]
 
-    def _create_glass_effect(self, width, height):
-        glass_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        glass_surface.fill((0, 0, 0, 0))
-        
-        self._draw_rounded_rect_aa(glass_surface, self.bg_color, (0, 0, width, height), 20)
-        
-        highlight = pygame.Surface((width, height), pygame.SRCALPHA)
-        highlight.fill((0, 0, 0, 0))
-        for i in range(height):
-            alpha = int(50 * (1 - i / height * 0.6))
-            pygame.draw.line(highlight, (255, 255, 255, alpha), (0, i), (width, i))
-        
-        mask = pygame.Surface((width, height), pygame.SRCALPHA)
-        mask.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(mask, (255, 255, 255, 255), (0, 0, width, height), 20)
-        
-        highlight.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        glass_surface.blit(highlight, (0, 0))
-        
-        border_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        border_surface.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(border_surface, (0, 0, 0, 0), (0, 0, width, height), 20)
-        pygame.draw.rect(border_surface, self.option_border, (0, 0, width, height), 
-                        width=2, border_radius=20)
-        glass_surface.blit(border_surface, (0, 0))
-        
-        return glass_surface
-
-    def _create_glass_option(self, width, height, color):
-        option_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        option_surface.fill((0, 0, 0, 0))
-        
-        self._draw_rounded_rect_aa(option_surface, color, (0, 0, width, height), 14)
-        
-        highlight = pygame.Surface((width, height), pygame.SRCALPHA)
-        highlight.fill((0, 0, 0, 0))
-        for i in range(height):
-            alpha = int(40 * (1 - i / height * 0.7))
-            pygame.draw.line(highlight, (255, 255, 255, alpha), (0, i), (width, i))
-        
-        mask = pygame.Surface((width, height), pygame.SRCALPHA)
-        mask.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(mask, (255, 255, 255, 255), (0, 0, width, height), 14)
-        
-        highlight.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        option_surface.blit(highlight, (0, 0))
-        
-        border_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        border_surface.fill((0, 0, 0, 0))
-        self._draw_rounded_rect_aa(border_surface, (0, 0, 0, 0), (0, 0, width, height), 14)
-        pygame.draw.rect(border_surface, self.option_border, (0, 0, width, height), 
-                        width=1, border_radius=14)
-        option_surface.blit(border_surface, (0, 0))
-        
-        return option_surface
+    def get_layout(self):
+        # Só as compras únicas mudam quais opções aparecem; o layout é
+        # refeito quando uma delas muda, não a cada clique ou quadro
+        key = (id(self.upgrades), len(self.upgrades),
+               tuple(self.purchased.get(upg_id, 0) >= 1 for upg_id in ONE_TIME_UPGRADES))
+        if self._layout is None or self._layout_key != key:
+            self._layout = UpgradeLayout(self._get_upgrades_to_show(), self.x, self.y + 75, self.width,
+                                         self.padding_x, 12, self.option_height, self.spacing)
+            self._layout_key = key
+        return self._layout
+
+    def _get_panel_state(self, upgrades_to_show, hover_index):
+        return (
+            tuple((upg.id, upg.cost, self.purchased.get(upg.id, 0)) for upg in upgrades_to_show),
+            self.purchase_quantity,
+            hover_index,
+            len(self.trabalhadores),
+            self.trabalhador_limit_enabled,
+            self.max_trabalhadores
+        )
 
     def draw(self, score=0):
-        self.draw_icon()
+        icon_rect = self.draw_icon()
         self.animation = min(1.0, self.animation + self.speed) if self.visible else max(0.0, self.animation - self.speed)
         if self.animation <= 0: 
-            return
+            return icon_rect
 
-        mouse_pos = pygame.mouse.get_pos()
-        self.hovered_option = None
+        layout = self.get_layout()
+        upgrades_to_show = layout.upgrades
+        height = int(layout.full_height * self.animation)
 
-        upgrades_to_show = [
-            upg for upg in self.upgrades 
-            if not (
-                (upg.id == "hold_click" and self.purchased.get("hold_click", 0) >= 1) or
-                (upg.id == "mini_event" and self.purchased.get("mini_event", 0) >= 1) or
-                (upg.id == "auto_compra_trabalhador" and self.purchased.get("auto_compra_trabalhador", 0) >= 1) or
-                (upg.id == "ganhos_offline" and self.purchased.get("ganhos_offline", 0) >= 1)
-            )
-        ]
-        
-        vertical_padding = 12
-        full_h = len(upgrades_to_show) * (self.option_height + self.spacing) - self.spacing + 2 * vertical_padding
-        height = int(full_h * self.animation)
+        hover_index = layout.option_at(pygame.mouse.get_pos(), height)
+        self.hovered_option = upgrades_to_show[hover_index].id if hover_index is not None else None
 
-        panel = self._create_glass_effect(self.width, height)
+        # O painel só é refeito quando algo visível nele muda; no resto dos
+        # quadros o menu aberto custa um blit
+        state = self._get_panel_state(upgrades_to_show, hover_index)
+        if not self.retained or state != self._panel_state:
+            self._panel = self._render_panel(layout, hover_index)
+            self._panel_state = state
 
-        for i, upg in enumerate(upgrades_to_show):
-            oy = vertical_padding + i * (self.option_height + self.spacing)
-            if oy + self.option_height > height: 
-                break
-                
-            rect_width = self.width - 2 * self.padding_x
-            option_rect = pygame.Rect(self.x + self.padding_x, self.y + 75 + oy, rect_width, self.option_height)
-            
-            is_hovered = option_rect.collidepoint(mouse_pos)
-            if is_hovered:
-                self.hovered_option = upg.id
+        glass.blit_reveal(self.screen, self._panel, layout.menu_rect.topleft, self.animation)
+
+    def _render_panel(self, layout, hover_index):
+        panel = glass.get_glass_panel(self.width, layout.full_height, self.bg_color, self.option_border).copy()
+        rect_width = layout.option_width
+
+        for i, upg in enumerate(layout.upgrades):
+            oy = layout.option_y(i)
+            is_hovered = i == hover_index
 
             if upg.id == "trabalhador":
                 trabalhadores_ativos = len(self.trabalhadores)
@@ -256,26 +256,26 @@ class UpgradeMenu:
                 else:
                     base_color = self.option_hover_color if is_hovered else self.option_color
             
-            option_surface = self._create_glass_option(rect_width, self.option_height, base_color)
+            option_surface = glass.get_glass_option(rect_width, self.option_height, base_color, self.option_border)
             panel.blit(option_surface, (self.padding_x, oy))
             
             if upg.id == "trabalhador":
                 main_text = self._get_trabalhador_text(upg)
-            elif upg.id in ["hold_click", "mini_event", "auto_compra_trabalhador", "ganhos_offline"]:
+            elif upg.id in ONE_TIME_UPGRADES:
                 main_text = f"{upg.name} - {self._format_cost(upg.cost)} pts"
             else:
                 main_text = f"{upg.name} x{self.purchased.get(upg.id, 0)} - {self._format_cost(upg.cost)} pts"
                 
-            txt = self.font.render(main_text, True, self.text_color)
+            txt = fonts.render(self.font, main_text, True, self.text_color)
             text_rect = txt.get_rect(midleft=(self.padding_x + 10, oy + self.option_height // 2))
             panel.blit(txt, text_rect)
             
-            if upg.id not in ["hold_click", "mini_event", "auto_compra_trabalhador", "ganhos_offline"] and self.purchase_quantity > 1:
-                qtd_text = self.font.render(f"+{self.purchase_quantity}", True, (60, 80, 120))
+            if upg.id not in ONE_TIME_UPGRADES and self.purchase_quantity > 1:
+                qtd_text = fonts.render(self.font, f"+{self.purchase_quantity}", True, (60, 80, 120))
                 qtd_text_rect = qtd_text.get_rect(midright=(self.width - self.padding_x - 10, oy + self.option_height // 2))
                 panel.blit(qtd_text, qtd_text_rect)
 
-        self.screen.blit(panel, (self.x, self.y + 75))
+        return panel
 
     def handle_event(self, event, score):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -284,26 +284,15 @@ class UpgradeMenu:
                 return score, False
 
             if self.visible:
-                upgrades_to_show = [
-                    upg for upg in self.upgrades 
-                    if not (
-                        (upg.id == "hold_click" and self.purchased.get("hold_click", 0) >= 1) or
-                        (upg.id == "mini_event" and self.purchased.get("mini_event", 0) >= 1) or
-                        (upg.id == "auto_compra_trabalhador" and self.purchased.get("auto_compra_trabalhador", 0) >= 1) or
-                        (upg.id == "ganhos_offline" and self.purchased.get("ganhos_offline", 0) >= 1)
-                    )
-                ]
-                vertical_padding = 12
-                menu_height = len(upgrades_to_show) * (self.option_height + self.spacing) - self.spacing + 2 * vertical_padding
-                menu_rect = pygame.Rect(self.x, self.y + 75, self.width, menu_height)
-                if not menu_rect.collidepoint(event.pos):
+                layout = self.get_layout()
+                if not layout.menu_rect.collidepoint(event.pos):
                     self.visible = False
                     return score, False
 
-                for i, upg in enumerate(upgrades_to_show):
-                    upg_rect = pygame.Rect(self.x + self.padding_x, self.y + 75 + vertical_padding + i * (self.option_height + self.spacing),
-                                           self.width - 2 * self.padding_x, self.option_height)
-                    if upg_rect.collidepoint(event.pos) and score >= upg.cost:
+                index = layout.option_at(event.pos)
+                if index is not None:
+                    upg = layout.upgrades[index]
+                    if score >= upg.cost:
                         if upg.id == "trabalhador":
                             compras = min(self.purchase_quantity, self.max_trabalhadores - len(self.trabalhadores)) \
                                       if self.trabalhador_limit_enabled else self.purchase_quantity
@@ -321,7 +310,7 @@ class UpgradeMenu:
                                         self.achievement_tracker.unlock_secret("worker_army")
                                     self.achievement_tracker.check_all_upgrades_purchased(self)
                                 return score, True
-                        elif upg.id not in ["hold_click", "mini_event", "auto_compra_trabalhador", "ganhos_offline"]:
+                        elif upg.id not in ONE_TIME_UPGRADES:
                             compras = self.purchase_quantity
                             total_custo = upg.cost * compras
                             if score >= total_custo:
@@ -374,7 +363,7 @@ class UpgradeMenu:
             self.achievement_tracker.check_all_upgrades_purchased(self)
 
     def load_trabalhadores(self, trabalhadores_data):
-        self.trabalhadores = []
+        self.trabalhadores.clear()
         for trab_data in trabalhadores_data:
             novo_trab = Trabalhador.from_state(
                 screen=self.screen,
@@ -418,17 +407,8 @@ class UpgradeMenu:
         return 5000
 
     def update_trabalhadores(self, delta_time, score):
-        pontos_gerados = 0
-        trabalhadores_removidos = 0
-        
-        for trabalhador in self.trabalhadores[:]:
-            pontos = trabalhador.update(delta_time)
-            if pontos:
-                pontos_gerados += pontos
-            
-            if not trabalhador.active:
-                self.trabalhadores.remove(trabalhador)
-                trabalhadores_removidos += 1
+        popup_layer.update()
+        pontos_gerados, trabalhadores_removidos = self.trabalhadores.update(delta_time)
         
         if trabalhadores_removidos > 0 and self.purchased.get("auto_compra_trabalhador", 0) > 0:
             score = self.auto_comprar_trabalhador(score)
@@ -440,7 +420,7 @@ class UpgradeMenu:
             upg.cost = upg.base_cost
         
         self.purchased.clear()
-        self.trabalhadores = []
+        self.trabalhadores.clear()
         self.trabalhador_limit_enabled = True
         self.purchase_quantity = 1
         self.offline_time_bank = 0
@@ -474,9 +454,9 @@ class UpgradeMenu:
         return self.purchased.copy()
 
     def draw_trabalhadores(self):
-        for trabalhador in self.trabalhadores:
-            if hasattr(trabalhador, 'draw'):
-                trabalhador.draw()
+        rects = self.trabalhadores.draw()
+        rects.extend(popup_layer.draw(self.screen))
+        return rects
 
     def get_trabalhadores_ativos(self):
         return len(self.trabalhadores)